@@ -14,9 +14,64 @@ class Settings(BaseSettings):
     MYSQL_DB: str = "placement_portal"
     SECRET_KEY: str = "supersecretkey"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60*24
+    # Per-worker auth caches: verified JWT payloads (never past their exp) and student rows
+    TOKEN_CACHE_SIZE: int = 10000
+    TOKEN_CACHE_TTL: int = 300
+    STUDENT_CACHE_SIZE: int = 5000
+    STUDENT_CACHE_TTL: int = 30
+    # Password hashing runs in a process pool per worker (0 = default thread pool)
+    HASH_WORKERS: int = 2
+    HASH_MAX_CONCURRENCY: int = 4  # hashes in flight per worker; the rest queue
     MAX_FILE_SIZE_MB: int = 5
+    # Uploaded file contents are stored once per SHA-256 (utils/storage.py)
+    STORAGE_BACKEND: str = "local"  # "local", or "s3" for any S3-compatible store (needs boto3)
+    STORAGE_LOCAL_ROOT: str = "uploads"
+    STORAGE_S3_BUCKET: str = ""
+    STORAGE_S3_PREFIX: str = "blobs/"
+    STORAGE_S3_ENDPOINT_URL: str = ""  # e.g. a MinIO server; empty uses AWS. Credentials come from the usual AWS_* env vars
+    STORAGE_S3_REGION: str = ""
+    STORAGE_URL_EXPIRES: int = 300  # seconds a presigned download URL stays valid
     ALLOWED_EXTENSIONS: set = {"pdf", "docx", "doc", "jpg", "jpeg", "png"}
     GEMINI_API_KEY: str = ""
+    # Full SQLAlchemy URLs override the MYSQL_* settings (e.g. sqlite for tests).
+    # ASYNC_DATABASE_URL is derived from DATABASE_URL when left empty.
+    DATABASE_URL: str = ""
+    ASYNC_DATABASE_URL: str = ""
+
+    # Connection pool tuning (per worker process; gunicorn multiplies these)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 5
+    DB_POOL_RECYCLE: int = 1800  # seconds; keep below MySQL's wait_timeout
+    DB_POOL_TIMEOUT: int = 10  # seconds to wait for a free connection
+    # Pre-ping costs a round-trip on every checkout. With pool_recycle set,
+    # stale connections are rare and SQLAlchemy invalidates the pool on
+    # disconnect errors anyway, so it is off by default.
+    DB_POOL_PRE_PING: bool = False
+    DB_ISOLATION_LEVEL: str = ""  # e.g. "READ COMMITTED"; empty keeps the server default
+
+    # Per-request query instrumentation (X-DB-Queries / Server-Timing headers)
+    QUERY_METRICS_ENABLED: bool = True
+    N_PLUS_ONE_THRESHOLD: int = 10  # warn when one statement shape repeats more often
+
+    # Forum thread views are buffered per worker and written every N seconds
+    VIEW_COUNT_FLUSH_INTERVAL: float = 10.0
+    # /dashboard sections that are the same for every user are cached per worker
+    DASHBOARD_CACHE_TTL: int = 30
+
+    # AI study-plan generation
+    AI_BACKEND: str = "gemini"  # "gemini", or "fake" for an offline model (tests, load tests)
+    AI_FAKE_LATENCY: float = 0.0  # seconds the fake model sleeps per call
+    AI_FAKE_FAILING_MODELS: str = ""  # comma-separated model names the fake backend fails for
+    AI_HEDGE_AFTER: float = 0.0  # seconds before a second model is raced against a slow one; 0 disables hedging
+    AI_BREAKER_FAILURES: int = 3  # consecutive failures that open a model's circuit
+    AI_BREAKER_COOLDOWN: int = 60  # seconds an open circuit waits before a trial call
+    PLAN_GENERATION_WORKERS: int = 2  # background generation threads per worker process
+    PLAN_STREAM_BATCH_SIZE: int = 10  # streamed tasks inserted per commit
+    PLAN_JOB_STALE_AFTER: int = 600  # seconds before a "running" job is considered abandoned
+    # Generated plans are reused for identical (topic, duration, difficulty) requests
+    PLAN_CACHE_TTL: int = 7 * 24 * 3600  # seconds a cached plan is reused (DB tier)
+    PLAN_CACHE_MEMORY_TTL: int = 300  # per-worker tier; also bounds how long a purge takes to reach all workers
+    PLAN_CACHE_SIZE: int = 512  # entries in the per-worker tier
 
     class Config:
         env_file = str(ENV_FILE) if ENV_FILE.exists() else ".env"
@@ -1,16 +1,158 @@
-from sqlalchemy import create_engine
+import os
+import threading
+import time
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 try:
     from .config import settings
 except Exception:
     from backend_fastapi.config import settings
 
-DATABASE_URL = f"mysql+mysqlconnector://{settings.MYSQL_USER}:{settings.MYSQL_PASSWORD}@{settings.MYSQL_HOST}:{settings.MYSQL_PORT}/{settings.MYSQL_DB}"
+DATABASE_URL = settings.DATABASE_URL or f"mysql+mysqlconnector://{settings.MYSQL_USER}:{settings.MYSQL_PASSWORD}@{settings.MYSQL_HOST}:{settings.MYSQL_PORT}/{settings.MYSQL_DB}"
 
-engine = create_engine(DATABASE_URL, echo=False, pool_pre_ping=True)
+
+def _async_url(url: str) -> str:
+    """Swap the sync driver in ``url`` for its asyncio counterpart."""
+    scheme, rest = url.split("://", 1)
+    if scheme.startswith("mysql"):
+        return f"mysql+aiomysql://{rest}"
+    if scheme.startswith("sqlite"):
+        return f"sqlite+aiosqlite://{rest}"
+    return url
+
+
+ASYNC_DATABASE_URL = settings.ASYNC_DATABASE_URL or _async_url(DATABASE_URL)
+
+
+class PoolStats:
+    """Counters for one engine's connection pool in the current worker process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.timeouts = 0
+        self.overflow_checkouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record_wait(self, seconds: float):
+        with self._lock:
+            self.wait_total += seconds
+            if seconds > self.wait_max:
+                self.wait_max = seconds
+
+    def incr(self, name: str):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self, pool) -> dict:
+        with self._lock:
+            checkouts = self.checkouts
+            data = {
+                "connects": self.connects,
+                "checkouts": checkouts,
+                "checkins": self.checkins,
+                "timeouts": self.timeouts,
+                "overflow_checkouts": self.overflow_checkouts,
+                "wait_total_ms": round(self.wait_total * 1000, 3),
+                "wait_max_ms": round(self.wait_max * 1000, 3),
+                "wait_avg_ms": round(self.wait_total * 1000 / checkouts, 3) if checkouts else 0.0,
+            }
+        data["pool"] = pool.status()
+        if isinstance(pool, QueuePool):
+            data.update({
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "idle": pool.checkedin(),
+                "overflow": pool.overflow(),
+            })
+        return data
+
+
+def _timed_pool_class(base, stats: PoolStats):
+    """Return a subclass of ``base`` that records how long checkouts wait."""
+
+    class TimedPool(base):
+        def connect(self):
+            start = time.perf_counter()
+            try:
+                return super().connect()
+            except PoolTimeoutError:
+                stats.incr("timeouts")
+                raise
+            finally:
+                stats.record_wait(time.perf_counter() - start)
+
+    TimedPool.__name__ = f"Timed{base.__name__}"
+    return TimedPool
+
+
+def _attach_pool_listeners(engine, stats: PoolStats):
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_conn, conn_record):
+        stats.incr("connects")
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_conn, conn_record, conn_proxy):
+        stats.incr("checkouts")
+        pool = engine.pool
+        if isinstance(pool, QueuePool) and pool.checkedout() > pool.size():
+            stats.incr("overflow_checkouts")
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_conn, conn_record):
+        stats.incr("checkins")
+
+
+def engine_options(url: str, pool_base=QueuePool, stats: PoolStats = None) -> dict:
+    """Build create_engine keyword arguments from the DB_* settings."""
+    options = {"echo": False, "pool_pre_ping": settings.DB_POOL_PRE_PING}
+    if settings.DB_ISOLATION_LEVEL:
+        options["isolation_level"] = settings.DB_ISOLATION_LEVEL
+    if not url.startswith("sqlite"):
+        options.update({
+            "poolclass": _timed_pool_class(pool_base, stats) if stats else pool_base,
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+        })
+    return options
+
+
+pool_stats = PoolStats()
+engine = create_engine(DATABASE_URL, **engine_options(DATABASE_URL, stats=pool_stats))
+_attach_pool_listeners(engine, pool_stats)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Async engine for read-heavy public routes, so they run on the event loop
+# instead of occupying threadpool slots.
+async_pool_stats = PoolStats()
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    **engine_options(ASYNC_DATABASE_URL, AsyncAdaptedQueuePool, async_pool_stats),
+)
+_attach_pool_listeners(async_engine.sync_engine, async_pool_stats)
+AsyncSessionLocal = sessionmaker(
+    bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
 Base = declarative_base()
 
+
+def get_pool_stats() -> dict:
+    """Pool statistics for this worker process."""
+    return {
+        "pid": os.getpid(),
+        "sync": pool_stats.snapshot(engine.pool),
+        "async": async_pool_stats.snapshot(async_engine.sync_engine.pool),
+    }
+
 # Dependency
 def get_db():
     db = SessionLocal()
@@ -18,3 +160,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
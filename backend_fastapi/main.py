@@ -6,15 +6,27 @@ import logging
 # imported as a package and when executed in environments that don't set
 # the package context (e.g. some hosting platforms invoking the module).
 try:
-	from .database import engine, Base
-	from .routers import auth, companies, experiences, admin, students, content, analytics, drives, questions, discussion, planner, bookmarks
+	from .config import settings
+	from .database import engine, get_pool_stats
+	from .routers import auth, companies, experiences, admin, students, content, analytics, drives, questions, discussion, planner, bookmarks, dashboard
 	# Import models to ensure they are registered
 	from . import models  # ensures models are imported
+	from .utils.query_metrics import install_query_metrics
+	from .migrate import check_schema_version
+	from .utils.view_counter import view_counter
+	from .utils import plan_jobs
+	from .utils.hashing import get_hashing_stats, shutdown_pool as shutdown_hashing_pool
 except Exception:
-	from backend_fastapi.database import engine, Base
-	from backend_fastapi.routers import auth, companies, experiences, admin, students, content, analytics, drives, questions, discussion, planner, bookmarks
+	from backend_fastapi.config import settings
+	from backend_fastapi.database import engine, get_pool_stats
+	from backend_fastapi.routers import auth, companies, experiences, admin, students, content, analytics, drives, questions, discussion, planner, bookmarks, dashboard
 	# Import models to ensure they are registered
 	import backend_fastapi.models as models
+	from backend_fastapi.utils.query_metrics import install_query_metrics
+	from backend_fastapi.migrate import check_schema_version
+	from backend_fastapi.utils.view_counter import view_counter
+	from backend_fastapi.utils import plan_jobs
+	from backend_fastapi.utils.hashing import get_hashing_stats, shutdown_pool as shutdown_hashing_pool
 
 app = FastAPI(title="Placement Portal API")
 
@@ -24,19 +36,34 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-DB-Queries", "Server-Timing"],
 )
 
+if settings.QUERY_METRICS_ENABLED:
+	install_query_metrics(app)
+
 logger = logging.getLogger(__name__)
 
 @app.on_event("startup")
 async def startup_event():
-	"""Create database tables on startup (use Alembic for production)"""
+	"""Check the schema revision; migrations themselves run out of band (backend_fastapi.migrate)."""
+	try:
+		if not check_schema_version(engine):
+			logger.warning("Application will continue, but database operations may fail")
+	except Exception as e:
+		logger.error(f"Failed to check database schema version: {e}")
+	view_counter.start(settings.VIEW_COUNT_FLUSH_INTERVAL)
 	try:
-		Base.metadata.create_all(bind=engine)
-		logger.info("Database tables created successfully")
+		plan_jobs.resume_jobs()
 	except Exception as e:
-		logger.error(f"Failed to create database tables: {e}")
-		logger.warning("Application will continue, but database operations may fail")
+		logger.error(f"Failed to resume plan generation jobs: {e}")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+	"""Write buffered view counts and stop background workers before the process exits."""
+	await view_counter.stop()
+	plan_jobs.shutdown()
+	shutdown_hashing_pool()
 
 app.include_router(auth.router)
 app.include_router(companies.router)
@@ -50,6 +77,7 @@ app.include_router(questions.router)
 app.include_router(discussion.router)
 app.include_router(planner.router)
 app.include_router(bookmarks.router)
+app.include_router(dashboard.router)
 
 @app.get("/")
 def read_root():
@@ -59,3 +87,15 @@ def read_root():
 @app.get("/health")
 def health_check():
 	return {"status": "ok"}
+
+
+@app.get("/health/db-pool")
+def db_pool_stats():
+	"""Connection pool counters for the worker process that served this request."""
+	return get_pool_stats()
+
+
+@app.get("/health/hashing")
+def hashing_stats():
+	"""Password-hashing pool queue counters for the worker process that served this request."""
+	return get_hashing_stats()
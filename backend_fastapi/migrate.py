@@ -0,0 +1,61 @@
+"""Schema migrations, run once per deploy instead of from every worker.
+
+Usage (from the project root)::
+
+    python -m backend_fastapi.migrate            # upgrade to the latest revision
+    python -m backend_fastapi.migrate 0002       # upgrade to a specific revision
+"""
+import logging
+import sys
+from pathlib import Path
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+logger = logging.getLogger(__name__)
+
+ALEMBIC_INI = Path(__file__).parent / "alembic.ini"
+
+
+def get_alembic_config() -> Config:
+    return Config(str(ALEMBIC_INI))
+
+
+def head_revision() -> str:
+    """Latest revision known to the code (read from the migration scripts, no DB access)."""
+    return ScriptDirectory.from_config(get_alembic_config()).get_current_head()
+
+
+def current_revision(engine):
+    """Revision recorded in the database, or None if migrations never ran."""
+    try:
+        with engine.connect() as conn:
+            return conn.execute(text("SELECT version_num FROM alembic_version")).scalar()
+    except SQLAlchemyError:
+        return None
+
+
+def check_schema_version(engine) -> bool:
+    """Compare the database revision with the code's head using a single query."""
+    head = head_revision()
+    current = current_revision(engine)
+    if current == head:
+        logger.info("Database schema is up to date (revision %s)", head)
+        return True
+    logger.error(
+        "Database schema is at revision %s but the code expects %s. "
+        "Run `python -m backend_fastapi.migrate` before starting the workers.",
+        current, head,
+    )
+    return False
+
+
+def upgrade(revision: str = "head"):
+    command.upgrade(get_alembic_config(), revision)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    upgrade(sys.argv[1] if len(sys.argv) > 1 else "head")
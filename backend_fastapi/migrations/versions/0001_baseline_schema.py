@@ -0,0 +1,249 @@
+"""Baseline schema previously created by Base.metadata.create_all
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _create_table(name, *columns):
+    """Create ``name`` unless it already exists (databases built by create_all)."""
+    if sa.inspect(op.get_bind()).has_table(name):
+        return
+    op.create_table(name, *columns)
+    op.create_index(f"ix_{name}_id", name, ["id"])
+
+
+def upgrade():
+    _create_table(
+        "file_storage",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("filename", sa.String(255), nullable=False),
+        sa.Column("original_filename", sa.String(255), nullable=False),
+        sa.Column("file_path", sa.String(500), nullable=False),
+        sa.Column("file_type", sa.String(50), nullable=False),
+        sa.Column("file_size", sa.Integer(), nullable=False),
+        sa.Column("mime_type", sa.String(100), nullable=False),
+        sa.Column("entity_type", sa.String(50), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    )
+    _create_table(
+        "admins",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("username", sa.String(255), nullable=False, unique=True),
+        sa.Column("password_hash", sa.String(255), nullable=False),
+    )
+    if not sa.inspect(op.get_bind()).has_table("students"):
+        _create_table(
+            "students",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("name", sa.String(100), nullable=False),
+            sa.Column("email", sa.String(120), nullable=False),
+            sa.Column("department", sa.String(50), nullable=True),
+            sa.Column("batch", sa.Integer(), nullable=True),
+            sa.Column("password_hash", sa.String(255), nullable=False),
+            sa.Column("current_streak", sa.Integer(), nullable=True),
+            sa.Column("last_active_date", sa.DateTime(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        )
+        op.create_index("ix_students_email", "students", ["email"], unique=True)
+    _create_table(
+        "companies",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(255), nullable=False, unique=True),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("website", sa.String(255), nullable=True),
+        sa.Column("sector", sa.String(100), nullable=True),
+        sa.Column("logo_file_id", sa.Integer(), sa.ForeignKey("file_storage.id"), nullable=True),
+        sa.Column("profile_doc_id", sa.Integer(), sa.ForeignKey("file_storage.id"), nullable=True),
+    )
+    _create_table(
+        "company_history",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("company_id", sa.Integer(), sa.ForeignKey("companies.id"), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("role", sa.String(255), nullable=True),
+        sa.Column("salary", sa.String(100), nullable=True),
+        sa.Column("rounds_count", sa.Integer(), nullable=True),
+        sa.Column("eligibility", sa.String(255), nullable=True),
+    )
+    _create_table(
+        "placement_rounds",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("company_history_id", sa.Integer(), sa.ForeignKey("company_history.id"), nullable=False),
+        sa.Column("round_name", sa.String(255), nullable=False),
+        sa.Column("round_description", sa.String(1000), nullable=True),
+        sa.Column("difficulty_level", sa.String(50), nullable=True),
+    )
+    _create_table(
+        "company_questions",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("company_id", sa.Integer(), sa.ForeignKey("companies.id"), nullable=False),
+        sa.Column("question", sa.String(2000), nullable=False),
+        sa.Column("category", sa.String(50), nullable=False),
+        sa.Column("difficulty", sa.String(50), nullable=True),
+        sa.Column("year", sa.Integer(), nullable=True),
+    )
+    _create_table(
+        "interview_experiences",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("student_name", sa.String(255), nullable=False),
+        sa.Column("department", sa.String(100), nullable=True),
+        sa.Column("batch", sa.Integer(), nullable=True),
+        sa.Column("company_id", sa.Integer(), sa.ForeignKey("companies.id"), nullable=False),
+        sa.Column("role", sa.String(255), nullable=True),
+        sa.Column("experience_text", sa.Text(), nullable=False),
+        sa.Column("rounds", sa.String(1000), nullable=True),
+        sa.Column("questions_faced", sa.String(2000), nullable=True),
+        sa.Column("tips", sa.String(1000), nullable=True),
+        sa.Column("status", sa.String(50), nullable=True),
+    )
+    _create_table(
+        "resources",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(150), nullable=False),
+        sa.Column("url", sa.String(500), nullable=True),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("category", sa.String(50), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("file_id", sa.Integer(), sa.ForeignKey("file_storage.id"), nullable=True),
+    )
+    _create_table(
+        "resume_samples",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(150), nullable=False),
+        sa.Column("url", sa.String(500), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("file_id", sa.Integer(), sa.ForeignKey("file_storage.id"), nullable=True),
+    )
+    _create_table(
+        "announcements",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(150), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("file_id", sa.Integer(), sa.ForeignKey("file_storage.id"), nullable=True),
+    )
+    _create_table(
+        "placement_drives",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("company_id", sa.Integer(), sa.ForeignKey("companies.id"), nullable=False),
+        sa.Column("batch", sa.Integer(), nullable=False),
+        sa.Column("role", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("date", sa.DateTime(), nullable=False),
+        sa.Column("deadline", sa.DateTime(), nullable=False),
+        sa.Column("eligibility_criteria", sa.Text(), nullable=True),
+        sa.Column("status", sa.String(50), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    _create_table(
+        "student_applications",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("student_id", sa.Integer(), sa.ForeignKey("students.id"), nullable=False),
+        sa.Column("drive_id", sa.Integer(), sa.ForeignKey("placement_drives.id"), nullable=False),
+        sa.Column("applied_at", sa.DateTime(), nullable=True),
+        sa.Column("status", sa.String(50), nullable=True),
+    )
+    _create_table(
+        "study_plans",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(200), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("duration_days", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    )
+    _create_table(
+        "daily_tasks",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("plan_id", sa.Integer(), sa.ForeignKey("study_plans.id"), nullable=False),
+        sa.Column("day_number", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(200), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("reference_link", sa.String(500), nullable=True),
+    )
+    _create_table(
+        "student_subscriptions",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("student_id", sa.Integer(), sa.ForeignKey("students.id"), nullable=False),
+        sa.Column("plan_id", sa.Integer(), sa.ForeignKey("study_plans.id"), nullable=False),
+        sa.Column("start_date", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("current_day", sa.Integer(), nullable=True),
+        sa.Column("completed_tasks", sa.Text(), nullable=True),
+    )
+    _create_table(
+        "questions",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(200), nullable=False),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("type", sa.String(50), nullable=False),
+        sa.Column("difficulty", sa.String(50), nullable=False),
+        sa.Column("topic", sa.String(100), nullable=True),
+        sa.Column("company_tags", sa.String(500), nullable=True),
+        sa.Column("options", sa.JSON(), nullable=True),
+        sa.Column("correct_option", sa.String(5), nullable=True),
+        sa.Column("solution", sa.Text(), nullable=True),
+        sa.Column("test_cases", sa.JSON(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    )
+    _create_table(
+        "user_progress",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("student_id", sa.Integer(), sa.ForeignKey("students.id"), nullable=False),
+        sa.Column("question_id", sa.Integer(), sa.ForeignKey("questions.id"), nullable=False),
+        sa.Column("status", sa.String(20), nullable=True),
+        sa.Column("submission_code", sa.Text(), nullable=True),
+        sa.Column("user_notes", sa.Text(), nullable=True),
+        sa.Column("is_bookmarked", sa.Boolean(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+    )
+    _create_table(
+        "forum_threads",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("student_id", sa.Integer(), sa.ForeignKey("students.id"), nullable=False),
+        sa.Column("title", sa.String(200), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("tags", sa.String(200), nullable=True),
+        sa.Column("views", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    )
+    _create_table(
+        "forum_replies",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("thread_id", sa.Integer(), sa.ForeignKey("forum_threads.id"), nullable=False),
+        sa.Column("student_id", sa.Integer(), sa.ForeignKey("students.id"), nullable=True),
+        sa.Column("admin_id", sa.Integer(), nullable=True),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    )
+    _create_table(
+        "bookmarks",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("students.id"), nullable=False),
+        sa.Column("entity_type", sa.String(50), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("note", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    )
+
+
+def downgrade():
+    for name in (
+        "bookmarks", "forum_replies", "forum_threads", "user_progress", "questions",
+        "student_subscriptions", "daily_tasks", "study_plans", "student_applications",
+        "placement_drives", "announcements", "resume_samples", "resources",
+        "interview_experiences", "company_questions", "placement_rounds",
+        "company_history", "companies", "students", "admins", "file_storage",
+    ):
+        op.drop_table(name)
@@ -0,0 +1,33 @@
+"""Add resources.category and student streak columns (formerly fix_db.py)
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def _has_column(table, column):
+    return any(c["name"] == column for c in sa.inspect(op.get_bind()).get_columns(table))
+
+
+def upgrade():
+    if not _has_column("resources", "category"):
+        op.add_column("resources", sa.Column("category", sa.String(50), server_default="GENERAL", nullable=True))
+    if not _has_column("students", "current_streak"):
+        op.add_column("students", sa.Column("current_streak", sa.Integer(), server_default="0", nullable=True))
+    if not _has_column("students", "last_active_date"):
+        op.add_column("students", sa.Column("last_active_date", sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    op.drop_column("students", "last_active_date")
+    op.drop_column("students", "current_streak")
+    op.drop_column("resources", "category")
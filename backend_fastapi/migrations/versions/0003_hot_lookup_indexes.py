@@ -0,0 +1,58 @@
+"""Composite indexes and unique keys for the hot lookup predicates
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+# (name, table, columns, unique, which duplicate row to keep)
+INDEXES = [
+    ("uq_user_progress_student_question", "user_progress", ["student_id", "question_id"], True, "MAX"),
+    ("uq_bookmarks_user_entity", "bookmarks", ["user_id", "entity_type", "entity_id"], True, "MIN"),
+    ("uq_student_applications_student_drive", "student_applications", ["student_id", "drive_id"], True, "MIN"),
+    ("ix_student_subscriptions_student_active", "student_subscriptions", ["student_id", "is_active"], False, None),
+    ("ix_interview_experiences_status_company", "interview_experiences", ["status", "company_id"], False, None),
+    ("ix_placement_drives_status_deadline", "placement_drives", ["status", "deadline"], False, None),
+    ("ix_forum_threads_created_at", "forum_threads", ["created_at"], False, None),
+    ("ix_forum_replies_thread_id", "forum_replies", ["thread_id"], False, None),
+]
+
+
+def _existing_index_names(table):
+    inspector = sa.inspect(op.get_bind())
+    names = {ix["name"] for ix in inspector.get_indexes(table)}
+    names.update(uc["name"] for uc in inspector.get_unique_constraints(table))
+    return names
+
+
+def _delete_duplicates(table, columns, keep):
+    # The derived table lets MySQL delete from a table it also selects from.
+    cols = ", ".join(columns)
+    op.execute(
+        f"DELETE FROM {table} WHERE id NOT IN "
+        f"(SELECT id FROM (SELECT {keep}(id) AS id FROM {table} GROUP BY {cols}) AS keep_rows)"
+    )
+
+
+def upgrade():
+    for name, table, columns, unique, keep in INDEXES:
+        if name in _existing_index_names(table):
+            continue
+        if unique:
+            _delete_duplicates(table, columns, keep)
+        # A unique index is MySQL's unique key and also works on SQLite without batch mode.
+        op.create_index(name, table, columns, unique=unique)
+
+
+def downgrade():
+    for name, table, columns, unique, keep in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,62 @@
+"""Move study-plan task completions from JSON text into subscription_task_completion
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+import json
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def _parse_task_ids(raw):
+    try:
+        ids = json.loads(raw) if raw else []
+    except ValueError:
+        return set()
+    if not isinstance(ids, list):
+        return set()
+    return {int(i) for i in ids if isinstance(i, int) or (isinstance(i, str) and i.isdigit())}
+
+
+def upgrade():
+    bind = op.get_bind()
+    if not sa.inspect(bind).has_table("subscription_task_completion"):
+        op.create_table(
+            "subscription_task_completion",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("subscription_id", sa.Integer(), sa.ForeignKey("student_subscriptions.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("task_id", sa.Integer(), sa.ForeignKey("daily_tasks.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("completed_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+            sa.UniqueConstraint("subscription_id", "task_id", name="uq_subscription_task_completion_subscription_task"),
+        )
+        op.create_index("ix_subscription_task_completion_id", "subscription_task_completion", ["id"])
+
+    # Backfill from the legacy JSON column. IDs of tasks that no longer exist are
+    # dropped (the foreign key would reject them); the column itself is kept.
+    task_ids = {row[0] for row in bind.execute(sa.text("SELECT id FROM daily_tasks"))}
+    already = set(bind.execute(sa.text("SELECT subscription_id, task_id FROM subscription_task_completion")))
+    rows = []
+    for sub_id, raw in bind.execute(sa.text(
+        "SELECT id, completed_tasks FROM student_subscriptions WHERE completed_tasks IS NOT NULL"
+    )):
+        for task_id in sorted(_parse_task_ids(raw) & task_ids):
+            if (sub_id, task_id) not in already:
+                rows.append({"subscription_id": sub_id, "task_id": task_id})
+    if rows:
+        table = sa.table(
+            "subscription_task_completion",
+            sa.column("subscription_id", sa.Integer()),
+            sa.column("task_id", sa.Integer()),
+        )
+        op.bulk_insert(table, rows)
+
+
+def downgrade():
+    op.drop_table("subscription_task_completion")
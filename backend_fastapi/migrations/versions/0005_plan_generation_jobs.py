@@ -0,0 +1,39 @@
+"""Job table for background AI study-plan generation
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if sa.inspect(op.get_bind()).has_table("plan_generation_jobs"):
+        return
+    op.create_table(
+        "plan_generation_jobs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("student_id", sa.Integer(), sa.ForeignKey("students.id"), nullable=False),
+        sa.Column("topic", sa.String(200), nullable=False),
+        sa.Column("duration", sa.Integer(), nullable=False),
+        sa.Column("difficulty", sa.String(50), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("plan_id", sa.Integer(), sa.ForeignKey("study_plans.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_plan_generation_jobs_id", "plan_generation_jobs", ["id"])
+    op.create_index("ix_plan_generation_jobs_status_created", "plan_generation_jobs", ["status", "created_at"])
+
+
+def downgrade():
+    op.drop_table("plan_generation_jobs")
@@ -0,0 +1,36 @@
+"""Generated-plan cache table and cache key on generation jobs
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    if not sa.inspect(bind).has_table("plan_cache"):
+        op.create_table(
+            "plan_cache",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("cache_key", sa.String(64), nullable=False, unique=True),
+            sa.Column("plan_id", sa.Integer(), sa.ForeignKey("study_plans.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        )
+        op.create_index("ix_plan_cache_id", "plan_cache", ["id"])
+    if not any(c["name"] == "cache_key" for c in sa.inspect(bind).get_columns("plan_generation_jobs")):
+        op.add_column("plan_generation_jobs", sa.Column("cache_key", sa.String(64), nullable=True))
+        op.create_index("ix_plan_generation_jobs_cache_key_status", "plan_generation_jobs", ["cache_key", "status"])
+
+
+def downgrade():
+    op.drop_index("ix_plan_generation_jobs_cache_key_status", table_name="plan_generation_jobs")
+    op.drop_column("plan_generation_jobs", "cache_key")
+    op.drop_table("plan_cache")
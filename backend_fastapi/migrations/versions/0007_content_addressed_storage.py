@@ -0,0 +1,36 @@
+"""Content-addressed file storage: blob reference counts and file_storage.content_hash
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    if not sa.inspect(bind).has_table("storage_blobs"):
+        op.create_table(
+            "storage_blobs",
+            sa.Column("content_hash", sa.String(64), primary_key=True),
+            sa.Column("size", sa.Integer(), nullable=False),
+            sa.Column("ref_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        )
+    # Existing rows keep their per-upload file_path and a NULL hash.
+    if not any(c["name"] == "content_hash" for c in sa.inspect(bind).get_columns("file_storage")):
+        op.add_column("file_storage", sa.Column("content_hash", sa.String(64), nullable=True))
+        op.create_index("ix_file_storage_content_hash", "file_storage", ["content_hash"])
+
+
+def downgrade():
+    op.drop_index("ix_file_storage_content_hash", table_name="file_storage")
+    op.drop_column("file_storage", "content_hash")
+    op.drop_table("storage_blobs")
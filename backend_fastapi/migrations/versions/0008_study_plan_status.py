@@ -0,0 +1,23 @@
+"""Status on study plans, so plans still being streamed stay hidden
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not any(c["name"] == "status" for c in sa.inspect(op.get_bind()).get_columns("study_plans")):
+        op.add_column("study_plans", sa.Column("status", sa.String(20), nullable=False, server_default="ready"))
+
+
+def downgrade():
+    op.drop_column("study_plans", "status")
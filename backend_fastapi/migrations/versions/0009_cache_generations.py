@@ -0,0 +1,27 @@
+"""Per-section cache generations shared by all API workers
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not sa.inspect(op.get_bind()).has_table("cache_generations"):
+        op.create_table(
+            "cache_generations",
+            sa.Column("name", sa.String(50), primary_key=True),
+            sa.Column("generation", sa.Integer(), nullable=False, server_default="0"),
+        )
+
+
+def downgrade():
+    op.drop_table("cache_generations")
@@ -3,13 +3,14 @@ from .company import Company
 from .company_history import CompanyHistory
 from .company_question import CompanyQuestion
 from .content import Resource, ResumeSample, Announcement
-from .file_storage import FileStorage
+from .file_storage import FileStorage, StorageBlob
 from .interview_experience import InterviewExperience
 from .placement_round import PlacementRound
 from .student import Student
 from .placement_drive import PlacementDrive
 from .student_application import StudentApplication
-from .planner import StudyPlan, DailyTask, StudentSubscription
+from .planner import StudyPlan, DailyTask, StudentSubscription, SubscriptionTaskCompletion, PlanGenerationJob, PlanCacheEntry
 from .discussion import ForumThread, ForumReply
 from .question import Question, UserProgress
 from .bookmark import Bookmark
+from .cache_generation import CacheGeneration
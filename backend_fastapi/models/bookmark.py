@@ -1,9 +1,12 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, func, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, func, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import relationship
 from ..database import Base
 
 class Bookmark(Base):
     __tablename__ = "bookmarks"
+    __table_args__ = (
+        UniqueConstraint("user_id", "entity_type", "entity_id", name="uq_bookmarks_user_entity"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("students.id"), nullable=False) # Assuming mostly students
@@ -0,0 +1,9 @@
+from sqlalchemy import Column, Integer, String
+from ..database import Base
+
+class CacheGeneration(Base):
+    """Bumped when an admin change makes a cached /dashboard section stale; part of its cache key in every worker."""
+    __tablename__ = "cache_generations"
+
+    name = Column(String(50), primary_key=True)
+    generation = Column(Integer, nullable=False, default=0)
@@ -1,9 +1,12 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, func, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, func, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from ..database import Base
 
 class ForumThread(Base):
     __tablename__ = "forum_threads"
+    __table_args__ = (
+        Index("ix_forum_threads_created_at", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
@@ -18,6 +21,9 @@ class ForumThread(Base):
 
 class ForumReply(Base):
     __tablename__ = "forum_replies"
+    __table_args__ = (
+        Index("ix_forum_replies_thread_id", "thread_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     thread_id = Column(Integer, ForeignKey("forum_threads.id"), nullable=False)
@@ -13,5 +13,20 @@ class FileStorage(Base):
     mime_type = Column(String(100), nullable=False)
     entity_type = Column(String(50), nullable=False)  # e.g., 'company', 'resource', 'resume', 'announcement'
     entity_id = Column(Integer, nullable=True)  # ID of the related entity
+    content_hash = Column(String(64), nullable=True, index=True)  # sha256 of the stored blob; NULL for files saved before content addressing
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    # Not a column: the uploaded body this row was created from (set via save_upload_file),
+    # kept until commit so utils/storage.py can re-store a blob released in the meantime
+    upload = None
+
+
+class StorageBlob(Base):
+    """One stored file body, shared by every FileStorage row with the same content_hash."""
+    __tablename__ = "storage_blobs"
+
+    content_hash = Column(String(64), primary_key=True)
+    size = Column(Integer, nullable=False)
+    ref_count = Column(Integer, nullable=False, default=0)  # FileStorage rows using it; the blob is deleted at 0
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
\ No newline at end of file
@@ -1,9 +1,13 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship, backref
 from ..database import Base
 
 class InterviewExperience(Base):
     __tablename__ = "interview_experiences"
+    # status leads so the status-only listings (approved, pending) use it too
+    __table_args__ = (
+        Index("ix_interview_experiences_status_company", "status", "company_id"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     student_name = Column(String(255), nullable=False)
     department = Column(String(100), nullable=True)
@@ -1,10 +1,13 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Date, Enum
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Date, Enum, Index
 from sqlalchemy.orm import relationship, backref
 from ..database import Base
 from datetime import datetime
 
 class PlacementDrive(Base):
     __tablename__ = "placement_drives"
+    __table_args__ = (
+        Index("ix_placement_drives_status_deadline", "status", "deadline"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     company_id = Column(Integer, ForeignKey("companies.id"), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, func, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, func, ForeignKey, Boolean, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from ..database import Base
 
@@ -9,6 +9,7 @@ class StudyPlan(Base):
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=True)
     duration_days = Column(Integer, nullable=False) # e.g. 30 days
+    status = Column(String(20), nullable=False, default="ready", server_default="ready")  # "generating" while a stream is still writing its tasks
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     tasks = relationship("DailyTask", back_populates="plan", cascade="all, delete-orphan")
@@ -27,6 +28,9 @@ class DailyTask(Base):
 
 class StudentSubscription(Base):
     __tablename__ = "student_subscriptions"
+    __table_args__ = (
+        Index("ix_student_subscriptions_student_active", "student_id", "is_active"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
@@ -35,7 +39,50 @@ class StudentSubscription(Base):
     is_active = Column(Boolean, default=True)
     current_day = Column(Integer, default=1) # Track which day the student is on
     
-    # We could track individual task completion here or in a separate table.
-    # For simplicity, let's say "current_day" implies all tasks before that day are done,
-    # or we can add a completed_tasks JSON column if we want granular tracking.
-    completed_tasks = Column(Text, default="[]") # JSON list of task IDs completed
+    # Legacy JSON list of completed task IDs, no longer written; completions
+    # live in subscription_task_completion (migrated by revision 0004).
+    completed_tasks = Column(Text, default="[]")
+
+    plan = relationship("StudyPlan")
+    task_completions = relationship("SubscriptionTaskCompletion", cascade="all, delete-orphan", passive_deletes=True)
+
+class SubscriptionTaskCompletion(Base):
+    __tablename__ = "subscription_task_completion"
+    __table_args__ = (
+        UniqueConstraint("subscription_id", "task_id", name="uq_subscription_task_completion_subscription_task"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    subscription_id = Column(Integer, ForeignKey("student_subscriptions.id", ondelete="CASCADE"), nullable=False)
+    task_id = Column(Integer, ForeignKey("daily_tasks.id", ondelete="CASCADE"), nullable=False)
+    completed_at = Column(DateTime, server_default=func.now(), nullable=False)
+
+class PlanGenerationJob(Base):
+    """A queued AI study-plan generation, run by a background worker (utils/plan_jobs.py)."""
+    __tablename__ = "plan_generation_jobs"
+    __table_args__ = (
+        Index("ix_plan_generation_jobs_status_created", "status", "created_at"),
+        Index("ix_plan_generation_jobs_cache_key_status", "cache_key", "status"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
+    topic = Column(String(200), nullable=False)
+    duration = Column(Integer, nullable=False)
+    difficulty = Column(String(50), nullable=False)
+    cache_key = Column(String(64), nullable=True) # see utils/plan_cache.cache_key
+    status = Column(String(20), default="queued", nullable=False) # queued, running, succeeded, failed
+    plan_id = Column(Integer, ForeignKey("study_plans.id", ondelete="SET NULL"), nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+class PlanCacheEntry(Base):
+    """Persistent tier of the generated-plan cache (utils/plan_cache.py)."""
+    __tablename__ = "plan_cache"
+
+    id = Column(Integer, primary_key=True, index=True)
+    cache_key = Column(String(64), nullable=False, unique=True)
+    plan_id = Column(Integer, ForeignKey("study_plans.id", ondelete="CASCADE"), nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, func, ForeignKey, JSON, Enum, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, func, ForeignKey, JSON, Enum, Boolean, UniqueConstraint
 from sqlalchemy.orm import relationship
 import enum
 from ..database import Base
@@ -38,6 +38,9 @@ class Question(Base):
 
 class UserProgress(Base):
     __tablename__ = "user_progress"
+    __table_args__ = (
+        UniqueConstraint("student_id", "question_id", name="uq_user_progress_student_question"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
@@ -1,10 +1,13 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, UniqueConstraint
 from sqlalchemy.orm import relationship, backref
 from ..database import Base
 from datetime import datetime
 
 class StudentApplication(Base):
     __tablename__ = "student_applications"
+    __table_args__ = (
+        UniqueConstraint("student_id", "drive_id", name="uq_student_applications_student_drive"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
@@ -9,7 +9,8 @@ try:
     from ..models.file_storage import FileStorage
     from ..schemas.content import ResourceCreate, ResourceOut, ResumeCreate, ResumeOut, AnnouncementCreate, AnnouncementOut
     from ..utils.dependencies import require_admin
-    from ..utils.file_handler import save_upload_file, delete_file
+    from ..utils.dashboard_cache import invalidates
+    from ..utils.file_handler import save_upload_file
 except Exception:
     from backend_fastapi.database import get_db
     from backend_fastapi.models.interview_experience import InterviewExperience
@@ -18,7 +19,8 @@ except Exception:
     from backend_fastapi.models.file_storage import FileStorage
     from backend_fastapi.schemas.content import ResourceCreate, ResourceOut, ResumeCreate, ResumeOut, AnnouncementCreate, AnnouncementOut
     from backend_fastapi.utils.dependencies import require_admin
-    from backend_fastapi.utils.file_handler import save_upload_file, delete_file
+    from backend_fastapi.utils.dashboard_cache import invalidates
+    from backend_fastapi.utils.file_handler import save_upload_file
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -27,7 +29,7 @@ def pending_experiences(db: Session = Depends(get_db), _=Depends(require_admin))
     exps = db.query(InterviewExperience).filter(InterviewExperience.status == "pending").all()
     return exps
 
-@router.put("/approve-experience/{exp_id}")
+@router.put("/approve-experience/{exp_id}", dependencies=[Depends(invalidates("experiences"))])
 def approve_experience(exp_id: int, db: Session = Depends(get_db), _=Depends(require_admin)):
     exp = db.query(InterviewExperience).filter(InterviewExperience.id == exp_id).first()
     if not exp:
@@ -36,7 +38,7 @@ def approve_experience(exp_id: int, db: Session = Depends(get_db), _=Depends(req
     db.commit()
     return {"msg": "approved"}
 
-@router.put("/reject-experience/{exp_id}")
+@router.put("/reject-experience/{exp_id}", dependencies=[Depends(invalidates("experiences"))])
 def reject_experience(exp_id: int, db: Session = Depends(get_db), _=Depends(require_admin)):
     exp = db.query(InterviewExperience).filter(InterviewExperience.id == exp_id).first()
     if not exp:
@@ -46,7 +48,7 @@ def reject_experience(exp_id: int, db: Session = Depends(get_db), _=Depends(requ
     return {"msg": "rejected"}
 
 # Companies management
-@router.post("/companies", response_model=dict)
+@router.post("/companies", response_model=dict, dependencies=[Depends(invalidates("companies", "admin_stats"))])
 async def admin_create_company(
     name: str = Form(...),
     description: Optional[str] = Form(None),
@@ -102,7 +104,7 @@ async def admin_create_company(
     db.refresh(company)
     return {"id": company.id, "msg": "created"}
 
-@router.put("/companies/{company_id}", response_model=dict)
+@router.put("/companies/{company_id}", response_model=dict, dependencies=[Depends(invalidates("companies", "drives", "experiences", "admin_stats"))])
 def admin_update_company(company_id: int, payload: dict, db: Session = Depends(get_db), _=Depends(require_admin)):
     company = db.query(Company).filter(Company.id == company_id).first()
     if not company:
@@ -113,19 +115,22 @@ def admin_update_company(company_id: int, payload: dict, db: Session = Depends(g
     db.commit()
     return {"msg": "updated"}
 
-@router.delete("/companies/{company_id}", response_model=dict)
+@router.delete("/companies/{company_id}", response_model=dict, dependencies=[Depends(invalidates("companies", "drives", "upcoming_drives", "experiences", "admin_stats"))])
 def admin_delete_company(company_id: int, db: Session = Depends(get_db), _=Depends(require_admin)):
     company = db.query(Company).filter(Company.id == company_id).first()
     if not company:
         raise HTTPException(status_code=404, detail="Company not found")
 
-
+    # Releases the stored files (utils/storage.py)
+    for file_storage in (company.logo, company.profile_doc):
+        if file_storage:
+            db.delete(file_storage)
     db.delete(company)
     db.commit()
     return {"msg": "deleted"}
 
 # Resources
-@router.post("/resources", response_model=ResourceOut)
+@router.post("/resources", response_model=ResourceOut, dependencies=[Depends(invalidates("resources"))])
 async def create_resource(
     title: str = Form(...),
     description: Optional[str] = Form(None),
@@ -165,17 +170,19 @@ async def create_resource(
 def list_resources(db: Session = Depends(get_db), _=Depends(require_admin)):
     return db.query(Resource).all()
 
-@router.delete("/resources/{rid}", response_model=dict)
+@router.delete("/resources/{rid}", response_model=dict, dependencies=[Depends(invalidates("resources"))])
 def delete_resource(rid: int, db: Session = Depends(get_db), _=Depends(require_admin)):
     r = db.query(Resource).filter(Resource.id == rid).first()
     if not r:
         raise HTTPException(status_code=404, detail="Not found")
+    if r.file:
+        db.delete(r.file)
     db.delete(r)
     db.commit()
     return {"msg": "deleted"}
 
 
-@router.put("/resources/{rid}", response_model=ResourceOut)
+@router.put("/resources/{rid}", response_model=ResourceOut, dependencies=[Depends(invalidates("resources"))])
 def update_resource(rid: int, payload: ResourceCreate, db: Session = Depends(get_db), _=Depends(require_admin)):
     r = db.query(Resource).filter(Resource.id == rid).first()
     if not r:
@@ -189,7 +196,7 @@ def update_resource(rid: int, payload: ResourceCreate, db: Session = Depends(get
     return r
 
 # Resumes
-@router.post("/resumes", response_model=ResumeOut)
+@router.post("/resumes", response_model=ResumeOut, dependencies=[Depends(invalidates("resumes"))])
 async def create_resume(
     title: str = Form(...),
     url: Optional[str] = Form(None),
@@ -227,17 +234,19 @@ async def create_resume(
 def list_resumes(db: Session = Depends(get_db), _=Depends(require_admin)):
     return db.query(ResumeSample).all()
 
-@router.delete("/resumes/{rid}", response_model=dict)
+@router.delete("/resumes/{rid}", response_model=dict, dependencies=[Depends(invalidates("resumes"))])
 def delete_resume(rid: int, db: Session = Depends(get_db), _=Depends(require_admin)):
     r = db.query(ResumeSample).filter(ResumeSample.id == rid).first()
     if not r:
         raise HTTPException(status_code=404, detail="Not found")
+    if r.file:
+        db.delete(r.file)
     db.delete(r)
     db.commit()
     return {"msg": "deleted"}
 
 
-@router.put("/resumes/{rid}", response_model=ResumeOut)
+@router.put("/resumes/{rid}", response_model=ResumeOut, dependencies=[Depends(invalidates("resumes"))])
 def update_resume(rid: int, payload: ResumeCreate, db: Session = Depends(get_db), _=Depends(require_admin)):
     r = db.query(ResumeSample).filter(ResumeSample.id == rid).first()
     if not r:
@@ -251,7 +260,7 @@ def update_resume(rid: int, payload: ResumeCreate, db: Session = Depends(get_db)
     return r
 
 # Announcements
-@router.post("/announcements", response_model=AnnouncementOut)
+@router.post("/announcements", response_model=AnnouncementOut, dependencies=[Depends(invalidates("announcements"))])
 async def create_announcement(
     request: Request,
     file: Optional[UploadFile] = File(None),
@@ -311,17 +320,19 @@ async def create_announcement(
 def list_announcements(db: Session = Depends(get_db), _=Depends(require_admin)):
     return db.query(Announcement).order_by(Announcement.created_at.desc()).all()
 
-@router.delete("/announcements/{aid}", response_model=dict)
+@router.delete("/announcements/{aid}", response_model=dict, dependencies=[Depends(invalidates("announcements"))])
 def delete_announcement(aid: int, db: Session = Depends(get_db), _=Depends(require_admin)):
     a = db.query(Announcement).filter(Announcement.id == aid).first()
     if not a:
         raise HTTPException(status_code=404, detail="Not found")
+    if a.file:
+        db.delete(a.file)
     db.delete(a)
     db.commit()
     return {"msg": "deleted"}
 
 
-@router.put("/announcements/{aid}", response_model=AnnouncementOut)
+@router.put("/announcements/{aid}", response_model=AnnouncementOut, dependencies=[Depends(invalidates("announcements"))])
 def update_announcement(aid: int, payload: AnnouncementCreate, db: Session = Depends(get_db), _=Depends(require_admin)):
     a = db.query(Announcement).filter(Announcement.id == aid).first()
     if not a:
@@ -3,11 +3,10 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func
 from ..database import get_db
 from ..models.company import Company
-from ..models.student import Student
 from ..models.interview_experience import InterviewExperience
 from ..models.student_application import StudentApplication
 from ..models.placement_drive import PlacementDrive
-from ..utils.dependencies import require_admin, get_current_student
+from ..utils.dependencies import require_admin, get_current_student_id
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
@@ -36,10 +35,10 @@ def admin_stats(db: Session = Depends(get_db), _=Depends(require_admin)):
     }
 
 @router.get("/student/stats")
-def student_stats(current_user: Student = Depends(get_current_student), db: Session = Depends(get_db)):
+def student_stats(student_id: int = Depends(get_current_student_id), db: Session = Depends(get_db)):
     # 1. My Applications Status
     my_status_data = db.query(StudentApplication.status, func.count(StudentApplication.id))\
-        .filter(StudentApplication.student_id == current_user.id)\
+        .filter(StudentApplication.student_id == student_id)\
         .group_by(StudentApplication.status).all()
     my_status = [{"label": s[0], "count": s[1]} for s in my_status_data]
     
@@ -1,38 +1,50 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 try:
-    from ..database import get_db, Base, engine
+    from ..database import get_async_db, AsyncSessionLocal
     from ..models.admin import Admin
     from ..schemas.auth import Token, AdminAuth
-    from ..utils.hashing import hash_password, verify_password
+    from ..utils.hashing import hash_password_async, verify_password_async, needs_rehash
     from ..utils.jwt_handler import create_access_token
 except Exception:
     # Fallback for environments that import modules without package context
-    from backend_fastapi.database import get_db, Base, engine
+    from backend_fastapi.database import get_async_db, AsyncSessionLocal
     from backend_fastapi.models.admin import Admin
     from backend_fastapi.schemas.auth import Token, AdminAuth
-    from backend_fastapi.utils.hashing import hash_password, verify_password
+    from backend_fastapi.utils.hashing import hash_password_async, verify_password_async, needs_rehash
     from backend_fastapi.utils.jwt_handler import create_access_token
 from datetime import timedelta
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+async def _rehash_password(admin_id: int, password: str):
+    """Background task: store the password hashed with the current scheme/rounds."""
+    password_hash = await hash_password_async(password)
+    async with AsyncSessionLocal() as db:
+        await db.execute(update(Admin).where(Admin.id == admin_id).values(password_hash=password_hash))
+        await db.commit()
+
 # Simple endpoint to create initial admin (only for development)
 @router.post("/create-admin", response_model=dict)
-def create_admin(payload: AdminAuth, db: Session = Depends(get_db)):
-    existing = db.query(Admin).filter(Admin.username == payload.username).first()
+async def create_admin(payload: AdminAuth, db: AsyncSession = Depends(get_async_db)):
+    existing = (await db.execute(select(Admin.id).where(Admin.username == payload.username))).first()
     if existing:
         raise HTTPException(status_code=400, detail="Admin exists")
-    admin = Admin(username=payload.username, password_hash=hash_password(payload.password))
+    admin = Admin(username=payload.username, password_hash=await hash_password_async(payload.password))
     db.add(admin)
-    db.commit()
-    db.refresh(admin)
+    await db.commit()
     return {"msg": "admin created"}
 
 @router.post("/login", response_model=Token)
-def login(payload: AdminAuth, db: Session = Depends(get_db)):
-    admin = db.query(Admin).filter(Admin.username == payload.username).first()
-    if not admin or not verify_password(payload.password, admin.password_hash):
+async def login(payload: AdminAuth, background_tasks: BackgroundTasks, db: AsyncSession = Depends(get_async_db)):
+    result = await db.execute(
+        select(Admin.id, Admin.username, Admin.password_hash).where(Admin.username == payload.username)
+    )
+    admin = result.first()
+    if not admin or not await verify_password_async(payload.password, admin.password_hash):
         raise HTTPException(status_code=401, detail="Invalid credentials")
+    if needs_rehash(admin.password_hash):
+        background_tasks.add_task(_rehash_password, admin.id, payload.password)
     access_token = create_access_token({"sub": admin.username, "role": "admin", "aid": admin.id}, expires_delta=timedelta(hours=24))
     return {"access_token": access_token, "token_type": "bearer"}
@@ -1,11 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import and_, or_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from pydantic import BaseModel
+from datetime import datetime
+from pydantic import BaseModel, Field
 from ..database import get_db
 from ..models import bookmark as models
-from ..models.student import Student
-from ..utils.dependencies import get_current_student
+from ..models.company import Company
+from ..models.content import Resource
+from ..models.interview_experience import InterviewExperience
+from ..models.question import Question
+from ..utils.dependencies import get_current_student_id
 
 router = APIRouter(
     prefix="/bookmarks",
@@ -18,32 +24,117 @@ class BookmarkCreate(BaseModel):
     entity_id: int
     note: Optional[str] = None
 
+class BookmarkRef(BaseModel):
+    entity_type: str
+    entity_id: int
+
+class BookmarkToggle(BookmarkRef):
+    note: Optional[str] = None
+    bookmarked: Optional[bool] = None  # desired state; omitted flips the current one
+
+class BookmarkStatusRequest(BaseModel):
+    entities: List[BookmarkRef] = Field(..., max_length=500)
+
+class BookmarkState(BookmarkRef):
+    bookmarked: bool
+    bookmark_id: Optional[int] = None
+
+class BookmarkEntity(BaseModel):
+    id: int
+    title: str
+    subtitle: Optional[str] = None
+    url: Optional[str] = None
+    company_id: Optional[int] = None  # interview experiences are shown on their company's page
+
 class BookmarkOut(BaseModel):
     id: int
     entity_type: str
     entity_id: int
     note: Optional[str]
-    created_at: str
+    created_at: datetime
+    entity: Optional[BookmarkEntity] = None  # with ?expand=entity; None if the entity was deleted
     
     class Config:
         orm_mode = True
 
+def _load_questions(db: Session, ids):
+    rows = db.query(Question.id, Question.title, Question.difficulty, Question.topic).filter(Question.id.in_(ids))
+    return {r.id: {"id": r.id, "title": r.title, "subtitle": " · ".join(filter(None, [r.difficulty, r.topic]))} for r in rows}
+
+def _load_experiences(db: Session, ids):
+    rows = db.query(
+        InterviewExperience.id, InterviewExperience.role, InterviewExperience.student_name,
+        InterviewExperience.company_id, Company.name.label("company_name")
+    ).outerjoin(Company, Company.id == InterviewExperience.company_id).filter(InterviewExperience.id.in_(ids))
+    return {
+        r.id: {
+            "id": r.id,
+            "title": " - ".join(filter(None, [r.company_name, r.role])) or f"Experience #{r.id}",
+            "subtitle": r.student_name,
+            "company_id": r.company_id,
+        }
+        for r in rows
+    }
+
+def _load_resources(db: Session, ids):
+    rows = db.query(Resource.id, Resource.title, Resource.category, Resource.url).filter(Resource.id.in_(ids))
+    return {r.id: {"id": r.id, "title": r.title, "subtitle": r.category, "url": r.url} for r in rows}
+
+# One IN (...) query per entity type present on the page
+ENTITY_LOADERS = {
+    "question": _load_questions,
+    "interview_experience": _load_experiences,
+    "resource": _load_resources,
+}
+
 @router.get("/", response_model=List[BookmarkOut])
 def get_my_bookmarks(
-    current_student: Student = Depends(get_current_student),
+    response: Response,
+    expand: Optional[str] = Query(None, description="'entity' adds each bookmarked item's title"),
+    cursor: Optional[int] = Query(None, description="X-Next-Cursor from the previous page"),
+    limit: Optional[int] = Query(None, ge=1, le=200, description="page size; omitted returns every bookmark"),
+    student_id: int = Depends(get_current_student_id),
     db: Session = Depends(get_db)
 ):
-    return db.query(models.Bookmark).filter(models.Bookmark.user_id == current_student.id).all()
+    """The student's bookmarks, newest first, keyset-paginated on id."""
+    if expand not in (None, "entity"):
+        raise HTTPException(status_code=400, detail="expand must be 'entity'")
+    query = db.query(models.Bookmark).filter(models.Bookmark.user_id == student_id)
+    if cursor is not None:
+        query = query.filter(models.Bookmark.id < cursor)
+    query = query.order_by(models.Bookmark.id.desc())
+    if limit is None:
+        bookmarks = query.all()
+    else:
+        bookmarks = query.limit(limit + 1).all()
+        if len(bookmarks) > limit:
+            bookmarks = bookmarks[:limit]
+            response.headers["X-Next-Cursor"] = str(bookmarks[-1].id)
+
+    results = [BookmarkOut.model_validate(b, from_attributes=True) for b in bookmarks]
+    if expand == "entity":
+        ids_by_type = {}
+        for b in results:
+            ids_by_type.setdefault(b.entity_type, set()).add(b.entity_id)
+        entities = {
+            entity_type: ENTITY_LOADERS[entity_type](db, ids)
+            for entity_type, ids in ids_by_type.items()
+            if entity_type in ENTITY_LOADERS
+        }
+        for b in results:
+            found = entities.get(b.entity_type, {}).get(b.entity_id)
+            b.entity = BookmarkEntity(**found) if found else None
+    return results
 
 @router.post("/")
 def create_bookmark(
     bookmark: BookmarkCreate,
-    current_student: Student = Depends(get_current_student),
+    student_id: int = Depends(get_current_student_id),
     db: Session = Depends(get_db)
 ):
     # Check if already bookmarked?
     existing = db.query(models.Bookmark).filter(
-        models.Bookmark.user_id == current_student.id,
+        models.Bookmark.user_id == student_id,
         models.Bookmark.entity_type == bookmark.entity_type,
         models.Bookmark.entity_id == bookmark.entity_id
     ).first()
@@ -52,7 +143,7 @@ def create_bookmark(
         return {"msg": "Already bookmarked", "id": existing.id}
     
     new_bookmark = models.Bookmark(
-        user_id=current_student.id,
+        user_id=student_id,
         entity_type=bookmark.entity_type,
         entity_id=bookmark.entity_id,
         note=bookmark.note
@@ -62,15 +153,91 @@ def create_bookmark(
     db.refresh(new_bookmark)
     return new_bookmark
 
+def _find_bookmark_id(db: Session, student_id: int, entity_type: str, entity_id: int):
+    return db.query(models.Bookmark.id).filter(
+        models.Bookmark.user_id == student_id,
+        models.Bookmark.entity_type == entity_type,
+        models.Bookmark.entity_id == entity_id
+    ).scalar()
+
+@router.put("/toggle", response_model=BookmarkState)
+def toggle_bookmark(
+    payload: BookmarkToggle,
+    student_id: int = Depends(get_current_student_id),
+    db: Session = Depends(get_db)
+):
+    """Add or remove a bookmark in one call.
+
+    Relies on the (user_id, entity_type, entity_id) unique key instead of a
+    read-then-write: the delete tells whether a bookmark existed, and an insert
+    that loses a race to a concurrent one just reports the bookmark as saved.
+    """
+    state = {"entity_type": payload.entity_type, "entity_id": payload.entity_id}
+    if payload.bookmarked is not True:
+        removed = db.query(models.Bookmark).filter(
+            models.Bookmark.user_id == student_id,
+            models.Bookmark.entity_type == payload.entity_type,
+            models.Bookmark.entity_id == payload.entity_id
+        ).delete(synchronize_session=False)
+        db.commit()
+        if removed or payload.bookmarked is False:
+            return {**state, "bookmarked": False}
+
+    bookmark = models.Bookmark(
+        user_id=student_id,
+        entity_type=payload.entity_type,
+        entity_id=payload.entity_id,
+        note=payload.note
+    )
+    db.add(bookmark)
+    try:
+        db.flush()
+        bookmark_id = bookmark.id
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        bookmark_id = _find_bookmark_id(db, student_id, payload.entity_type, payload.entity_id)
+    return {**state, "bookmarked": True, "bookmark_id": bookmark_id}
+
+@router.post("/status", response_model=List[BookmarkState])
+def bookmark_status(
+    payload: BookmarkStatusRequest,
+    student_id: int = Depends(get_current_student_id),
+    db: Session = Depends(get_db)
+):
+    """Bookmark state of many entities (in request order) with one indexed query."""
+    ids_by_type = {}
+    for ref in payload.entities:
+        ids_by_type.setdefault(ref.entity_type, set()).add(ref.entity_id)
+    found = {}
+    if ids_by_type:
+        rows = db.query(models.Bookmark.id, models.Bookmark.entity_type, models.Bookmark.entity_id).filter(
+            models.Bookmark.user_id == student_id,
+            or_(*[
+                and_(models.Bookmark.entity_type == entity_type, models.Bookmark.entity_id.in_(ids))
+                for entity_type, ids in ids_by_type.items()
+            ])
+        ).all()
+        found = {(row.entity_type, row.entity_id): row.id for row in rows}
+    return [
+        {
+            "entity_type": ref.entity_type,
+            "entity_id": ref.entity_id,
+            "bookmarked": (ref.entity_type, ref.entity_id) in found,
+            "bookmark_id": found.get((ref.entity_type, ref.entity_id)),
+        }
+        for ref in payload.entities
+    ]
+
 @router.delete("/{bookmark_id}")
 def delete_bookmark(
     bookmark_id: int,
-    current_student: Student = Depends(get_current_student),
+    student_id: int = Depends(get_current_student_id),
     db: Session = Depends(get_db)
 ):
     bm = db.query(models.Bookmark).filter(
         models.Bookmark.id == bookmark_id,
-        models.Bookmark.user_id == current_student.id
+        models.Bookmark.user_id == student_id
     ).first()
     
     if not bm:
@@ -1,20 +1,22 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
 try:
-    from ..database import get_db
+    from ..database import get_db, get_async_db
     from ..models.company import Company
     from ..schemas.company import CompanyCreate, CompanyOut
+    from ..utils.dashboard_cache import invalidates
 except Exception:
-    from backend_fastapi.database import get_db
+    from backend_fastapi.database import get_db, get_async_db
     from backend_fastapi.models.company import Company
     from backend_fastapi.schemas.company import CompanyCreate, CompanyOut
+    from backend_fastapi.utils.dashboard_cache import invalidates
 
 router = APIRouter(prefix="/companies", tags=["companies"])
 
-@router.post("/", response_model=CompanyOut)
+@router.post("/", response_model=CompanyOut, dependencies=[Depends(invalidates("companies", "admin_stats"))])
 def create_company(payload: CompanyCreate, db: Session = Depends(get_db)):
     existing = db.query(Company).filter(Company.name == payload.name).first()
     if existing:
@@ -26,13 +28,13 @@ def create_company(payload: CompanyCreate, db: Session = Depends(get_db)):
     return company
 
 @router.get("/", response_model=List[CompanyOut])
-def list_companies(db: Session = Depends(get_db)):
-    companies = db.query(Company).all()
-    return companies
+async def list_companies(db: AsyncSession = Depends(get_async_db)):
+    result = await db.execute(select(Company))
+    return result.scalars().all()
 
 @router.get("/{company_id}", response_model=CompanyOut)
-def get_company(company_id: int, db: Session = Depends(get_db)):
-    company = db.query(Company).filter(Company.id == company_id).first()
+async def get_company(company_id: int, db: AsyncSession = Depends(get_async_db)):
+    company = await db.get(Company, company_id)
     if not company:
         raise HTTPException(status_code=404, detail="Company not found")
     return company
@@ -1,37 +1,46 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 from typing import List
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
 try:
-    from ..database import get_db
+    from ..database import get_db, get_async_db
     from ..models.content import Resource, ResumeSample, Announcement
     from ..schemas.content import ResourceOut, ResumeOut, AnnouncementOut
+    from ..utils.dashboard_cache import invalidates
 except Exception:
-    from backend_fastapi.database import get_db
+    from backend_fastapi.database import get_db, get_async_db
     from backend_fastapi.models.content import Resource, ResumeSample, Announcement
     from backend_fastapi.schemas.content import ResourceOut, ResumeOut, AnnouncementOut
+    from backend_fastapi.utils.dashboard_cache import invalidates
 
 
 router = APIRouter(prefix="/content", tags=["content"])
 
 
 @router.get("/resources", response_model=List[ResourceOut])
-def public_resources(category: str = None, db: Session = Depends(get_db)):
-    query = db.query(Resource)
+async def public_resources(category: str = None, db: AsyncSession = Depends(get_async_db)):
+    query = select(Resource).options(selectinload(Resource.file))
     if category:
-        query = query.filter(Resource.category == category)
-    return query.order_by(Resource.created_at.desc()).all()
+        query = query.where(Resource.category == category)
+    result = await db.execute(query.order_by(Resource.created_at.desc()))
+    return result.scalars().all()
 
 
 @router.get("/resumes", response_model=List[ResumeOut])
-def public_resumes(db: Session = Depends(get_db)):
-    return db.query(ResumeSample).order_by(ResumeSample.created_at.desc()).all()
+async def public_resumes(db: AsyncSession = Depends(get_async_db)):
+    result = await db.execute(
+        select(ResumeSample).options(selectinload(ResumeSample.file)).order_by(ResumeSample.created_at.desc())
+    )
+    return result.scalars().all()
 
 
 @router.get("/announcements", response_model=List[AnnouncementOut])
-def public_announcements(db: Session = Depends(get_db)):
-    return db.query(Announcement).order_by(Announcement.created_at.desc()).all()
+async def public_announcements(db: AsyncSession = Depends(get_async_db)):
+    result = await db.execute(
+        select(Announcement).options(selectinload(Announcement.file)).order_by(Announcement.created_at.desc())
+    )
+    return result.scalars().all()
 
 
 
@@ -41,7 +50,7 @@ from ..utils.file_handler import save_upload_file
 from ..models.file_storage import FileStorage
 import os
 
-@router.post("/resources")
+@router.post("/resources", dependencies=[Depends(invalidates("resources"))])
 async def create_resource(
     title: str = Form(...),
     description: str = Form(None),
@@ -71,7 +80,9 @@ async def create_resource(
                 file_type=file_data["file_type"],
                 file_size=file_data["file_size"],
                 mime_type=file_data["mime_type"],
-                entity_type=file_data["entity_type"]
+                entity_type=file_data["entity_type"],
+                content_hash=file_data["content_hash"],
+                upload=file_data["upload"]
             )
             db.add(new_file)
             db.commit() # Commit to get ID
@@ -87,18 +98,28 @@ async def create_resource(
     return new_resource
 
 
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, RedirectResponse
+from ..utils.storage import storage
 import os
 from pathlib import Path
 
 @router.get("/file/{file_id}")
-async def download_file(file_id: int, db: Session = Depends(get_db)):
+async def download_file(file_id: int, db: AsyncSession = Depends(get_async_db)):
     """Download a file by ID (public access for students and admins)."""
-    file_record = db.query(FileStorage).filter(FileStorage.id == file_id).first()
+    file_record = await db.get(FileStorage, file_id)
     if not file_record:
         raise HTTPException(status_code=404, detail="File not found")
     
-    file_path = Path(file_record.file_path)
+    if file_record.content_hash:
+        local_path = storage.local_path(file_record.content_hash)
+        if local_path is None:
+            # Remote backend: the client fetches the blob from the store directly
+            return RedirectResponse(storage.download_url(
+                file_record.content_hash, file_record.original_filename, file_record.mime_type
+            ))
+        file_path = Path(local_path)
+    else:
+        file_path = Path(file_record.file_path)
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="File does not exist on disk")
     
@@ -108,7 +129,7 @@ async def download_file(file_id: int, db: Session = Depends(get_db)):
         media_type=file_record.mime_type
     )
 
-@router.delete("/resources/{resource_id}")
+@router.delete("/resources/{resource_id}", dependencies=[Depends(invalidates("resources"))])
 async def delete_resource(
     resource_id: int,
     current_admin=Depends(require_admin),
@@ -119,23 +140,17 @@ async def delete_resource(
     if not resource:
         raise HTTPException(status_code=404, detail="Resource not found")
     
-    # Delete associated file if it exists
+    # Delete associated file if it exists; the stored content goes with its last reference
     if resource.file_id:
         file_record = db.query(FileStorage).filter(FileStorage.id == resource.file_id).first()
         if file_record:
-            try:
-                file_path = Path(file_record.file_path)
-                if file_path.exists():
-                    file_path.unlink()
-            except Exception as e:
-                print(f"Error deleting file: {str(e)}")
             db.delete(file_record)
     
     db.delete(resource)
     db.commit()
     return {"message": "Resource deleted successfully"}
 
-@router.put("/resources/{resource_id}")
+@router.put("/resources/{resource_id}", dependencies=[Depends(invalidates("resources"))])
 async def update_resource(
     resource_id: int,
     title: str = Form(None),
@@ -165,12 +180,6 @@ async def update_resource(
             if resource.file_id:
                 old_file = db.query(FileStorage).filter(FileStorage.id == resource.file_id).first()
                 if old_file:
-                    try:
-                        old_path = Path(old_file.file_path)
-                        if old_path.exists():
-                            old_path.unlink()
-                    except Exception:
-                        pass
                     db.delete(old_file)
             
             # Save new file
@@ -182,7 +191,9 @@ async def update_resource(
                 file_type=file_data["file_type"],
                 file_size=file_data["file_size"],
                 mime_type=file_data["mime_type"],
-                entity_type=file_data["entity_type"]
+                entity_type=file_data["entity_type"],
+                content_hash=file_data["content_hash"],
+                upload=file_data["upload"]
             )
             db.add(new_file)
             db.commit()
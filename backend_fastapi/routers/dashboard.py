@@ -0,0 +1,135 @@
+from collections import Counter
+from datetime import datetime
+from fastapi import APIRouter, Depends
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import Session, selectinload
+try:
+    from ..database import get_db
+    from ..models.company import Company
+    from ..models.content import Resource, ResumeSample, Announcement
+    from ..models.interview_experience import InterviewExperience
+    from ..models.placement_drive import PlacementDrive
+    from ..models.student import Student
+    from ..schemas.company import CompanyOut
+    from ..schemas.content import ResourceOut, ResumeOut, AnnouncementOut
+    from ..schemas.experience import ExperienceOut
+    from ..schemas.student import StudentOut
+    from ..utils.dependencies import get_current_student, require_admin
+    from ..utils.dashboard_cache import sections as _sections, section_generations
+    from .analytics import admin_stats
+    from .drives import DriveOut, open_drives_query, applications_query
+    from .students import record_activity
+except Exception:
+    from backend_fastapi.database import get_db
+    from backend_fastapi.models.company import Company
+    from backend_fastapi.models.content import Resource, ResumeSample, Announcement
+    from backend_fastapi.models.interview_experience import InterviewExperience
+    from backend_fastapi.models.placement_drive import PlacementDrive
+    from backend_fastapi.models.student import Student
+    from backend_fastapi.schemas.company import CompanyOut
+    from backend_fastapi.schemas.content import ResourceOut, ResumeOut, AnnouncementOut
+    from backend_fastapi.schemas.experience import ExperienceOut
+    from backend_fastapi.schemas.student import StudentOut
+    from backend_fastapi.utils.dependencies import get_current_student, require_admin
+    from backend_fastapi.utils.dashboard_cache import sections as _sections, section_generations
+    from backend_fastapi.routers.analytics import admin_stats
+    from backend_fastapi.routers.drives import DriveOut, open_drives_query, applications_query
+    from backend_fastapi.routers.students import record_activity
+
+router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+
+def _companies(db: Session):
+    return [CompanyOut.model_validate(c) for c in db.query(Company).all()]
+
+
+def _resources(db: Session):
+    rows = db.query(Resource).options(selectinload(Resource.file)).order_by(Resource.created_at.desc()).all()
+    return [ResourceOut.model_validate(r) for r in rows]
+
+
+def _resumes(db: Session):
+    rows = db.query(ResumeSample).options(selectinload(ResumeSample.file)).order_by(ResumeSample.created_at.desc()).all()
+    return [ResumeOut.model_validate(r) for r in rows]
+
+
+def _announcements(db: Session):
+    rows = db.query(Announcement).options(selectinload(Announcement.file)).order_by(Announcement.created_at.desc()).all()
+    return [AnnouncementOut.model_validate(a) for a in rows]
+
+
+def _experiences(db: Session):
+    rows = db.query(InterviewExperience).filter(InterviewExperience.status == "approved").all()
+    return [ExperienceOut.model_validate(e) for e in rows]
+
+
+def _drives(db: Session):
+    query = open_drives_query().order_by(PlacementDrive.deadline, PlacementDrive.id).limit(50)
+    return [DriveOut.model_validate(dict(d)) for d in db.execute(query).mappings()]
+
+
+def _upcoming_drives(db: Session):
+    return db.query(PlacementDrive).filter(PlacementDrive.deadline >= datetime.utcnow()).count()
+
+
+def _admin_stats(db: Session):
+    return admin_stats(db=db)
+
+
+SECTION_LOADERS = {
+    "companies": _companies,
+    "resources": _resources,
+    "resumes": _resumes,
+    "announcements": _announcements,
+    "experiences": _experiences,
+    "drives": _drives,
+    "upcoming_drives": _upcoming_drives,
+    "admin_stats": _admin_stats,
+}
+
+
+def _section(name: str, db: Session, generations: dict):
+    key = (name, generations.get(name, 0))
+    value = _sections.get(key)
+    if value is None:
+        value = jsonable_encoder(SECTION_LOADERS[name](db))
+        _sections.set(key, value)
+    return value
+
+
+@router.get("/student")
+def student_dashboard(current_student: Student = Depends(get_current_student), db: Session = Depends(get_db)):
+    """Everything the student dashboard page shows, in one response."""
+    record_activity(current_student, db)
+    generations = section_generations(db)
+    my_apps = jsonable_encoder(db.execute(applications_query(current_student.id)).mappings().all())
+    my_status = Counter(a["status"] for a in my_apps)
+    return {
+        "profile": jsonable_encoder(StudentOut.model_validate(current_student)),
+        "resources": _section("resources", db, generations),
+        "resumes": _section("resumes", db, generations),
+        "announcements": _section("announcements", db, generations),
+        "companies": _section("companies", db, generations),
+        "experiences": _section("experiences", db, generations),
+        "analytics": {
+            "my_status": [{"label": label, "count": count} for label, count in my_status.items()],
+            "upcoming_drives": _section("upcoming_drives", db, generations),
+        },
+        "drives": _section("drives", db, generations),
+        "my_apps": my_apps,
+    }
+
+
+@router.get("/admin")
+def admin_dashboard(db: Session = Depends(get_db), _=Depends(require_admin)):
+    """Everything the admin dashboard page shows, in one response."""
+    generations = section_generations(db)
+    pending = db.query(InterviewExperience).filter(InterviewExperience.status == "pending").all()
+    return {
+        "pending": jsonable_encoder(pending),
+        "companies": _section("companies", db, generations),
+        "resources": _section("resources", db, generations),
+        "resumes": _section("resumes", db, generations),
+        "announcements": _section("announcements", db, generations),
+        "analytics": _section("admin_stats", db, generations),
+    }
@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..database import get_db
 from ..models import discussion as models
 from ..models.student import Student
 from ..schemas import discussion as schemas
+from ..utils.view_counter import view_counter
 from ..utils.dependencies import get_current_student, get_current_user_id_and_role
 
 router = APIRouter(
@@ -13,6 +15,31 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Column projections used instead of ORM objects so author names come from one join.
+THREAD_COLUMNS = (
+    models.ForumThread.id,
+    models.ForumThread.student_id,
+    models.ForumThread.title,
+    models.ForumThread.content,
+    models.ForumThread.tags,
+    models.ForumThread.views,
+    models.ForumThread.created_at,
+    func.coalesce(Student.name, "Unknown").label("student_name"),
+)
+
+REPLY_COLUMNS = (
+    models.ForumReply.id,
+    models.ForumReply.thread_id,
+    models.ForumReply.student_id,
+    models.ForumReply.admin_id,
+    models.ForumReply.content,
+    models.ForumReply.created_at,
+    case(
+        (models.ForumReply.student_id.is_(None), "Admin"),  # Placeholder for admin replies
+        else_=func.coalesce(Student.name, "Unknown"),
+    ).label("student_name"),
+)
+
 @router.get("/", response_model=List[schemas.ForumThreadOut])
 def get_threads(
     db: Session = Depends(get_db),
@@ -20,23 +47,13 @@ def get_threads(
     limit: int = 20,
     tag: Optional[str] = None
 ):
-    query = db.query(models.ForumThread)
+    query = db.query(*THREAD_COLUMNS).outerjoin(Student, Student.id == models.ForumThread.student_id)
     if tag:
         query = query.filter(models.ForumThread.tags.ilike(f"%{tag}%"))
     
+    # We don't load replies here to keep list lightweight
     threads = query.order_by(models.ForumThread.created_at.desc()).offset(skip).limit(limit).all()
-    
-    # Populate student names manually or via join if we had relationships set up perfectly
-    # For now, simple logic
-    results = []
-    for t in threads:
-        st = db.query(Student).filter(Student.id == t.student_id).first()
-        t.student_name = st.name if st else "Unknown"
-        # We don't load replies here to keep list lightweight
-        t.replies = [] 
-        results.append(t)
-        
-    return results
+    return [dict(t._mapping) for t in threads]
 
 @router.post("/", response_model=schemas.ForumThreadOut)
 def create_thread(
@@ -44,6 +61,8 @@ def create_thread(
     current_student: Student = Depends(get_current_student),
     db: Session = Depends(get_db)
 ):
+    # Read before commit: the commit expires the student and would reload it
+    student_name = current_student.name
     new_thread = models.ForumThread(
         student_id=current_student.id,
         title=thread.title,
@@ -53,36 +72,46 @@ def create_thread(
     db.add(new_thread)
     db.commit()
     db.refresh(new_thread)
-    new_thread.student_name = current_student.name
+    new_thread.student_name = student_name
     return new_thread
 
 @router.get("/{thread_id}", response_model=schemas.ForumThreadOut)
 def get_thread_detail(
     thread_id: int, 
+    after_id: Optional[int] = None,
+    limit: int = Query(50, ge=1, le=200),
     db: Session = Depends(get_db)
 ):
-    # Eager load replies
-    thread = db.query(models.ForumThread).filter(models.ForumThread.id == thread_id).first()
+    thread = (
+        db.query(*THREAD_COLUMNS)
+        .outerjoin(Student, Student.id == models.ForumThread.student_id)
+        .filter(models.ForumThread.id == thread_id)
+        .first()
+    )
     if not thread:
         raise HTTPException(status_code=404, detail="Thread not found")
-        
-    # Increment view count
-    thread.views += 1
-    db.commit()
-    
-    # Get author name
-    st = db.query(Student).filter(Student.id == thread.student_id).first()
-    thread.student_name = st.name if st else "Unknown"
-    
-    # Enhance replies with names
-    for r in thread.replies:
-        if r.student_id:
-            rst = db.query(Student).filter(Student.id == r.student_id).first()
-            r.student_name = rst.name if rst else "Unknown"
-        else:
-            r.student_name = "Admin" # Placeholder for admin replies
-            
-    return thread
+
+    # Count the view in memory; it is written to the DB by the periodic flush
+    views = (thread.views or 0) + view_counter.increment(thread_id)
+
+    # Keyset page of replies: pass the returned next_reply_cursor as after_id
+    replies_query = (
+        db.query(*REPLY_COLUMNS)
+        .outerjoin(Student, Student.id == models.ForumReply.student_id)
+        .filter(models.ForumReply.thread_id == thread_id)
+    )
+    if after_id is not None:
+        replies_query = replies_query.filter(models.ForumReply.id > after_id)
+    replies = replies_query.order_by(models.ForumReply.id).limit(limit + 1).all()
+
+    has_more = len(replies) > limit
+    replies = replies[:limit]
+    return {
+        **thread._mapping,
+        "views": views,
+        "replies": [dict(r._mapping) for r in replies],
+        "next_reply_cursor": replies[-1].id if has_more else None,
+    }
 
 @router.post("/{thread_id}/reply", response_model=schemas.ForumReplyOut)
 def post_reply(
@@ -93,7 +122,12 @@ def post_reply(
 ):
     user_id, role = user_info
     
-    thread = db.query(models.ForumThread).filter(models.ForumThread.id == thread_id).first()
+    # Check the thread and fetch the author's display name in one round-trip
+    if role == 'student':
+        author_name = select(Student.name).where(Student.id == user_id).scalar_subquery()
+    else:
+        author_name = None
+    thread = db.query(models.ForumThread.id, author_name).filter(models.ForumThread.id == thread_id).first()
     if not thread:
         raise HTTPException(status_code=404, detail="Thread not found")
         
@@ -109,8 +143,7 @@ def post_reply(
     
     # Set display name
     if role == 'student':
-        st = db.query(Student).filter(Student.id == user_id).first()
-        new_reply.student_name = st.name if st else "Student"
+        new_reply.student_name = thread[1] or "Student"
     else:
         new_reply.student_name = "Admin"
         
@@ -1,11 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from ..database import get_db
+from ..database import get_db, get_async_db
 from ..models.placement_drive import PlacementDrive
 from ..models.student_application import StudentApplication
-from ..models.student import Student
 from ..models.company import Company
-from ..utils.dependencies import require_admin, get_current_student
+from ..utils.dependencies import require_admin, get_current_student_id
+from ..utils.dashboard_cache import invalidates
 from pydantic import BaseModel
 from datetime import datetime
 from typing import List, Optional
@@ -27,13 +30,60 @@ class DriveOut(DriveCreate):
     status: str
     created_at: datetime
     company_name: str # enriched field
+    application_count: int = 0
 
     class Config:
         orm_mode = True
 
+def open_drives_query():
+    """Open drives with company name and application count, in one statement."""
+    # Correlated count, so it only runs for the rows actually returned
+    application_count = (
+        select(func.count(StudentApplication.id))
+        .where(StudentApplication.drive_id == PlacementDrive.id)
+        .correlate(PlacementDrive)
+        .scalar_subquery()
+    )
+    return (
+        select(
+            PlacementDrive.id,
+            PlacementDrive.company_id,
+            PlacementDrive.batch,
+            PlacementDrive.role,
+            PlacementDrive.description,
+            PlacementDrive.date,
+            PlacementDrive.deadline,
+            PlacementDrive.eligibility_criteria,
+            PlacementDrive.status,
+            PlacementDrive.created_at,
+            func.coalesce(Company.name, "Unknown").label("company_name"),
+            application_count.label("application_count"),
+        )
+        .outerjoin(Company, Company.id == PlacementDrive.company_id)
+        .where(PlacementDrive.status == "open")
+    )
+
+
+def applications_query(student_id: int):
+    """A student's applications joined with their drive and company."""
+    return (
+        select(
+            StudentApplication.id,
+            StudentApplication.status,
+            StudentApplication.applied_at,
+            func.coalesce(Company.name, "Unknown").label("company_name"),
+            func.coalesce(PlacementDrive.role, "Unknown").label("role"),
+            PlacementDrive.date.label("drive_date"),
+        )
+        .outerjoin(PlacementDrive, PlacementDrive.id == StudentApplication.drive_id)
+        .outerjoin(Company, Company.id == PlacementDrive.company_id)
+        .where(StudentApplication.student_id == student_id)
+        .order_by(StudentApplication.id)
+    )
+
 # --- Admin Endpoints ---
 
-@router.post("/", response_model=dict)
+@router.post("/", response_model=dict, dependencies=[Depends(invalidates("drives", "upcoming_drives"))])
 def create_drive(drive: DriveCreate, db: Session = Depends(get_db), _=Depends(require_admin)):
     new_drive = PlacementDrive(**drive.dict())
     db.add(new_drive)
@@ -41,7 +91,7 @@ def create_drive(drive: DriveCreate, db: Session = Depends(get_db), _=Depends(re
     db.refresh(new_drive)
     return {"msg": "created", "id": new_drive.id}
 
-@router.delete("/{drive_id}")
+@router.delete("/{drive_id}", dependencies=[Depends(invalidates("drives", "upcoming_drives"))])
 def delete_drive(drive_id: int, db: Session = Depends(get_db), _=Depends(require_admin)):
     drive = db.query(PlacementDrive).filter(PlacementDrive.id == drive_id).first()
     if not drive:
@@ -53,21 +103,25 @@ def delete_drive(drive_id: int, db: Session = Depends(get_db), _=Depends(require
 # --- Public/Student Endpoints ---
 
 @router.get("/", response_model=List[DriveOut])
-def list_drives(db: Session = Depends(get_db)):
-    drives = db.query(PlacementDrive).filter(PlacementDrive.status == "open").order_by(PlacementDrive.deadline).all()
-    # Enrich with company name
-    results = []
-    for d in drives:
-        d_dict = d.__dict__
-        if d.company:
-            d_dict["company_name"] = d.company.name
-        else:
-            d_dict["company_name"] = "Unknown"
-        results.append(d_dict)
-    return results
+async def list_drives(
+    batch: Optional[int] = None,
+    company_id: Optional[int] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_async_db),
+):
+    query = open_drives_query()
+    if batch is not None:
+        query = query.where(PlacementDrive.batch == batch)
+    if company_id is not None:
+        query = query.where(PlacementDrive.company_id == company_id)
+    query = query.order_by(PlacementDrive.deadline, PlacementDrive.id).offset(skip).limit(limit)
+
+    result = await db.execute(query)
+    return result.mappings().all()
 
 @router.post("/{drive_id}/apply")
-def apply_for_drive(drive_id: int, current_student: Student = Depends(get_current_student), db: Session = Depends(get_db)):
+def apply_for_drive(drive_id: int, student_id: int = Depends(get_current_student_id), db: Session = Depends(get_db)):
     # Check if drive exists and is open
     drive = db.query(PlacementDrive).filter(PlacementDrive.id == drive_id).first()
     if not drive or drive.status != "open":
@@ -78,32 +132,23 @@ def apply_for_drive(drive_id: int, current_student: Student = Depends(get_curren
 
     # Check already applied
     existing = db.query(StudentApplication).filter(
-        StudentApplication.student_id == current_student.id,
+        StudentApplication.student_id == student_id,
         StudentApplication.drive_id == drive_id
     ).first()
     
     if existing:
         raise HTTPException(status_code=400, detail="Already applied")
 
-    app = StudentApplication(student_id=current_student.id, drive_id=drive_id)
+    app = StudentApplication(student_id=student_id, drive_id=drive_id)
     db.add(app)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # A concurrent submit won the unique (student_id, drive_id) key
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Already applied")
     return {"msg": "applied"}
 
 @router.get("/my-applications")
-def my_applications(current_student: Student = Depends(get_current_student), db: Session = Depends(get_db)):
-    apps = db.query(StudentApplication).filter(StudentApplication.student_id == current_student.id).all()
-    # Enrich details
-    results = []
-    for app in apps:
-        drive = app.drive
-        res = {
-            "id": app.id,
-            "status": app.status,
-            "applied_at": app.applied_at,
-            "company_name": drive.company.name if drive and drive.company else "Unknown",
-            "role": drive.role if drive else "Unknown",
-            "drive_date": drive.date if drive else None
-        }
-        results.append(res)
-    return results
+def my_applications(student_id: int = Depends(get_current_student_id), db: Session = Depends(get_db)):
+    return db.execute(applications_query(student_id)).mappings().all()
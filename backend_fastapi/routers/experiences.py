@@ -1,14 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List
 try:
-    from ..database import get_db
+    from ..database import get_db, get_async_db
     from ..models.interview_experience import InterviewExperience
     from ..models.student import Student
     from ..schemas.experience import ExperienceCreate, ExperienceOut
     from ..utils.dependencies import get_current_student
 except Exception:
-    from backend_fastapi.database import get_db
+    from backend_fastapi.database import get_db, get_async_db
     from backend_fastapi.models.interview_experience import InterviewExperience
     from backend_fastapi.models.student import Student
     from backend_fastapi.schemas.experience import ExperienceCreate, ExperienceOut
@@ -30,11 +32,13 @@ def submit_experience(payload: ExperienceCreate, db: Session = Depends(get_db),
     return exp
 
 @router.get("/", response_model=List[ExperienceOut])
-def list_approved_experiences(db: Session = Depends(get_db)):
-    exps = db.query(InterviewExperience).filter(InterviewExperience.status == "approved").all()
-    return exps
+async def list_approved_experiences(db: AsyncSession = Depends(get_async_db)):
+    result = await db.execute(select(InterviewExperience).where(InterviewExperience.status == "approved"))
+    return result.scalars().all()
 
 @router.get("/company/{company_id}", response_model=List[ExperienceOut])
-def list_company_experiences(company_id: int, db: Session = Depends(get_db)):
-    exps = db.query(InterviewExperience).filter(InterviewExperience.company_id == company_id, InterviewExperience.status == "approved").all()
-    return exps
+async def list_company_experiences(company_id: int, db: AsyncSession = Depends(get_async_db)):
+    result = await db.execute(
+        select(InterviewExperience).where(InterviewExperience.company_id == company_id, InterviewExperience.status == "approved")
+    )
+    return result.scalars().all()
@@ -5,9 +5,9 @@ from pydantic import BaseModel
 from datetime import datetime
 from ..database import get_db
 from ..models import discussion as models
-from ..models.student import Student
 from ..models.admin import Admin
-from ..utils.dependencies import get_current_student, get_current_admin_or_student, get_current_user_id_and_role
+from ..utils.view_counter import view_counter
+from ..utils.dependencies import get_current_student_id, get_current_admin_or_student, get_current_user_id_and_role
 
 router = APIRouter(
     prefix="/forum",
@@ -58,14 +58,14 @@ def get_threads(skip: int = 0, limit: int = 20, db: Session = Depends(get_db)):
 @router.post("/", response_model=ThreadOut)
 def create_thread(
     thread: ThreadCreate,
-    current_student: Student = Depends(get_current_student),
+    student_id: int = Depends(get_current_student_id),
     db: Session = Depends(get_db)
 ):
     new_thread = models.ForumThread(
         title=thread.title,
         content=thread.content,
         tags=thread.tags,
-        student_id=current_student.id
+        student_id=student_id
     )
     db.add(new_thread)
     db.commit()
@@ -78,11 +78,9 @@ def get_thread(thread_id: int, db: Session = Depends(get_db)):
     if not thread:
         raise HTTPException(status_code=404, detail="Thread not found")
     
-    # Increment view count
-    thread.views += 1
-    db.commit()
-    
-    return thread
+    # Count the view in memory; it is written to the DB by the periodic flush
+    views = (thread.views or 0) + view_counter.increment(thread_id)
+    return ThreadOut.model_validate(thread, from_attributes=True).model_copy(update={"views": views})
 
 @router.post("/{thread_id}/reply")
 def reply_to_thread(
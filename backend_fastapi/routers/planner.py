@@ -1,12 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from datetime import datetime
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session, joinedload, selectinload
 from typing import List, Optional
-import json
 from ..database import get_db
 from ..models import planner as models
 from ..schemas import planner as schemas
-from ..models.student import Student
-from ..utils.dependencies import get_current_student, require_admin
+from ..utils.dependencies import get_current_student_id, require_admin
+from ..utils import plan_cache
 
 router = APIRouter(
     prefix="/planner",
@@ -18,8 +19,8 @@ router = APIRouter(
 
 @router.get("/plans", response_model=List[schemas.StudyPlanOut])
 def list_available_plans(db: Session = Depends(get_db)):
-    # Return all plans with their tasks
-    return db.query(models.StudyPlan).all()
+    # Return all plans with their tasks (not ones still being streamed)
+    return db.query(models.StudyPlan).filter(models.StudyPlan.status == "ready").all()
 
 @router.delete("/plans/{plan_id}")
 def delete_plan(plan_id: int, db: Session = Depends(get_db)):
@@ -31,28 +32,31 @@ def delete_plan(plan_id: int, db: Session = Depends(get_db)):
     db.query(models.DailyTask).filter(models.DailyTask.plan_id == plan_id).delete()
     db.delete(plan)
     db.commit()
+    plan_cache.forget_plans()
     return {"status": "deleted", "plan_id": plan_id}
 
 @router.get("/my-subscription", response_model=Optional[schemas.SubscriptionOut]) 
 # Fix: The return type annotation might fail if I reference it wrong, let's skip complex annotation for now or fix imports
 # Actually, let's use the schema properly.
 def get_my_subscription(
-    current_student: Student = Depends(get_current_student),
+    student_id: int = Depends(get_current_student_id),
     db: Session = Depends(get_db)
 ):
-    sub = db.query(models.StudentSubscription).filter(
-        models.StudentSubscription.student_id == current_student.id,
+    # Subscription and plan in one joined query, the plan's tasks in one more
+    sub = db.query(models.StudentSubscription).options(
+        joinedload(models.StudentSubscription.plan).selectinload(models.StudyPlan.tasks)
+    ).filter(
+        models.StudentSubscription.student_id == student_id,
         models.StudentSubscription.is_active == True
     ).first()
     
     if not sub:
         return None
-        
-    # Manually attach plan because Pydantic needs it and we might not have lazy load set up perfectly
-    plan = db.query(models.StudyPlan).filter(models.StudyPlan.id == sub.plan_id).first()
     
-    # Parse completed tasks
-    completed_ids = json.loads(sub.completed_tasks) if sub.completed_tasks else []
+    completed_ids = [
+        task_id for (task_id,) in db.query(models.SubscriptionTaskCompletion.task_id)
+        .filter(models.SubscriptionTaskCompletion.subscription_id == sub.id)
+    ]
     
     # Construct response manually or map it
     return {
@@ -62,31 +66,34 @@ def get_my_subscription(
         "start_date": sub.start_date,
         "current_day": sub.current_day,
         "is_active": sub.is_active,
-        "plan": plan,
+        "plan": sub.plan,
         "completed_tasks_list": completed_ids
     }
 
 @router.post("/plans/{plan_id}/subscribe")
 def subscribe_to_plan(
     plan_id: int,
-    current_student: Student = Depends(get_current_student),
+    student_id: int = Depends(get_current_student_id),
     db: Session = Depends(get_db)
 ):
     # Check if plan exists
-    plan = db.query(models.StudyPlan).filter(models.StudyPlan.id == plan_id).first()
+    plan = db.query(models.StudyPlan).filter(
+        models.StudyPlan.id == plan_id,
+        models.StudyPlan.status == "ready"
+    ).first()
     if not plan:
         raise HTTPException(status_code=404, detail="Plan not found")
     
     # Check if already subscribed to this specific plan
     existing = db.query(models.StudentSubscription).filter(
-        models.StudentSubscription.student_id == current_student.id,
+        models.StudentSubscription.student_id == student_id,
         models.StudentSubscription.plan_id == plan_id
     ).first()
     
     if existing:
         # If already subscribed, just activate it and deactivate others
         db.query(models.StudentSubscription).filter(
-            models.StudentSubscription.student_id == current_student.id,
+            models.StudentSubscription.student_id == student_id,
             models.StudentSubscription.id != existing.id
         ).update({"is_active": False})
         existing.is_active = True
@@ -95,12 +102,12 @@ def subscribe_to_plan(
     
     # Deactivate all other subscriptions
     db.query(models.StudentSubscription).filter(
-        models.StudentSubscription.student_id == current_student.id
+        models.StudentSubscription.student_id == student_id
     ).update({"is_active": False})
         
     # Create new subscription (active by default)
     new_sub = models.StudentSubscription(
-        student_id=current_student.id,
+        student_id=student_id,
         plan_id=plan_id
     )
     db.add(new_sub)
@@ -110,69 +117,80 @@ def subscribe_to_plan(
 @router.post("/tasks/{task_id}/complete")
 def complete_task(
     task_id: int,
-    current_student: Student = Depends(get_current_student),
+    student_id: int = Depends(get_current_student_id),
     db: Session = Depends(get_db)
 ):
-    sub = db.query(models.StudentSubscription).filter(
-        models.StudentSubscription.student_id == current_student.id,
+    sub = db.query(models.StudentSubscription.id).filter(
+        models.StudentSubscription.student_id == student_id,
         models.StudentSubscription.is_active == True
     ).first()
     
     if not sub:
         raise HTTPException(status_code=400, detail="No active subscription")
         
-    completed = json.loads(sub.completed_tasks) if sub.completed_tasks else []
+    # The unique (subscription_id, task_id) key makes repeated clicks a no-op
+    db.execute(
+        insert(models.SubscriptionTaskCompletion)
+        .prefix_with("IGNORE", dialect="mysql")
+        .prefix_with("OR IGNORE", dialect="sqlite")
+        .values(subscription_id=sub.id, task_id=task_id)
+    )
+    db.commit()
     
-    if task_id not in completed:
-        completed.append(task_id)
-        sub.completed_tasks = json.dumps(completed)
-        db.commit()
-        
-    return {"status": "success", "completed_count": len(completed)}
+    completed_count = db.query(func.count(models.SubscriptionTaskCompletion.id)).filter(
+        models.SubscriptionTaskCompletion.subscription_id == sub.id
+    ).scalar()
+    return {"status": "success", "completed_count": completed_count}
 
 # --- Multiple Plans Management ---
 
 @router.get("/my-plans")
 def get_all_my_plans(
-    current_student: Student = Depends(get_current_student),
+    student_id: int = Depends(get_current_student_id),
     db: Session = Depends(get_db)
 ):
     """Get all subscriptions for the current student (active and inactive)"""
-    subscriptions = db.query(models.StudentSubscription).filter(
-        models.StudentSubscription.student_id == current_student.id
-    ).all()
-    
-    result = []
-    for sub in subscriptions:
-        plan = db.query(models.StudyPlan).filter(models.StudyPlan.id == sub.plan_id).first()
-        completed_ids = json.loads(sub.completed_tasks) if sub.completed_tasks else []
-        
-        result.append({
-            "subscription_id": sub.id,
-            "plan_id": sub.plan_id,
-            "plan_title": plan.title if plan else "Unknown",
-            "plan_description": plan.description if plan else "",
-            "duration_days": plan.duration_days if plan else 0,
-            "is_active": sub.is_active,
-            "current_day": sub.current_day,
-            "completed_tasks_count": len(completed_ids),
-            "total_tasks": len(plan.tasks) if plan else 0,
-            "start_date": sub.start_date
-        })
-    
-    return result
+    Sub = models.StudentSubscription
+    total_tasks = (
+        select(func.count(models.DailyTask.id))
+        .where(models.DailyTask.plan_id == Sub.plan_id)
+        .scalar_subquery()
+    )
+    completed_tasks = (
+        select(func.count(models.SubscriptionTaskCompletion.id))
+        .where(models.SubscriptionTaskCompletion.subscription_id == Sub.id)
+        .scalar_subquery()
+    )
+    rows = (
+        db.query(
+            Sub.id.label("subscription_id"),
+            Sub.plan_id,
+            func.coalesce(models.StudyPlan.title, "Unknown").label("plan_title"),
+            func.coalesce(models.StudyPlan.description, "").label("plan_description"),
+            func.coalesce(models.StudyPlan.duration_days, 0).label("duration_days"),
+            Sub.is_active,
+            Sub.current_day,
+            completed_tasks.label("completed_tasks_count"),
+            total_tasks.label("total_tasks"),
+            Sub.start_date,
+        )
+        .outerjoin(models.StudyPlan, models.StudyPlan.id == Sub.plan_id)
+        .filter(Sub.student_id == student_id, func.coalesce(models.StudyPlan.status, "ready") == "ready")
+        .all()
+    )
+    return [dict(row._mapping) for row in rows]
 
 @router.post("/subscriptions/{subscription_id}/activate")
 def activate_subscription(
     subscription_id: int,
-    current_student: Student = Depends(get_current_student),
+    student_id: int = Depends(get_current_student_id),
     db: Session = Depends(get_db)
 ):
     """Switch to a different plan by activating it"""
     # Check if subscription belongs to student
     subscription = db.query(models.StudentSubscription).filter(
         models.StudentSubscription.id == subscription_id,
-        models.StudentSubscription.student_id == current_student.id
+        models.StudentSubscription.student_id == student_id
     ).first()
     
     if not subscription:
@@ -180,7 +198,7 @@ def activate_subscription(
     
     # Deactivate all other subscriptions
     db.query(models.StudentSubscription).filter(
-        models.StudentSubscription.student_id == current_student.id,
+        models.StudentSubscription.student_id == student_id,
         models.StudentSubscription.id != subscription_id
     ).update({"is_active": False})
     
@@ -193,13 +211,13 @@ def activate_subscription(
 @router.delete("/subscriptions/{subscription_id}")
 def delete_subscription(
     subscription_id: int,
-    current_student: Student = Depends(get_current_student),
+    student_id: int = Depends(get_current_student_id),
     db: Session = Depends(get_db)
 ):
     """Delete a subscription"""
     subscription = db.query(models.StudentSubscription).filter(
         models.StudentSubscription.id == subscription_id,
-        models.StudentSubscription.student_id == current_student.id
+        models.StudentSubscription.student_id == student_id
     ).first()
     
     if not subscription:
@@ -241,7 +259,13 @@ def seed_plan(db: Session = Depends(get_db)):
 
 # --- AI Routes ---
 
-from ..utils.ai_generator import generate_study_plan_content
+import json
+from fastapi.responses import StreamingResponse
+from ..config import settings
+from ..database import SessionLocal
+from ..utils import plan_jobs
+from ..utils.ai_generator import model_router, stream_study_plan_content
+from ..utils.plan_stream import PlanStreamParser
 from pydantic import BaseModel
 
 class AIPlanRequest(BaseModel):
@@ -249,29 +273,95 @@ class AIPlanRequest(BaseModel):
     duration: int
     difficulty: str
 
-@router.post("/generate", response_model=schemas.StudyPlanOut)
+@router.post("/generate", response_model=schemas.PlanJobOut, status_code=status.HTTP_202_ACCEPTED)
 def generate_study_plan(
     payload: AIPlanRequest,
-    current_student: Student = Depends(get_current_student),
+    response: Response,
+    student_id: int = Depends(get_current_student_id),
     db: Session = Depends(get_db)
 ):
-    try:
-        data = generate_study_plan_content(payload.topic, payload.duration, payload.difficulty)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    
-    # Save to Database
-    plan = models.StudyPlan(
-        title=data.get("title", f"Learn {payload.topic}"),
-        description=data.get("description", ""),
-        duration_days=payload.duration
+    """Queue an AI plan generation; poll GET /planner/jobs/{id} for the result.
+
+    Answers 200 with a finished job when an identical request was already
+    generated (``cached``), and attaches to an in-flight job for the same key
+    instead of calling the model twice.
+    """
+    key = plan_cache.cache_key(payload.topic, payload.duration, payload.difficulty)
+    job = models.PlanGenerationJob(
+        student_id=student_id,
+        topic=payload.topic,
+        duration=payload.duration,
+        difficulty=payload.difficulty,
+        cache_key=key,
+        status="queued"
     )
-    db.add(plan)
+    
+    cached_plan_id = plan_cache.lookup(db, key)
+    if cached_plan_id is not None:
+        job.status = "succeeded"
+        job.plan_id = cached_plan_id
+        job.started_at = job.finished_at = datetime.utcnow()
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        job.cached = True
+        response.status_code = status.HTTP_200_OK
+        return job
+    
+    db.add(job)
     db.commit()
-    db.refresh(plan)
+    db.refresh(job)
+    
+    # An older queued/running job for the same key finishes this one too
+    # (plan_jobs._finish_waiting_jobs). Checked only once this job is committed: a job
+    # finishing after that sees it, and one that finished before is no longer in flight.
+    # Only older jobs count, so of simultaneous identical requests the first always runs.
+    in_flight = db.query(models.PlanGenerationJob.id).filter(
+        models.PlanGenerationJob.cache_key == key,
+        models.PlanGenerationJob.status.in_(["queued", "running"]),
+        models.PlanGenerationJob.id < job.id
+    ).first()
+    if not in_flight:
+        plan_jobs.enqueue(job.id)
+    response.headers["Location"] = f"/planner/jobs/{job.id}"
+    return job
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+def _task_data(task: models.DailyTask) -> dict:
+    return {
+        "day_number": task.day_number,
+        "title": task.title,
+        "description": task.description,
+        "reference_link": task.reference_link,
+    }
+
+def _stream_new_plan(payload: AIPlanRequest, key: str):
+    # The request's session is not meant to outlive the handler, so the stream uses its own
+    db = SessionLocal()
+    parser = PlanStreamParser()
+    plan = None
+    pending = []
+    task_count = 0
+    finished = False
+    fallback_meta = False  # plan was started before the model's title/description arrived
+    
+    def start_plan(title=None, description=None):
+        nonlocal plan, fallback_meta
+        fallback_meta = not title and not description
+        plan = models.StudyPlan(
+            title=title or f"Learn {payload.topic}",
+            description=description or "",
+            duration_days=payload.duration,
+            status="generating"  # hidden from plan lists until the stream finishes
+        )
+        db.add(plan)
+        db.commit()
+        return _sse("plan", {"plan_id": plan.id, "title": plan.title, "description": plan.description, "cached": False})
     
-    tasks = []
-    for t_data in data.get("tasks", []):
+    def add_task(t_data):
+        nonlocal task_count
         task = models.DailyTask(
             plan_id=plan.id,
             day_number=t_data.get("day", 1),
@@ -279,9 +369,118 @@ def generate_study_plan(
             description=t_data.get("description", ""),
             reference_link=t_data.get("link", "")
         )
-        tasks.append(task)
+        pending.append(task)
+        task_count += 1
+        event = _sse("task", _task_data(task))
+        if len(pending) >= settings.PLAN_STREAM_BATCH_SIZE:
+            flush_tasks()
+        return event
+    
+    def flush_tasks():
+        if pending:
+            db.add_all(pending)
+            db.commit()
+            pending.clear()
+    
+    try:
+        for chunk in stream_study_plan_content(payload.topic, payload.duration, payload.difficulty):
+            for kind, data in parser.feed(chunk):
+                if kind == "meta":
+                    yield start_plan(data["title"], data["description"])
+                    continue
+                if plan is None:
+                    yield start_plan()
+                yield add_task(data)
         
-    db.add_all(tasks)
-    db.commit()
+        document = parser.finish()
+        if plan is None:
+            yield start_plan(document.get("title"), document.get("description"))
+        elif fallback_meta:
+            # title/description came after the tasks array
+            plan.title = document.get("title") or plan.title
+            plan.description = document.get("description") or plan.description
+        if parser.tasks_sent == 0:
+            for t_data in document.get("tasks", []):
+                yield add_task(t_data)
+        flush_tasks()
+        plan.status = "ready"
+        plan_cache.store(db, key, plan.id)
+        db.commit()
+        finished = True
+        yield _sse("done", {"plan_id": plan.id, "tasks": task_count})
+    except Exception as e:
+        db.rollback()
+        yield _sse("error", {"detail": str(e)})
+    finally:
+        # Failed or abandoned by the client: drop the partial plan
+        if not finished and plan is not None:
+            db.rollback()
+            db.query(models.DailyTask).filter(models.DailyTask.plan_id == plan.id).delete(synchronize_session=False)
+            db.query(models.StudyPlan).filter(models.StudyPlan.id == plan.id).delete(synchronize_session=False)
+            db.commit()
+        db.close()
+
+@router.post("/generate/stream")
+def generate_study_plan_stream(
+    payload: AIPlanRequest,
+    student_id: int = Depends(get_current_student_id),
+    db: Session = Depends(get_db)
+):
+    """Generate a plan as Server-Sent Events.
+
+    Emits ``plan`` (plan id, title, description), one ``task`` event per task
+    as soon as the model has written it, then ``done`` or ``error``. Tasks are
+    committed in batches of PLAN_STREAM_BATCH_SIZE. Identical earlier
+    requests are replayed from the plan cache.
+    """
+    key = plan_cache.cache_key(payload.topic, payload.duration, payload.difficulty)
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    
+    cached_plan_id = plan_cache.lookup(db, key)
+    if cached_plan_id is not None:
+        plan = db.query(models.StudyPlan).options(selectinload(models.StudyPlan.tasks)).filter(
+            models.StudyPlan.id == cached_plan_id
+        ).first()
+        if plan:
+            events = [_sse("plan", {"plan_id": plan.id, "title": plan.title, "description": plan.description, "cached": True})]
+            events += [_sse("task", _task_data(task)) for task in plan.tasks]
+            events.append(_sse("done", {"plan_id": plan.id, "tasks": len(plan.tasks)}))
+            return StreamingResponse(iter(events), media_type="text/event-stream", headers=headers)
     
-    return plan
+    return StreamingResponse(_stream_new_plan(payload, key), media_type="text/event-stream", headers=headers)
+
+@router.get("/jobs/{job_id}", response_model=schemas.PlanJobOut)
+def get_generation_job(
+    job_id: int,
+    student_id: int = Depends(get_current_student_id),
+    db: Session = Depends(get_db)
+):
+    job = db.query(models.PlanGenerationJob).filter(
+        models.PlanGenerationJob.id == job_id,
+        models.PlanGenerationJob.student_id == student_id
+    ).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@router.delete("/cache", dependencies=[Depends(require_admin)])
+def purge_plan_cache(
+    topic: Optional[str] = None,
+    duration: Optional[int] = None,
+    difficulty: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """Forget cached plans: one (topic, duration, difficulty) entry, or all of them."""
+    if topic is None and duration is None and difficulty is None:
+        key = None
+    elif topic is None or duration is None or difficulty is None:
+        raise HTTPException(status_code=400, detail="Provide topic, duration and difficulty, or none of them")
+    else:
+        key = plan_cache.cache_key(topic, duration, difficulty)
+    removed = plan_cache.purge(db, key)
+    return {"status": "purged", "entries": removed}
+
+@router.get("/ai/models", dependencies=[Depends(require_admin)])
+def ai_model_metrics():
+    """Per-model call counts, latency, errors and circuit state (this worker only)."""
+    return model_router.metrics()
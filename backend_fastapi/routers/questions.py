@@ -4,8 +4,7 @@ from typing import List, Optional
 from ..database import get_db
 from ..models import question as models
 from ..schemas import question as schemas
-from ..utils.dependencies import get_current_student as get_current_active_student, require_admin as get_current_admin
-from ..models.student import Student
+from ..utils.dependencies import get_current_student_id as get_current_active_student_id, require_admin as get_current_admin
 
 router = APIRouter(
     prefix="/questions",
@@ -44,18 +43,18 @@ def get_question(question_id: int, db: Session = Depends(get_db)):
 @router.get("/{question_id}/progress", response_model=schemas.UserProgressOut)
 def get_question_progress(
     question_id: int,
-    current_student: Student = Depends(get_current_active_student),
+    student_id: int = Depends(get_current_active_student_id),
     db: Session = Depends(get_db)
 ):
     progress = db.query(models.UserProgress).filter(
         models.UserProgress.question_id == question_id,
-        models.UserProgress.student_id == current_student.id
+        models.UserProgress.student_id == student_id
     ).first()
     
     if not progress:
         # Return empty progress or default
         return schemas.UserProgressOut(
-            id=0, student_id=current_student.id, question_id=question_id, 
+            id=0, student_id=student_id, question_id=question_id, 
             status="NOT_STARTED", updated_at=None
         )
     return progress
@@ -64,7 +63,7 @@ def get_question_progress(
 def update_progress(
     question_id: int,
     progress_data: schemas.UserProgressUpdate,
-    current_student: Student = Depends(get_current_active_student),
+    student_id: int = Depends(get_current_active_student_id),
     db: Session = Depends(get_db)
 ):
     # Check if question exists
@@ -74,12 +73,12 @@ def update_progress(
         
     progress = db.query(models.UserProgress).filter(
         models.UserProgress.question_id == question_id,
-        models.UserProgress.student_id == current_student.id
+        models.UserProgress.student_id == student_id
     ).first()
     
     if not progress:
         progress = models.UserProgress(
-            student_id=current_student.id,
+            student_id=student_id,
             question_id=question_id,
             status=progress_data.status,
             submission_code=progress_data.submission_code,
@@ -1,30 +1,40 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from datetime import timedelta, datetime
 try:
-	from ..database import get_db
+	from ..database import get_db, get_async_db, AsyncSessionLocal
 	from ..models.student import Student
 	from ..schemas.student import StudentRegister, StudentLogin, StudentOut
 	from ..schemas.auth import Token
-	from ..utils.hashing import hash_password, verify_password
+	from ..utils.hashing import hash_password_async, verify_password_async, needs_rehash
 	from ..utils.jwt_handler import create_access_token
-	from ..utils.dependencies import get_current_student
+	from ..utils.dependencies import get_current_student, invalidate_student
 	from ..config import settings
 except Exception:
-	from backend_fastapi.database import get_db
+	from backend_fastapi.database import get_db, get_async_db, AsyncSessionLocal
 	from backend_fastapi.models.student import Student
 	from backend_fastapi.schemas.student import StudentRegister, StudentLogin, StudentOut
 	from backend_fastapi.schemas.auth import Token
-	from backend_fastapi.utils.hashing import hash_password, verify_password
+	from backend_fastapi.utils.hashing import hash_password_async, verify_password_async, needs_rehash
 	from backend_fastapi.utils.jwt_handler import create_access_token
-	from backend_fastapi.utils.dependencies import get_current_student
+	from backend_fastapi.utils.dependencies import get_current_student, invalidate_student
 	from backend_fastapi.config import settings
 
 router = APIRouter(prefix="/students", tags=["students"])
 
+async def _rehash_password(student_id: int, password: str):
+	"""Background task: store the password hashed with the current scheme/rounds."""
+	password_hash = await hash_password_async(password)
+	async with AsyncSessionLocal() as db:
+		await db.execute(update(Student).where(Student.id == student_id).values(password_hash=password_hash))
+		await db.commit()
+	invalidate_student(student_id)
+
 @router.post("/register", response_model=StudentOut)
-def register_student(payload: StudentRegister, db: Session = Depends(get_db)):
-	existing = db.query(Student).filter(Student.email == payload.email).first()
+async def register_student(payload: StudentRegister, db: AsyncSession = Depends(get_async_db)):
+	existing = (await db.execute(select(Student.id).where(Student.email == payload.email))).first()
 	if existing:
 		raise HTTPException(status_code=400, detail="Email already registered")
 	student = Student(
@@ -32,26 +42,30 @@ def register_student(payload: StudentRegister, db: Session = Depends(get_db)):
 		email=payload.email,
 		department=payload.department,
 		batch=payload.batch,
-		password_hash=hash_password(payload.password)
+		password_hash=await hash_password_async(payload.password)
 	)
 	db.add(student)
-	db.commit()
-	db.refresh(student)
+	await db.commit()
+	await db.refresh(student)
 	return student
 
 @router.post("/login", response_model=Token)
-def student_login(payload: StudentLogin, db: Session = Depends(get_db)):
-	student = db.query(Student).filter(Student.email == payload.email).first()
-	if not student or not verify_password(payload.password, student.password_hash):
+async def student_login(payload: StudentLogin, background_tasks: BackgroundTasks, db: AsyncSession = Depends(get_async_db)):
+	result = await db.execute(
+		select(Student.id, Student.email, Student.password_hash).where(Student.email == payload.email)
+	)
+	student = result.first()
+	if not student or not await verify_password_async(payload.password, student.password_hash):
 		raise HTTPException(status_code=401, detail="Invalid credentials")
+	if needs_rehash(student.password_hash):
+		background_tasks.add_task(_rehash_password, student.id, payload.password)
 	expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 	token = create_access_token({"sub": student.email, "role": "student", "sid": student.id}, expires)
 	return {"access_token": token, "token_type": "bearer"}
 
 
-@router.get("/me", response_model=StudentOut)
-def student_me(current_student: Student = Depends(get_current_student), db: Session = Depends(get_db)):
-    # Update Streak Logic
+def record_activity(current_student: Student, db: Session):
+    """Update the student's daily streak (at most one write per day)."""
     today = datetime.now().date()
     yesterday = today - timedelta(days=1)
 
@@ -81,7 +95,10 @@ def student_me(current_student: Student = Depends(get_current_student), db: Sess
         current_student.last_active_date = datetime.now()
         db.commit()
         db.refresh(current_student)
-
-    return current_student
+        invalidate_student(current_student.id)
 
 
+@router.get("/me", response_model=StudentOut)
+def student_me(current_student: Student = Depends(get_current_student), db: Session = Depends(get_db)):
+    record_activity(current_student, db)
+    return current_student
@@ -35,6 +35,7 @@ class ForumThreadOut(ForumThreadBase):
     created_at: datetime
     replies: List[ForumReplyOut] = []
     student_name: Optional[str] = None
+    next_reply_cursor: Optional[int] = None  # pass as after_id to fetch the next page of replies
 
     class Config:
         from_attributes = True
@@ -11,6 +11,7 @@ class FileStorageBase(BaseModel):
     mime_type: str
     entity_type: str
     entity_id: Optional[int] = None
+    content_hash: Optional[str] = None
 
 class FileStorageCreate(FileStorageBase):
     pass
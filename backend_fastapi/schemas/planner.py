@@ -47,3 +47,19 @@ class SubscriptionOut(BaseModel):
 
     class Config:
         from_attributes = True
+
+class PlanJobOut(BaseModel):
+    id: int
+    status: str # queued, running, succeeded, failed
+    topic: str
+    duration: int
+    difficulty: str
+    plan_id: Optional[int] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    cached: bool = False # True when an identical earlier request's plan was reused
+
+    class Config:
+        from_attributes = True
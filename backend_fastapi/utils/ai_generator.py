@@ -1,39 +1,104 @@
 import google.generativeai as genai
 import json
 import logging
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from ..config import settings
 
 logger = logging.getLogger(__name__)
 
+# Use models that are confirmed to work with generateContent, in order of preference
+MODEL_NAMES = [
+    'models/gemini-flash-latest',      # Latest flash (alias)
+    'models/gemini-pro-latest',        # Latest pro (alias)
+    'models/gemini-2.0-flash-exp',     # Experimental flash
+    'models/gemini-exp-1206',          # Experimental model
+]
+
+_configured_key = None
+_configure_lock = threading.Lock()
+
 def configure_genai():
+    """Configure the Gemini SDK once per process (again only if the key changes)."""
+    global _configured_key
+    if settings.AI_BACKEND == "fake":
+        return True
     if not settings.GEMINI_API_KEY:
         logger.warning("GEMINI_API_KEY is not set. AI features will not work.")
         return False
-    genai.configure(api_key=settings.GEMINI_API_KEY)
+    with _configure_lock:
+        if _configured_key != settings.GEMINI_API_KEY:
+            genai.configure(api_key=settings.GEMINI_API_KEY)
+            _configured_key = settings.GEMINI_API_KEY
     return True
 
-def generate_study_plan_content(topic: str, duration_days: int, difficulty: str = "Beginner") -> dict:
-    """
-    Generates a structured study plan using Gemini AI.
-    Returns a dictionary matching the StudyPlan schema structure.
+
+class FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeModel:
+    """Offline stand-in for genai.GenerativeModel, selected with AI_BACKEND=fake.
+
+    Answers the study-plan prompt with a deterministic plan after
+    AI_FAKE_LATENCY seconds, so generation can be exercised without an API key.
     """
-    if not configure_genai():
-        raise Exception("API Key not configured")
+    _PROMPT = re.compile(r'Create a detailed (\d+)-day structured learning roadmap for "(.*?)" at a "(.*?)" level')
 
-    # Use models that are confirmed to work with generateContent
-    model_names = [
-        'models/gemini-flash-latest',      # Latest flash (alias)
-        'models/gemini-pro-latest',        # Latest pro (alias)
-        'models/gemini-2.0-flash-exp',     # Experimental flash
-        'models/gemini-exp-1206',          # Experimental model
-    ]
-    
-    last_error = None
-    for model_name in model_names:
-        try:
-            model = genai.GenerativeModel(model_name)
-            
-            prompt = f"""
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+
+    def generate_content(self, prompt: str, stream: bool = False):
+        if self.model_name in settings.AI_FAKE_FAILING_MODELS.split(","):
+            raise RuntimeError(f"{self.model_name} is unavailable (AI_FAKE_FAILING_MODELS)")
+        if settings.AI_FAKE_LATENCY and not stream:
+            time.sleep(settings.AI_FAKE_LATENCY)
+        match = self._PROMPT.search(prompt)
+        days, topic, difficulty = (int(match.group(1)), match.group(2), match.group(3)) if match else (1, "Topic", "Beginner")
+        text = json.dumps({
+            "title": f"{topic} Mastery Roadmap",
+            "description": f"A {days}-day {difficulty.lower()} roadmap for {topic}.",
+            "tasks": [
+                {
+                    "day": day,
+                    "title": f"{topic}: part {day}",
+                    "description": f"Study and practice part {day} of {topic}.",
+                    "link": "https://example.com/",
+                }
+                for day in range(1, days + 1)
+            ],
+        })
+        if stream:
+            return self._stream(text)
+        return FakeResponse(text)
+
+    def _stream(self, text: str, chunk_size: int = 64):
+        # The simulated latency is spread over the chunks, like a real token stream
+        chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+        for chunk in chunks:
+            if settings.AI_FAKE_LATENCY:
+                time.sleep(settings.AI_FAKE_LATENCY / len(chunks))
+            yield FakeResponse(chunk)
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+def get_model(model_name: str):
+    """Configured model client, built once per process and reused."""
+    with _clients_lock:
+        client = _clients.get((settings.AI_BACKEND, model_name))
+        if client is None:
+            client = FakeModel(model_name) if settings.AI_BACKEND == "fake" else genai.GenerativeModel(model_name)
+            _clients[(settings.AI_BACKEND, model_name)] = client
+        return client
+
+
+def build_study_plan_prompt(topic: str, duration_days: int, difficulty: str) -> str:
+    return f"""
     Create a detailed {duration_days}-day structured learning roadmap for "{topic}" at a "{difficulty}" level.
     This should be a professional study plan with clear daily learning objectives.
     
@@ -63,22 +128,219 @@ def generate_study_plan_content(topic: str, duration_days: int, difficulty: str
     
     Do not wrap the JSON in markdown code blocks. Just return the raw JSON.
     """
-            
-            response = model.generate_content(prompt)
-            text = response.text.strip()
-            # Cleanup in case the model wraps code in ```json ... ```
-            if text.startswith("```"):
-                text = text.replace("```json", "").replace("```", "").strip()
-                
-            data = json.loads(text)
-            logger.info(f"Successfully used model: {model_name}")
-            return data
-            
+
+
+def parse_plan_json(text: str) -> dict:
+    text = text.strip()
+    # Cleanup in case the model wraps code in ```json ... ```
+    if text.startswith("```"):
+        text = text.replace("```json", "").replace("```", "").strip()
+    return json.loads(text)
+
+
+class CircuitBreaker:
+    """Stops routing to a model after repeated failures.
+
+    closed -> open after ``failure_threshold`` consecutive failures; after
+    ``reset_timeout`` seconds one trial call is let through (half-open) and
+    its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = "half_open"
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+
+class ModelStats:
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.wins = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.last_error = None
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, error: Exception = None):
+        with self._lock:
+            self.calls += 1
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+            if error is not None:
+                self.errors += 1
+                self.last_error = str(error)
+
+    def record_win(self):
+        with self._lock:
+            self.wins += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "wins": self.wins,
+                "avg_latency_ms": round(self.total_latency / self.calls * 1000, 1) if self.calls else None,
+                "max_latency_ms": round(self.max_latency * 1000, 1),
+                "last_error": self.last_error,
+            }
+
+
+class ModelRouter:
+    """Sends a prompt to the first healthy model, skipping models whose circuit is open.
+
+    With AI_HEDGE_AFTER > 0, a call still running after that many seconds gets
+    a second model fired alongside it and the first good answer wins; a
+    failed call immediately hands over to the next healthy model.
+    """
+
+    def __init__(self, model_names):
+        self.model_names = list(model_names)
+        self.breakers = {
+            name: CircuitBreaker(settings.AI_BREAKER_FAILURES, settings.AI_BREAKER_COOLDOWN)
+            for name in self.model_names
+        }
+        self.stats = {name: ModelStats() for name in self.model_names}
+        self._pool = ThreadPoolExecutor(max_workers=max(2, len(self.model_names)) * 2, thread_name_prefix="ai-call")
+
+    def _call(self, model_name: str, prompt: str) -> dict:
+        start = time.monotonic()
+        try:
+            data = parse_plan_json(get_model(model_name).generate_content(prompt).text)
         except Exception as e:
-            last_error = e
+            self.stats[model_name].record(time.monotonic() - start, e)
+            self.breakers[model_name].record_failure()
             logger.warning(f"Model {model_name} failed: {e}")
-            continue
-    
-    # If all models failed, raise the last error
-    logger.error(f"All models failed. Last error: {last_error}")
-    raise last_error
+            raise
+        self.stats[model_name].record(time.monotonic() - start)
+        self.breakers[model_name].record_success()
+        return data
+
+    def generate(self, prompt: str):
+        """Return (parsed JSON, model name) from the first model that answers."""
+        candidates = (name for name in self.model_names if self.breakers[name].allow())
+        pending = {}
+        last_error = None
+
+        def launch():
+            name = next(candidates, None)
+            if name is not None:
+                pending[self._pool.submit(self._call, name, prompt)] = name
+            return name is not None
+
+        if not launch():
+            raise Exception("No AI model available: every model's circuit is open")
+        hedge_after = settings.AI_HEDGE_AFTER if settings.AI_HEDGE_AFTER > 0 else None
+        while pending:
+            hedging = hedge_after is not None and len(pending) < 2
+            done, _ = wait(pending, timeout=hedge_after if hedging else None, return_when=FIRST_COMPLETED)
+            if not done:
+                launch()  # the call is slow: race the next model against it
+                continue
+            for future in done:
+                name = pending.pop(future)
+                try:
+                    data = future.result()
+                except Exception as e:
+                    last_error = e
+                    launch()
+                    continue
+                self.stats[name].record_win()
+                return data, name
+        raise last_error
+
+    def stream(self, prompt: str):
+        """Yield text chunks from the first healthy model that starts answering.
+
+        Streams are not hedged; a model that fails before its first chunk hands
+        over to the next one, a failure mid-stream is raised to the caller.
+        """
+        last_error = None
+        for name in self.model_names:
+            if not self.breakers[name].allow():
+                continue
+            start = time.monotonic()
+            started = False
+            try:
+                for chunk in get_model(name).generate_content(prompt, stream=True):
+                    if chunk.text:
+                        started = True
+                        yield chunk.text
+            except GeneratorExit:
+                # The caller stopped reading (e.g. the SSE client left) after the
+                # model had answered: count that as a success so a half-open
+                # trial call still closes the circuit.
+                self.stats[name].record(time.monotonic() - start)
+                self.breakers[name].record_success()
+                raise
+            except Exception as e:
+                self.stats[name].record(time.monotonic() - start, e)
+                self.breakers[name].record_failure()
+                logger.warning(f"Model {name} failed while streaming: {e}")
+                if started:
+                    raise
+                last_error = e
+                continue
+            self.stats[name].record(time.monotonic() - start)
+            self.breakers[name].record_success()
+            self.stats[name].record_win()
+            return
+        raise last_error or Exception("No AI model available: every model's circuit is open")
+
+    def metrics(self) -> dict:
+        return {
+            name: {"circuit": self.breakers[name].state, **self.stats[name].snapshot()}
+            for name in self.model_names
+        }
+
+
+model_router = ModelRouter(MODEL_NAMES)
+
+
+def generate_study_plan_content(topic: str, duration_days: int, difficulty: str = "Beginner") -> dict:
+    """
+    Generates a structured study plan using Gemini AI.
+    Returns a dictionary matching the StudyPlan schema structure.
+    """
+    if not configure_genai():
+        raise Exception("API Key not configured")
+
+    try:
+        data, model_name = model_router.generate(build_study_plan_prompt(topic, duration_days, difficulty))
+    except Exception as e:
+        logger.error(f"All models failed. Last error: {e}")
+        raise
+    logger.info(f"Successfully used model: {model_name}")
+    return data
+
+
+def stream_study_plan_content(topic: str, duration_days: int, difficulty: str = "Beginner"):
+    """Like generate_study_plan_content, but yields the raw JSON text as the model produces it."""
+    if not configure_genai():
+        raise Exception("API Key not configured")
+    return model_router.stream(build_study_plan_prompt(topic, duration_days, difficulty))
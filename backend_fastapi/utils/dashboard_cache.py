@@ -0,0 +1,70 @@
+from fastapi import Response
+from sqlalchemy import insert, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+try:
+    from ..config import settings
+    from ..database import engine
+    from ..models.cache_generation import CacheGeneration
+    from .ttl_cache import TTLCache
+except Exception:
+    from backend_fastapi.config import settings
+    from backend_fastapi.database import engine
+    from backend_fastapi.models.cache_generation import CacheGeneration
+    from backend_fastapi.utils.ttl_cache import TTLCache
+
+# Names the frontend's response cache understands; other names only affect /dashboard.
+INVALIDATE_HEADER = "X-Cache-Invalidate"
+
+# /dashboard sections that look the same for every user, stored already JSON-encoded.
+# Each worker keeps its own copy, keyed by (name, generation): the generations live
+# in the cache_generations table, so a change made through any worker reaches all of them.
+sections = TTLCache(maxsize=64, ttl=settings.DASHBOARD_CACHE_TTL)
+_generations = CacheGeneration.__table__
+
+
+def section_generations(db) -> dict:
+    """Current generation of every section that was ever invalidated (others are 0)."""
+    return dict(db.execute(select(_generations.c.name, _generations.c.generation)).all())
+
+
+def _bump(connection, name: str):
+    values = {"name": name, "generation": 1}
+    if connection.dialect.name == "mysql":
+        stmt = mysql_insert(_generations).values(**values).on_duplicate_key_update(generation=_generations.c.generation + 1)
+    elif connection.dialect.name == "sqlite":
+        stmt = sqlite_insert(_generations).values(**values).on_conflict_do_update(
+            index_elements=[_generations.c.name], set_={"generation": _generations.c.generation + 1}
+        )
+    else:
+        bumped = connection.execute(
+            update(_generations).where(_generations.c.name == name).values(generation=_generations.c.generation + 1)
+        )
+        if bumped.rowcount:
+            return
+        stmt = insert(_generations).values(**values)
+    connection.execute(stmt)
+
+
+def invalidate_dashboard(*names: str):
+    """Make the named sections stale in every worker after a change."""
+    with engine.begin() as conn:
+        for name in names:
+            _bump(conn, name)
+
+
+def invalidates(*names: str):
+    """Route dependency for admin mutations of shared content.
+
+    Bumps the named /dashboard sections' generations once the route has run,
+    and lists them in the X-Cache-Invalidate response header so clients that
+    cache the same content (the Flask frontend) can drop their copies too.
+    """
+    def dependency(response: Response):
+        response.headers[INVALIDATE_HEADER] = ",".join(names)
+        try:
+            yield
+        finally:
+            # also on errors: a failed commit can leave a partial change, and a miss is cheap
+            invalidate_dashboard(*names)
+    return dependency
@@ -1,14 +1,23 @@
 from fastapi import Header, HTTPException, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
 try:
+    from ..config import settings
     from ..database import get_db
     from .jwt_handler import verify_token
+    from .ttl_cache import TTLCache
     from ..models.student import Student
 except Exception:
+    from backend_fastapi.config import settings
     from backend_fastapi.database import get_db
     from backend_fastapi.utils.jwt_handler import verify_token
+    from backend_fastapi.utils.ttl_cache import TTLCache
     from backend_fastapi.models.student import Student
 
+# Column values of recently authenticated students, per worker
+_student_rows = TTLCache(settings.STUDENT_CACHE_SIZE, settings.STUDENT_CACHE_TTL)
+_STUDENT_COLUMNS = [attr.key for attr in inspect(Student).column_attrs]
+
 
 def require_admin(authorization: str = Header(None)):
     """Validate admin JWT from Authorization header and return its payload."""
@@ -23,22 +32,42 @@ def require_admin(authorization: str = Header(None)):
     return payload
 
 
-def get_current_student(
-    authorization: str = Header(None),
-    db: Session = Depends(get_db),
-):
-    """Return the authenticated student instance using the bearer token."""
+def get_current_student_id(authorization: str = Header(None)) -> int:
+    """Return the student id from the signed ``sid`` claim, without touching the database."""
     if not authorization:
         raise HTTPException(status_code=401, detail="Student authentication required")
     token = authorization.split(" ")[1] if " " in authorization else authorization
     payload = verify_token(token)
     if not payload or payload.get("role") != "student":
         raise HTTPException(status_code=403, detail="Student privileges required")
-    student = db.query(Student).filter(Student.id == payload.get("sid")).first()
+    return payload.get("sid")
+
+
+def get_current_student(
+    student_id: int = Depends(get_current_student_id),
+    db: Session = Depends(get_db),
+):
+    """Return the authenticated student instance using the bearer token.
+
+    Served from a short-lived per-worker row cache when possible; the cached
+    instance is attached to ``db``, so changes to it are saved as usual.
+    """
+    cached = _student_rows.get(student_id)
+    if cached is not None:
+        student = Student(**cached)
+        make_transient_to_detached(student)
+        return db.merge(student, load=False)
+    student = db.query(Student).filter(Student.id == student_id).first()
     if not student:
         raise HTTPException(status_code=404, detail="Student record not found")
+    _student_rows.set(student_id, {key: getattr(student, key) for key in _STUDENT_COLUMNS})
     return student
 
+
+def invalidate_student(student_id: int):
+    """Drop a student's cached row after changing it (this worker only; others expire by TTL)."""
+    _student_rows.pop(student_id)
+
 def get_current_user_id_and_role(authorization: str = Header(None)):
     """
     Return (user_id, role) tuple.
@@ -1,13 +1,18 @@
+import asyncio
+import hashlib
 import os
-import uuid
 from typing import List, Optional
 from fastapi import UploadFile, HTTPException
 from pathlib import Path
 import magic  # python-magic library for MIME type detection
+try:
+    from .storage import storage
+except Exception:
+    from backend_fastapi.utils.storage import storage
 
 # Configuration
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
-UPLOAD_DIR = "uploads"
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # bytes read (and held in memory) per step; MIME sniffing sees the first one
 ALLOWED_EXTENSIONS = {
     # Documents
     '.pdf': 'application/pdf',
@@ -36,56 +41,53 @@ def is_valid_file_type(filename: str, content_type: str) -> bool:
     return ext in ALLOWED_EXTENSIONS and content_type in ALLOWED_EXTENSIONS.values()
 
 async def save_upload_file(upload_file: UploadFile, entity_type: str, entity_id: Optional[int] = None) -> dict:
+    """Validate an upload and store its content once per SHA-256 (utils/storage.py).
+
+    The upload is read in chunks, enforcing MAX_FILE_SIZE as it goes, and
+    the MIME type is sniffed from the first chunk only. The body is written
+    to storage only when no blob with the same hash exists yet; the
+    FileStorage row built from the returned dict takes a reference to it.
+    Hashing, storage I/O and libmagic run in worker threads, off the event loop.
+    """
     if not upload_file.filename:
         raise HTTPException(status_code=400, detail="No filename provided")
-    
-    # Check file size
-    file_size = 0
-    content = await upload_file.read()
-    file_size = len(content)
-    if file_size > MAX_FILE_SIZE:
-        raise HTTPException(status_code=400, detail=f"File size exceeds maximum limit of {MAX_FILE_SIZE/1024/1024}MB")
-    
-    # Reset file pointer
-    await upload_file.seek(0)
+    too_large = HTTPException(status_code=400, detail=f"File size exceeds maximum limit of {MAX_FILE_SIZE/1024/1024}MB")
+    if upload_file.size is not None and upload_file.size > MAX_FILE_SIZE:
+        raise too_large
     
     # Detect MIME type
-    mime = magic.Magic(mime=True)
-    mime_type = mime.from_buffer(content)
+    chunk = await upload_file.read(UPLOAD_CHUNK_SIZE)
+    mime_type = await asyncio.to_thread(magic.from_buffer, chunk, mime=True)
     
     if not is_valid_file_type(upload_file.filename, mime_type):
         raise HTTPException(status_code=400, detail="Invalid file type")
     
-    # Create unique filename
-    ext = get_file_extension(upload_file.filename)
-    unique_filename = f"{uuid.uuid4()}{ext}"
-    
-    # Ensure upload directory exists
-    entity_dir = os.path.join(UPLOAD_DIR, entity_type)
-    if entity_id:
-        entity_dir = os.path.join(entity_dir, str(entity_id))
-    os.makedirs(entity_dir, exist_ok=True)
+    # Hash the content
+    hasher = hashlib.sha256()
+    file_size = 0
+    while chunk:
+        file_size += len(chunk)
+        if file_size > MAX_FILE_SIZE:
+            raise too_large
+        await asyncio.to_thread(hasher.update, chunk)
+        chunk = await upload_file.read(UPLOAD_CHUNK_SIZE)
+    content_hash = hasher.hexdigest()
     
-    # Save file
-    file_path = os.path.join(entity_dir, unique_filename)
-    with open(file_path, "wb") as f:
-        f.write(content)
+    # Save file, unless the same content is already stored
+    if not await asyncio.to_thread(storage.exists, content_hash):
+        await upload_file.seek(0)
+        await asyncio.to_thread(storage.put, content_hash, upload_file.file)
     
+    ext = get_file_extension(upload_file.filename)
     return {
-        "filename": unique_filename,
+        "filename": f"{content_hash}{ext}",
         "original_filename": upload_file.filename,
-        "file_path": file_path,
+        "file_path": storage.location(content_hash),
         "file_type": ext,
         "file_size": file_size,
         "mime_type": mime_type,
         "entity_type": entity_type,
-        "entity_id": entity_id
+        "entity_id": entity_id,
+        "content_hash": content_hash,
+        "upload": upload_file.file
     }
-
-async def delete_file(file_path: str):
-    """Delete a file from the upload directory"""
-    try:
-        os.remove(file_path)
-    except OSError:
-        # Log error but don't raise exception
-        pass
\ No newline at end of file
@@ -1,4 +1,13 @@
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from passlib.context import CryptContext
+try:
+    from ..config import settings
+except Exception:
+    from backend_fastapi.config import settings
 
 # Use pbkdf2_sha256 as primary scheme - more reliable and no 72-byte limit
 # This avoids bcrypt initialization issues while maintaining security
@@ -7,6 +16,7 @@ pwd_context = CryptContext(
     default="pbkdf2_sha256",
     deprecated="auto",
     pbkdf2_sha256__default_rounds=29000,  # Secure default rounds
+    pbkdf2_sha256__min_rounds=29000,  # older, cheaper hashes are upgraded on login (needs_rehash)
 )
 
 def hash_password(password: str) -> str:
@@ -30,3 +40,95 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return pwd_context.verify(plain_password, hashed_password)
     except Exception:
         return False
+
+def needs_rehash(hashed_password: str) -> bool:
+    """True when a stored hash uses a deprecated scheme or outdated rounds."""
+    try:
+        return pwd_context.needs_update(hashed_password)
+    except Exception:
+        return False
+
+
+# --- Async wrappers ---
+# Hashing is CPU-bound and holds the GIL, so the async wrappers run it in a
+# process pool (HASH_WORKERS processes per API worker; 0 uses the default
+# thread pool instead). HASH_MAX_CONCURRENCY bounds how many hashes are in
+# flight; further callers wait their turn and are counted in the stats.
+
+_pool = None
+_semaphore = None
+_stats = {"in_flight": 0, "waiting": 0, "completed": 0, "failed": 0, "max_waiting": 0, "total_wait": 0.0, "max_wait": 0.0}
+
+
+def _get_pool():
+    global _pool
+    if settings.HASH_WORKERS <= 0:
+        return None
+    if _pool is None:
+        # spawn: forking a process that already runs the event loop and DB pools is unsafe
+        _pool = ProcessPoolExecutor(max_workers=settings.HASH_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    return _pool
+
+
+async def _run_bounded(fn, *args):
+    global _semaphore, _pool
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(settings.HASH_MAX_CONCURRENCY)
+    queued_at = time.monotonic()
+    _stats["waiting"] += 1
+    _stats["max_waiting"] = max(_stats["max_waiting"], _stats["waiting"])
+    try:
+        await _semaphore.acquire()
+    finally:
+        _stats["waiting"] -= 1
+    waited = time.monotonic() - queued_at
+    _stats["total_wait"] += waited
+    _stats["max_wait"] = max(_stats["max_wait"], waited)
+    _stats["in_flight"] += 1
+    try:
+        result = await asyncio.get_running_loop().run_in_executor(_get_pool(), fn, *args)
+    except BaseException as e:
+        if isinstance(e, BrokenProcessPool):
+            _pool = None  # a worker died; start a fresh pool on the next call
+        _stats["failed"] += 1
+        raise
+    finally:
+        _stats["in_flight"] -= 1
+        _semaphore.release()
+    _stats["completed"] += 1
+    return result
+
+
+async def hash_password_async(password: str) -> str:
+    if not password:
+        raise ValueError("Password cannot be empty")
+    return await _run_bounded(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    if not plain_password or not hashed_password:
+        return False
+    return await _run_bounded(verify_password, plain_password, hashed_password)
+
+
+def get_hashing_stats() -> dict:
+    completed = _stats["completed"]
+    started = completed + _stats["failed"]  # every call that got a slot added its wait to total_wait
+    return {
+        "workers": settings.HASH_WORKERS,
+        "max_concurrency": settings.HASH_MAX_CONCURRENCY,
+        "in_flight": _stats["in_flight"],
+        "waiting": _stats["waiting"],
+        "max_waiting": _stats["max_waiting"],
+        "completed": completed,
+        "failed": _stats["failed"],
+        "avg_wait_ms": round(_stats["total_wait"] / started * 1000, 2) if started else 0.0,
+        "max_wait_ms": round(_stats["max_wait"] * 1000, 2),
+    }
+
+
+def shutdown_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
@@ -1,13 +1,20 @@
+import hashlib
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import jwt
 try:
     from ..config import settings
+    from .ttl_cache import TTLCache
 except Exception:
     from backend_fastapi.config import settings
+    from backend_fastapi.utils.ttl_cache import TTLCache
 
 ALGORITHM = "HS256"
 
+# Verified payloads keyed by sha256(token), so the raw token is never kept in memory
+_verified_tokens = TTLCache(settings.TOKEN_CACHE_SIZE, settings.TOKEN_CACHE_TTL)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -19,8 +26,16 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return encoded_jwt
 
 def verify_token(token: str):
+    key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+    payload = _verified_tokens.get(key)
+    if payload is not None:
+        return dict(payload)
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
     except Exception:
         return None
+    # Cached entries must not outlive the token itself
+    ttl = min(settings.TOKEN_CACHE_TTL, payload["exp"] - time.time()) if "exp" in payload else settings.TOKEN_CACHE_TTL
+    if ttl > 0:
+        _verified_tokens.set(key, dict(payload), ttl)
+    return payload
@@ -0,0 +1,70 @@
+import hashlib
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy.exc import IntegrityError
+try:
+    from ..config import settings
+    from ..models import planner as models
+    from .ttl_cache import TTLCache
+except Exception:
+    from backend_fastapi.config import settings
+    from backend_fastapi.models import planner as models
+    from backend_fastapi.utils.ttl_cache import TTLCache
+
+# Two tiers in front of AI generation: a per-worker LRU (short TTL, so admin
+# purges reach every worker quickly) and the plan_cache table shared by all
+# workers (PLAN_CACHE_TTL).
+_memory = TTLCache(settings.PLAN_CACHE_SIZE, settings.PLAN_CACHE_MEMORY_TTL)
+
+
+def cache_key(topic: str, duration: int, difficulty: str) -> str:
+    """sha256 of the normalized request, so "  DSA" / "dsa" / "Dsa " share a plan."""
+    normalized = "|".join([" ".join(topic.lower().split()), str(int(duration)), difficulty.strip().lower()])
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def lookup(db, key: str) -> Optional[int]:
+    """Plan id cached for ``key``, or None."""
+    plan_id = _memory.get(key)
+    if plan_id is not None:
+        return plan_id
+    fresh_after = datetime.utcnow() - timedelta(seconds=settings.PLAN_CACHE_TTL)
+    row = db.query(models.PlanCacheEntry.plan_id).join(
+        models.StudyPlan, models.StudyPlan.id == models.PlanCacheEntry.plan_id
+    ).filter(
+        models.PlanCacheEntry.cache_key == key,
+        models.PlanCacheEntry.created_at >= fresh_after
+    ).first()
+    if not row:
+        return None
+    _memory.set(key, row.plan_id)
+    return row.plan_id
+
+
+def store(db, key: str, plan_id: int):
+    """Record ``plan_id`` for ``key`` in the caller's transaction (replacing an expired entry)."""
+    try:
+        with db.begin_nested():
+            db.query(models.PlanCacheEntry).filter(models.PlanCacheEntry.cache_key == key).delete(synchronize_session=False)
+            db.add(models.PlanCacheEntry(cache_key=key, plan_id=plan_id))
+    except IntegrityError:
+        return  # a concurrent job cached the same key first
+    _memory.set(key, plan_id)
+
+
+def purge(db, key: str = None) -> int:
+    """Drop one key (or everything) from both tiers; returns the number of DB entries removed."""
+    query = db.query(models.PlanCacheEntry)
+    if key is not None:
+        query = query.filter(models.PlanCacheEntry.cache_key == key)
+        _memory.pop(key)
+    else:
+        _memory.clear()
+    removed = query.delete(synchronize_session=False)
+    db.commit()
+    return removed
+
+
+def forget_plans():
+    """Clear this worker's memory tier, e.g. after a plan was deleted."""
+    _memory.clear()
@@ -0,0 +1,142 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+try:
+    from ..config import settings
+    from ..database import SessionLocal
+    from ..models import planner as models
+    from . import plan_cache
+    from .ai_generator import generate_study_plan_content
+except Exception:
+    from backend_fastapi.config import settings
+    from backend_fastapi.database import SessionLocal
+    from backend_fastapi.models import planner as models
+    from backend_fastapi.utils import plan_cache
+    from backend_fastapi.utils.ai_generator import generate_study_plan_content
+
+logger = logging.getLogger(__name__)
+
+# Jobs live in plan_generation_jobs; this pool only holds job ids, so a job
+# left "queued" by a restart is picked up again by resume_jobs().
+_executor = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=settings.PLAN_GENERATION_WORKERS, thread_name_prefix="plan-gen")
+    return _executor
+
+
+def enqueue(job_id: int):
+    _get_executor().submit(run_job, job_id)
+
+
+def save_generated_plan(db, data: dict, topic: str, duration: int) -> models.StudyPlan:
+    """Store the model's plan JSON as a StudyPlan with its DailyTasks."""
+    plan = models.StudyPlan(
+        title=data.get("title", f"Learn {topic}"),
+        description=data.get("description", ""),
+        duration_days=duration
+    )
+    db.add(plan)
+    db.flush()
+    db.add_all([
+        models.DailyTask(
+            plan_id=plan.id,
+            day_number=t_data.get("day", 1),
+            title=t_data.get("title", "Task"),
+            description=t_data.get("description", ""),
+            reference_link=t_data.get("link", "")
+        )
+        for t_data in data.get("tasks", [])
+    ])
+    return plan
+
+
+def _claim(db, job_id: int) -> bool:
+    """Move a job from queued to running; False if another worker got it first."""
+    claimed = db.query(models.PlanGenerationJob).filter(
+        models.PlanGenerationJob.id == job_id,
+        models.PlanGenerationJob.status == "queued"
+    ).update({"status": "running", "started_at": datetime.utcnow()}, synchronize_session=False)
+    db.commit()
+    return claimed == 1
+
+
+def _finish_waiting_jobs(db, job):
+    """Give queued jobs for the same cache key (requests coalesced onto this one) its outcome."""
+    if not job.cache_key:
+        return
+    db.query(models.PlanGenerationJob).filter(
+        models.PlanGenerationJob.cache_key == job.cache_key,
+        models.PlanGenerationJob.status == "queued",
+        models.PlanGenerationJob.id != job.id
+    ).update({
+        "status": job.status,
+        "plan_id": job.plan_id,
+        "error": job.error,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+    }, synchronize_session=False)
+
+
+def run_job(job_id: int):
+    db = SessionLocal()
+    try:
+        if not _claim(db, job_id):
+            return
+        job = db.get(models.PlanGenerationJob, job_id)
+        try:
+            plan_id = plan_cache.lookup(db, job.cache_key) if job.cache_key else None
+            if plan_id is None:
+                data = generate_study_plan_content(job.topic, job.duration, job.difficulty)
+                plan_id = save_generated_plan(db, data, job.topic, job.duration).id
+                if job.cache_key:
+                    plan_cache.store(db, job.cache_key, plan_id)
+            job.status = "succeeded"
+            job.plan_id = plan_id
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Plan generation job {job_id} failed: {e}")
+            job.status = "failed"
+            job.error = str(e)
+        job.finished_at = datetime.utcnow()
+        _finish_waiting_jobs(db, job)
+        db.commit()
+    except Exception as e:
+        logger.error(f"Plan generation job {job_id} crashed: {e}")
+    finally:
+        db.close()
+
+
+def resume_jobs():
+    """Requeue abandoned jobs and submit every queued one (run at startup).
+
+    Each worker process does this; the conditional claim in run_job makes
+    sure a job still runs only once.
+    """
+    db = SessionLocal()
+    try:
+        stale_before = datetime.utcnow() - timedelta(seconds=settings.PLAN_JOB_STALE_AFTER)
+        db.query(models.PlanGenerationJob).filter(
+            models.PlanGenerationJob.status == "running",
+            models.PlanGenerationJob.started_at < stale_before
+        ).update({"status": "queued"}, synchronize_session=False)
+        db.commit()
+        queued = db.query(models.PlanGenerationJob.id).filter(
+            models.PlanGenerationJob.status == "queued"
+        ).order_by(models.PlanGenerationJob.created_at).all()
+    finally:
+        db.close()
+    for (job_id,) in queued:
+        enqueue(job_id)
+    return len(queued)
+
+
+def shutdown():
+    """Stop accepting work; jobs not yet started stay queued in the table."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
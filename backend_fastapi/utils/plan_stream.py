@@ -0,0 +1,99 @@
+import json
+
+
+class PlanStreamParser:
+    """Incremental parser for the study-plan JSON the model streams back.
+
+    Feed text chunks as they arrive; ``feed`` returns the events that became
+    complete: ``("meta", {"title", "description"})`` once the keys before the
+    ``tasks`` array are known, then ``("task", {...})`` for every element of
+    ``tasks`` as soon as its closing brace arrives. ``finish`` parses the
+    whole document to recover anything the incremental pass could not.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._root_start = None
+        self._string_start = None
+        self._last_key = None
+        self._last_key_start = None
+        self._in_tasks = False
+        self._task_start = None
+        self.meta_sent = False
+        self.tasks_sent = 0
+
+    def feed(self, chunk: str):
+        self.buffer += chunk
+        events = []
+        buf = self.buffer
+        for i in range(self._pos, len(buf)):
+            ch = buf[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_key = buf[self._string_start + 1:i]
+                        self._last_key_start = self._string_start
+                continue
+            if self._root_start is None:
+                # Skip anything before the document, e.g. a ```json fence
+                if ch == "{":
+                    self._root_start = i
+                    self._depth = 1
+                continue
+            if ch == '"':
+                self._in_string = True
+                self._string_start = i
+            elif ch in "{[":
+                if ch == "[" and self._depth == 1 and self._last_key == "tasks":
+                    self._in_tasks = True
+                    events.extend(self._meta_event())
+                elif ch == "{" and self._in_tasks and self._depth == 2:
+                    self._task_start = i
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if ch == "}" and self._in_tasks and self._depth == 2 and self._task_start is not None:
+                    events.extend(self._task_event(buf[self._task_start:i + 1]))
+                    self._task_start = None
+                elif ch == "]" and self._in_tasks and self._depth == 1:
+                    self._in_tasks = False
+        self._pos = len(buf)
+        return events
+
+    def _meta_event(self):
+        if self.meta_sent:
+            return []
+        header = self.buffer[self._root_start:self._last_key_start].rstrip().rstrip(",") + "}"
+        try:
+            meta = json.loads(header)
+        except ValueError:
+            return []
+        if not meta.get("title") and not meta.get("description"):
+            # Header written after the tasks array; finish() has it
+            return []
+        self.meta_sent = True
+        return [("meta", {"title": meta.get("title"), "description": meta.get("description")})]
+
+    def _task_event(self, text):
+        try:
+            task = json.loads(text)
+        except ValueError:
+            return []
+        self.tasks_sent += 1
+        return [("task", task)]
+
+    def finish(self) -> dict:
+        """The complete document (raises ValueError if the model sent invalid JSON)."""
+        start, end = self.buffer.find("{"), self.buffer.rfind("}")
+        if start == -1 or end == -1:
+            raise ValueError("Model response contained no JSON object")
+        return json.loads(self.buffer[start:end + 1])
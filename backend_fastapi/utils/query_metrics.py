@@ -0,0 +1,85 @@
+import contextvars
+import logging
+import re
+import time
+from collections import Counter
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+try:
+    from ..config import settings
+except Exception:
+    from backend_fastapi.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Stats for the request currently being served. Starlette copies the context
+# into the threadpool for sync routes, so both sync and async sessions see it.
+_current_stats = contextvars.ContextVar("query_stats", default=None)
+
+_IN_LIST = re.compile(r"\bIN\s*\([^()]*\)", re.IGNORECASE)
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a SQL statement so queries differing only in values compare equal."""
+    shape = _IN_LIST.sub("IN (?)", statement)
+    shape = _LITERAL.sub("?", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class QueryStats:
+    """Statement count, DB time and statement shapes for one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes = Counter()
+
+    def record(self, statement: str, elapsed: float):
+        self.count += 1
+        self.duration += elapsed
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int):
+        return [(shape, n) for shape, n in self.shapes.most_common() if n > threshold]
+
+
+# The start time lives on the statement's execution context, so a statement
+# that raises leaves nothing behind on the (pooled) connection.
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and _current_stats.get() is not None:
+        context._query_start_time = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    start = getattr(context, "_query_start_time", None)
+    if stats is None or start is None:
+        return
+    stats.record(statement, time.perf_counter() - start)
+
+
+def install_query_metrics(app):
+    """Count queries per request, report them in response headers and flag N+1 patterns."""
+    threshold = settings.N_PLUS_ONE_THRESHOLD
+
+    @app.middleware("http")
+    async def query_metrics_middleware(request, call_next):
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+        try:
+            response = await call_next(request)
+        finally:
+            _current_stats.reset(token)
+
+        response.headers["X-DB-Queries"] = str(stats.count)
+        response.headers["Server-Timing"] = f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries"'
+        for shape, n in stats.repeated(threshold):
+            logger.warning(
+                "Possible N+1 in %s %s: statement ran %d times: %s",
+                request.method, request.url.path, n, shape[:300],
+            )
+        return response
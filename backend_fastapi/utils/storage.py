@@ -0,0 +1,222 @@
+import logging
+import os
+import shutil
+import tempfile
+from typing import BinaryIO, Optional
+from urllib.parse import quote
+from sqlalchemy import event, insert, update, delete
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, object_session
+try:
+    from ..config import settings
+    from ..models.file_storage import FileStorage, StorageBlob
+except Exception:
+    from backend_fastapi.config import settings
+    from backend_fastapi.models.file_storage import FileStorage, StorageBlob
+
+logger = logging.getLogger(__name__)
+
+# File bodies are stored once per SHA-256 of their content. Every FileStorage
+# row carries the hash of its blob, and storage_blobs counts the rows using
+# each blob: the mapper events below keep that count in the same transaction
+# as the rows, and a blob is deleted after the commit that drops it to zero.
+# Routes only add and delete FileStorage rows.
+
+COPY_CHUNK_SIZE = 1024 * 1024
+_blobs = StorageBlob.__table__
+
+
+class LocalStorage:
+    """Blobs under ``root/objects/ab/<sha256>`` on this host's filesystem."""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def location(self, key: str) -> str:
+        return os.path.join(self.root, "objects", key[:2], key)
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(self.location(key))
+
+    def put(self, key: str, fileobj: BinaryIO):
+        """Copy ``fileobj`` into place via a temp file and an atomic rename."""
+        path = self.location(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        tmp = tempfile.NamedTemporaryFile(dir=directory, prefix=".upload-", suffix=".part", delete=False)
+        try:
+            with tmp:
+                shutil.copyfileobj(fileobj, tmp, COPY_CHUNK_SIZE)
+            os.replace(tmp.name, path)
+        except BaseException:
+            try:
+                os.remove(tmp.name)
+            except OSError:
+                pass
+            raise
+
+    def delete(self, key: str):
+        try:
+            os.remove(self.location(key))
+        except FileNotFoundError:
+            pass
+
+    def local_path(self, key: str) -> Optional[str]:
+        return self.location(key)
+
+    def download_url(self, key: str, filename: str, media_type: str) -> Optional[str]:
+        return None
+
+
+class S3Storage:
+    """Blobs as objects ``<prefix><sha256>`` in an S3-compatible bucket.
+
+    Uses four client calls: head_object, upload_fileobj, delete_object and
+    generate_presigned_url. By default the client is built with boto3 (an
+    optional dependency) from the STORAGE_S3_* settings; MinIO or another
+    S3-compatible server works through STORAGE_S3_ENDPOINT_URL, and any
+    object offering those four methods can be passed as ``client``.
+    """
+
+    def __init__(self, bucket: str, prefix: str = "", client=None):
+        if not bucket:
+            raise ValueError("STORAGE_S3_BUCKET must be set for the s3 storage backend")
+        if client is None:
+            import boto3
+            client = boto3.client(
+                "s3",
+                endpoint_url=settings.STORAGE_S3_ENDPOINT_URL or None,
+                region_name=settings.STORAGE_S3_REGION or None,
+            )
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def location(self, key: str) -> str:
+        return f"s3://{self.bucket}/{self.prefix}{key}"
+
+    def exists(self, key: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self.prefix + key)
+            return True
+        except Exception as e:
+            code = getattr(e, "response", {}).get("Error", {}).get("Code")
+            if code in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+
+    def put(self, key: str, fileobj: BinaryIO):
+        self.client.upload_fileobj(fileobj, self.bucket, self.prefix + key)
+
+    def delete(self, key: str):
+        self.client.delete_object(Bucket=self.bucket, Key=self.prefix + key)
+
+    def local_path(self, key: str) -> Optional[str]:
+        return None
+
+    def download_url(self, key: str, filename: str, media_type: str) -> Optional[str]:
+        """Presigned GET that names the download after this row, not the shared blob."""
+        return self.client.generate_presigned_url(
+            "get_object",
+            Params={
+                "Bucket": self.bucket,
+                "Key": self.prefix + key,
+                "ResponseContentType": media_type,
+                "ResponseContentDisposition": f"attachment; filename*=UTF-8''{quote(filename)}",
+            },
+            ExpiresIn=settings.STORAGE_URL_EXPIRES,
+        )
+
+
+def _make_storage():
+    if settings.STORAGE_BACKEND == "local":
+        return LocalStorage(settings.STORAGE_LOCAL_ROOT)
+    if settings.STORAGE_BACKEND == "s3":
+        return S3Storage(settings.STORAGE_S3_BUCKET, settings.STORAGE_S3_PREFIX)
+    raise ValueError(f"Unknown STORAGE_BACKEND {settings.STORAGE_BACKEND!r} (expected 'local' or 's3')")
+
+
+storage = _make_storage()
+
+
+# ---------- Reference counting ----------
+
+def _increment(connection, content_hash: str, size: int):
+    """Add a reference in one statement, so concurrent first uploads of the same content both succeed."""
+    values = {"content_hash": content_hash, "size": size, "ref_count": 1}
+    if connection.dialect.name == "mysql":
+        stmt = mysql_insert(_blobs).values(**values).on_duplicate_key_update(ref_count=_blobs.c.ref_count + 1)
+    elif connection.dialect.name == "sqlite":
+        stmt = sqlite_insert(_blobs).values(**values).on_conflict_do_update(
+            index_elements=[_blobs.c.content_hash], set_={"ref_count": _blobs.c.ref_count + 1}
+        )
+    else:
+        bumped = connection.execute(
+            update(_blobs).where(_blobs.c.content_hash == content_hash).values(ref_count=_blobs.c.ref_count + 1)
+        )
+        if bumped.rowcount:
+            return
+        stmt = insert(_blobs).values(**values)
+    connection.execute(stmt)
+
+
+@event.listens_for(FileStorage, "after_insert")
+def _file_added(mapper, connection, target):
+    if target.content_hash:
+        _increment(connection, target.content_hash, target.file_size)
+        if target.upload is not None:
+            object_session(target).info.setdefault("stored_files", []).append((target.content_hash, target.upload))
+
+
+@event.listens_for(FileStorage, "after_delete")
+def _file_removed(mapper, connection, target):
+    if target.content_hash:
+        connection.execute(
+            update(_blobs).where(_blobs.c.content_hash == target.content_hash).values(ref_count=_blobs.c.ref_count - 1)
+        )
+    object_session(target).info.setdefault("released_files", []).append((target.content_hash, target.file_path))
+
+
+@event.listens_for(Session, "after_commit")
+def _delete_unreferenced(session):
+    released = session.info.pop("released_files", None)
+    if not released:
+        return
+    engine = session.get_bind()
+    for content_hash, file_path in released:
+        try:
+            if content_hash is None:
+                # Saved before content addressing: the path belongs to this row alone.
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+                continue
+            # Conditional, so a blob that gained a new reference since is kept. The
+            # blob goes before the row delete commits: a concurrent new reference
+            # waits on the row until then, and _restore_missing puts it back.
+            with engine.begin() as conn:
+                dropped = conn.execute(
+                    delete(_blobs).where(_blobs.c.content_hash == content_hash, _blobs.c.ref_count <= 0)
+                ).rowcount
+                if dropped:
+                    storage.delete(content_hash)
+        except Exception as e:
+            logger.warning("Could not delete released file %s: %s", content_hash or file_path, e)
+
+
+@event.listens_for(Session, "after_commit")
+def _restore_missing(session):
+    """Re-store blobs that a concurrent release deleted after save_upload_file found them present."""
+    for content_hash, upload in session.info.pop("stored_files", None) or ():
+        try:
+            if not storage.exists(content_hash):
+                upload.seek(0)
+                storage.put(content_hash, upload)
+        except Exception as e:
+            logger.error("Could not restore blob %s: %s", content_hash, e)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_released(session):
+    session.info.pop("released_files", None)
+    session.info.pop("stored_files", None)
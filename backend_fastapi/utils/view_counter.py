@@ -0,0 +1,88 @@
+import asyncio
+import logging
+import threading
+from collections import Counter
+from sqlalchemy import bindparam, func, update
+try:
+    from ..database import engine
+    from ..models.discussion import ForumThread
+except Exception:
+    from backend_fastapi.database import engine
+    from backend_fastapi.models.discussion import ForumThread
+
+logger = logging.getLogger(__name__)
+
+MIN_FLUSH_INTERVAL = 1.0  # seconds
+
+# One statement shape for every flush; executed as a batch (executemany).
+_INCREMENT_VIEWS = (
+    update(ForumThread.__table__)
+    .where(ForumThread.__table__.c.id == bindparam("thread_id"))
+    .values(views=func.coalesce(ForumThread.__table__.c.views, 0) + bindparam("n"))
+)
+
+
+class ViewCounter:
+    """Per-worker write-behind buffer for forum thread views.
+
+    GET handlers only bump an in-memory counter; a background task turns the
+    accumulated counts into ``UPDATE ... SET views = views + n`` statements
+    every ``interval`` seconds, and once more on shutdown.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = Counter()
+        self._task = None
+
+    def increment(self, thread_id: int, n: int = 1) -> int:
+        """Record views and return the count still waiting to be flushed."""
+        with self._lock:
+            self._pending[thread_id] += n
+            return self._pending[thread_id]
+
+    def pending(self, thread_id: int) -> int:
+        with self._lock:
+            return self._pending.get(thread_id, 0)
+
+    def flush(self) -> int:
+        """Write all pending increments in one transaction; returns the number of threads updated."""
+        with self._lock:
+            batch, self._pending = self._pending, Counter()
+        if not batch:
+            return 0
+        # Sorted so concurrent workers lock rows in the same order.
+        params = [{"thread_id": tid, "n": n} for tid, n in sorted(batch.items())]
+        try:
+            with engine.begin() as conn:
+                conn.execute(_INCREMENT_VIEWS, params)
+        except Exception as e:
+            logger.error(f"Failed to flush view counts, will retry: {e}")
+            with self._lock:
+                self._pending.update(batch)
+            return 0
+        return len(params)
+
+    async def _run(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            await asyncio.to_thread(self.flush)
+
+    def start(self, interval: float):
+        if interval < MIN_FLUSH_INTERVAL:
+            # zero or less would flush in a tight loop
+            logger.warning("VIEW_COUNT_FLUSH_INTERVAL=%s is too small; using %ss", interval, MIN_FLUSH_INTERVAL)
+            interval = MIN_FLUSH_INTERVAL
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run(interval))
+
+    async def stop(self):
+        # A flush still running in the thread pool is harmless: each flush
+        # swaps out the pending counts under the lock, so none are written twice.
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await asyncio.to_thread(self.flush)
+
+
+view_counter = ViewCounter()
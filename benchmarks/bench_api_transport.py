@@ -0,0 +1,130 @@
+"""Flask-to-FastAPI call latency: loopback HTTP versus the in-process transport.
+
+Starts the API under uvicorn in a subprocess for the HTTP path, loads it in
+this process for the in-process path, and times the same app_client calls
+through both sessions.
+
+    python benchmarks/bench_api_transport.py                      # SQLite scratch file
+    BENCH_DATABASE_URL=mysql+mysqlconnector://u:p@host/bench python benchmarks/bench_api_transport.py
+
+Point BENCH_DATABASE_URL at a scratch database: it is migrated and seeded.
+"""
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import requests
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+REPEAT = int(os.getenv("BENCH_REPEAT", 300))
+URL = os.getenv("BENCH_DATABASE_URL") or f"sqlite:///{tempfile.gettempdir()}/bench_api_transport.db"
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def seed():
+    from backend_fastapi.database import SessionLocal
+    from backend_fastapi.migrate import upgrade
+    from backend_fastapi import models
+
+    upgrade()
+    db = SessionLocal()
+    try:
+        if not db.query(models.Company).first():
+            for i in range(20):
+                db.add(models.Company(name=f"Company {i}", sector="IT"))
+            for i in range(20):
+                db.add(models.Resource(title=f"Resource {i}", url="https://example.com"))
+            db.commit()
+    finally:
+        db.close()
+
+
+def wait_until_up(base: str, proc: subprocess.Popen):
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError("uvicorn exited during startup")
+        try:
+            requests.get(base + "companies/", timeout=1)
+            return
+        except requests.ConnectionError:
+            time.sleep(0.2)
+    raise RuntimeError("uvicorn did not start within 30s")
+
+
+def measure(session, base: str, calls):
+    results = {}
+    for name, (method, path, kwargs) in calls.items():
+        for _ in range(10):  # warm-up: connections, caches
+            session.request(method, base + path, **kwargs)
+        timings = []
+        for _ in range(REPEAT):
+            start = time.perf_counter()
+            r = session.request(method, base + path, **kwargs)
+            timings.append((time.perf_counter() - start) * 1000)
+            r.raise_for_status()
+        timings.sort()
+        results[name] = (statistics.median(timings), timings[int(len(timings) * 0.95) - 1])
+    return results
+
+
+def main():
+    os.environ["DATABASE_URL"] = URL
+    os.environ.setdefault("AI_BACKEND", "fake")
+    port = free_port()
+    base = f"http://127.0.0.1:{port}/"
+    os.environ["API_BASE"] = base
+    seed()
+
+    from frontend_flask.utils import app_client
+
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "backend_fastapi.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT, env=os.environ.copy(),
+    )
+    try:
+        wait_until_up(base, proc)
+        http = app_client._build_session("http")
+        inprocess = app_client._build_session("inprocess")
+
+        email = "bench@example.com"
+        http.post(base + "students/register", json={"name": "Bench", "email": email, "password": "bench"})
+        token = http.post(base + "students/login", json={"email": email, "password": "bench"}).json()["access_token"]
+        auth = {"headers": {"Authorization": f"Bearer {token}"}}
+        calls = {
+            "GET /companies/": ("GET", "companies/", {}),
+            "GET /content/resources": ("GET", "content/resources", {}),
+            "GET /students/me": ("GET", "students/me", auth),
+            "GET /dashboard/student": ("GET", "dashboard/student", auth),
+        }
+
+        print(f"{REPEAT} calls per endpoint against {URL}")
+        loopback = measure(http, base, calls)
+        direct = measure(inprocess, base, calls)
+        inprocess.close()
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    print(f"\n{'call':<26}{'http p50':>10}{'p95':>8}{'inproc p50':>12}{'p95':>8}{'speedup':>9}")
+    for name in calls:
+        (hp50, hp95), (ip50, ip95) = loopback[name], direct[name]
+        print(f"{name:<26}{hp50:>10.2f}{hp95:>8.2f}{ip50:>12.2f}{ip95:>8.2f}{hp50 / ip50:>8.1f}x")
+    print("\nTimes in ms. The HTTP path includes a separate uvicorn process; the in-process")
+    print("path shares this process's CPU with the caller.")
+
+
+if __name__ == "__main__":
+    main()
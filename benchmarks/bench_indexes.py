@@ -0,0 +1,203 @@
+"""Query plans and latency for the hot lookup predicates, with and without their indexes.
+
+Seeds ROWS rows into copies of the hot tables, times the router queries, then
+adds the indexes declared in the models and times them again.
+
+    python benchmarks/bench_indexes.py                      # SQLite scratch file
+    BENCH_DATABASE_URL=mysql+mysqlconnector://u:p@host/bench python benchmarks/bench_indexes.py
+
+Point BENCH_DATABASE_URL at a scratch database: the benchmark tables are dropped
+and recreated.
+"""
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import Column, Index, MetaData, Table, UniqueConstraint, create_engine, text
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend_fastapi.models import (  # noqa: E402
+    Bookmark, ForumReply, ForumThread, InterviewExperience, PlacementDrive,
+    StudentApplication, StudentSubscription, UserProgress,
+)
+
+ROWS = int(os.getenv("BENCH_ROWS", 100_000))
+REPEAT = int(os.getenv("BENCH_REPEAT", 200))
+URL = os.getenv("BENCH_DATABASE_URL") or f"sqlite:///{tempfile.gettempdir()}/bench_indexes.db"
+
+MODELS = [UserProgress, Bookmark, StudentApplication, StudentSubscription,
+          InterviewExperience, PlacementDrive, ForumThread, ForumReply]
+
+STUDENTS, QUESTIONS, COMPANIES, DRIVES, THREADS = 5000, 2000, 300, 2000, 5000
+ENTITY_TYPES = ["question", "interview_experience", "resource"]
+EPOCH = datetime(2025, 1, 1)
+
+QUERIES = {
+    "user_progress": (
+        "SELECT * FROM user_progress WHERE student_id = :s AND question_id = :q",
+        lambda: {"s": random.randint(1, STUDENTS), "q": random.randint(1, QUESTIONS)},
+    ),
+    "bookmarks": (
+        "SELECT * FROM bookmarks WHERE user_id = :u AND entity_type = :t AND entity_id = :e",
+        lambda: {"u": random.randint(1, STUDENTS), "t": random.choice(ENTITY_TYPES), "e": random.randint(1, QUESTIONS)},
+    ),
+    "student_applications": (
+        "SELECT * FROM student_applications WHERE student_id = :s AND drive_id = :d",
+        lambda: {"s": random.randint(1, STUDENTS), "d": random.randint(1, DRIVES)},
+    ),
+    "student_subscriptions": (
+        "SELECT * FROM student_subscriptions WHERE student_id = :s AND is_active = 1",
+        lambda: {"s": random.randint(1, STUDENTS)},
+    ),
+    "interview_experiences": (
+        "SELECT * FROM interview_experiences WHERE company_id = :c AND status = 'approved'",
+        lambda: {"c": random.randint(1, COMPANIES)},
+    ),
+    "placement_drives": (
+        "SELECT * FROM placement_drives WHERE status = 'open' ORDER BY deadline LIMIT 50",
+        lambda: {},
+    ),
+    "forum_threads": (
+        "SELECT * FROM forum_threads ORDER BY created_at DESC LIMIT 20",
+        lambda: {},
+    ),
+    "forum_replies": (
+        "SELECT * FROM forum_replies WHERE thread_id = :t",
+        lambda: {"t": random.randint(1, THREADS)},
+    ),
+}
+
+
+def bare_tables(metadata):
+    """Copies of the model tables with columns only: no keys besides the primary key."""
+    return {
+        model.__tablename__: Table(
+            model.__tablename__, metadata,
+            *[Column(c.name, c.type, primary_key=c.primary_key) for c in model.__table__.columns],
+        )
+        for model in MODELS
+    }
+
+
+def model_indexes(tables):
+    """The composite indexes/unique keys the models declare, rebuilt on the bare tables."""
+    for model in MODELS:
+        table = tables[model.__tablename__]
+        for index in model.__table__.indexes:
+            if [c.name for c in index.columns] != ["id"]:  # skip the per-table primary key index
+                yield Index(index.name, *[table.c[c.name] for c in index.columns], unique=index.unique)
+        for constraint in model.__table__.constraints:
+            if isinstance(constraint, UniqueConstraint) and constraint.name:
+                yield Index(constraint.name, *[table.c[c.name] for c in constraint.columns], unique=True)
+
+
+def unique_pairs(n, left, right):
+    return [divmod(v, right) for v in random.sample(range(left * right), n)]
+
+
+def seed_rows():
+    rnd = random.randint
+    rows = {}
+    rows["user_progress"] = [
+        {"student_id": s + 1, "question_id": q + 1, "status": "ATTEMPTED", "is_bookmarked": False, "updated_at": EPOCH}
+        for s, q in unique_pairs(ROWS, STUDENTS, QUESTIONS)
+    ]
+    rows["bookmarks"] = [
+        {"user_id": u + 1, "entity_type": ENTITY_TYPES[v % 3], "entity_id": v // 3 + 1, "created_at": EPOCH}
+        for u, v in unique_pairs(ROWS, STUDENTS, QUESTIONS * 3)
+    ]
+    rows["student_applications"] = [
+        {"student_id": s + 1, "drive_id": d + 1, "applied_at": EPOCH, "status": "applied"}
+        for s, d in unique_pairs(ROWS, STUDENTS, DRIVES)
+    ]
+    rows["student_subscriptions"] = [
+        {"student_id": rnd(1, STUDENTS), "plan_id": rnd(1, 500), "start_date": EPOCH,
+         "is_active": i % 10 == 0, "current_day": 1}
+        for i in range(ROWS)
+    ]
+    rows["interview_experiences"] = [
+        {"student_name": "bench", "company_id": rnd(1, COMPANIES), "experience_text": "bench",
+         "status": random.choice(["approved", "approved", "pending", "rejected"])}
+        for _ in range(ROWS)
+    ]
+    rows["placement_drives"] = [
+        {"company_id": rnd(1, COMPANIES), "batch": 2026, "role": "SDE", "date": EPOCH,
+         "deadline": EPOCH + timedelta(minutes=rnd(0, 500_000)),
+         "status": "open" if i % 20 == 0 else "closed", "created_at": EPOCH}
+        for i in range(ROWS)
+    ]
+    rows["forum_threads"] = [
+        {"student_id": rnd(1, STUDENTS), "title": "bench", "content": "bench", "views": 0,
+         "created_at": EPOCH + timedelta(seconds=rnd(0, 30_000_000))}
+        for _ in range(ROWS)
+    ]
+    rows["forum_replies"] = [
+        {"thread_id": rnd(1, THREADS), "student_id": rnd(1, STUDENTS), "content": "bench", "created_at": EPOCH}
+        for _ in range(ROWS)
+    ]
+    return rows
+
+
+def explain(conn, sql, params):
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    return " | ".join(" ".join(str(v) for v in row if v is not None) for row in conn.execute(text(prefix + sql), params))
+
+
+def measure(engine):
+    results = {}
+    with engine.connect() as conn:
+        for name, (sql, make_params) in QUERIES.items():
+            stmt = text(sql)
+            timings = []
+            for _ in range(REPEAT):
+                params = make_params()
+                start = time.perf_counter()
+                conn.execute(stmt, params).fetchall()
+                timings.append((time.perf_counter() - start) * 1000)
+            results[name] = (statistics.median(timings), explain(conn, sql, make_params()))
+    return results
+
+
+def main():
+    random.seed(42)
+    engine = create_engine(URL)
+    metadata = MetaData()
+    tables = bare_tables(metadata)
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+
+    print(f"Seeding {ROWS:,} rows per table into {engine.url.render_as_string(hide_password=True)} ...")
+    with engine.begin() as conn:
+        for name, rows in seed_rows().items():
+            conn.execute(tables[name].insert(), rows)
+
+    before = measure(engine)
+    with engine.begin() as conn:
+        for index in model_indexes(tables):
+            index.create(conn)
+        if conn.dialect.name == "mysql":
+            for name in tables:
+                conn.execute(text(f"ANALYZE TABLE {name}"))
+        elif conn.dialect.name == "sqlite":
+            conn.execute(text("ANALYZE"))
+    after = measure(engine)
+
+    print(f"\n{'query':<24}{'before ms':>12}{'after ms':>12}{'speedup':>10}")
+    for name in QUERIES:
+        b, a = before[name][0], after[name][0]
+        print(f"{name:<24}{b:>12.3f}{a:>12.3f}{b / a if a else float('inf'):>9.1f}x")
+    print("\nQuery plans (before -> after):")
+    for name in QUERIES:
+        print(f"- {name}\n    before: {before[name][1]}\n    after:  {after[name][1]}")
+
+    metadata.drop_all(engine)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,41 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, session
-import requests
+from flask import Flask, render_template, request, redirect, url_for, flash, session, Response, stream_with_context
 from dotenv import load_dotenv
 import os
 import sys
 from pathlib import Path
 from datetime import datetime
 
-# API Configuration
-API_BASE_URL = "http://localhost:8000"
-API_TIMEOUT = 5
-
-
 # Handle imports for both module and direct execution
 try:
     from .utils.app_client import (
         get_companies,
         get_company,
         get_company_experiences,
+        get_experiences,
+        get_pending_experiences,
         submit_experience,
         get_resources,
         get_resumes,
         get_announcements,
         get_student_profile,
+        get_student_dashboard,
+        get_admin_dashboard,
+        get_admin_analytics,
+        get_student_analytics,
+        get_drives,
+        create_drive,
+        apply_for_drive,
+        get_my_applications,
+        get_client_metrics,
+        get_cache_stats,
+        api_get,
+        api_post,
+        api_put,
+        api_delete,
+        API_BASE,
         API_TIMEOUT,
     )
+    from .utils.fanout import fan_out
 except ImportError:
     # If running directly, add parent directory to path
     sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -31,22 +43,36 @@ except ImportError:
         get_companies,
         get_company,
         get_company_experiences,
+        get_experiences,
+        get_pending_experiences,
         submit_experience,
         get_resources,
         get_resumes,
         get_announcements,
         get_student_profile,
+        get_student_dashboard,
+        get_admin_dashboard,
         get_admin_analytics,
         get_student_analytics,
         get_drives,
         create_drive,
         apply_for_drive,
         get_my_applications,
+        get_client_metrics,
+        get_cache_stats,
+        api_get,
+        api_post,
+        api_put,
+        api_delete,
+        API_BASE,
         API_TIMEOUT,
     )
+    from frontend_flask.utils.fanout import fan_out
 
 load_dotenv()
 
+API_BASE_URL = API_BASE.rstrip("/")
+
 app = Flask(__name__, static_folder="static", template_folder="templates")
 app.secret_key = os.getenv("FLASK_SECRET_KEY")
 
@@ -168,53 +194,41 @@ def announcements_page():
     return render_template("announcements.html", announcements=announcements)
 
 
+def _student_dashboard_fan_out(token):
+    return fan_out({
+        "profile": (lambda: get_student_profile(token), None),
+        "resources": (lambda: get_resources(token), []),
+        "resumes": (lambda: get_resumes(token), []),
+        "announcements": (lambda: get_announcements(token), []),
+        "companies": (get_companies, []),
+        "experiences": (get_experiences, []),
+        # New Data for Dashboards
+        "analytics": (lambda: get_student_analytics(token), {}),
+        "drives": (get_drives, []),
+        "my_apps": (lambda: get_my_applications(token), []),
+    })
+
+
 @app.route("/student/dashboard")
 @student_required
 def student_dashboard():
     token = session.get("student_token")
     try:
-        profile = get_student_profile(token)
+        data, failed = get_student_dashboard(token), set()
     except Exception:
-        profile = None
+        # Fall back to the individual endpoints, e.g. against an API without /dashboard
+        data, failed = _student_dashboard_fan_out(token)
+    if "profile" in failed:
         flash("Unable to load student profile", "warning")
-    try:
-        resources = get_resources(token)
-    except Exception:
-        resources = []
-    try:
-        resumes = get_resumes(token)
-    except Exception:
-        resumes = []
-    try:
-        announcements = get_announcements(token)
-    except Exception:
-        announcements = []
-    try:
-        company_list = get_companies()
-        company_lookup = {company["id"]: company for company in company_list}
-    except Exception:
-        company_lookup = {}
-    try:
-        resp = requests.get("http://localhost:8000/experiences", timeout=API_TIMEOUT)
-        experiences = resp.json() if resp.status_code == 200 else []
-    except Exception:
-        experiences = []
-    
-    # New Data for Dashboards
-    try:
-        analytics = get_student_analytics(token)
-    except Exception:
-        analytics = {}
-        
-    try:
-        drives = get_drives()
-    except Exception:
-        drives = []
-        
-    try:
-        my_apps = get_my_applications(token)
-    except Exception:
-        my_apps = []
+    profile = data["profile"]
+    resources = data["resources"]
+    resumes = data["resumes"]
+    announcements = data["announcements"]
+    company_lookup = {company["id"]: company for company in data["companies"]}
+    experiences = data["experiences"]
+    analytics = data["analytics"]
+    drives = data["drives"]
+    my_apps = data["my_apps"]
 
     return render_template(
         "student_dashboard.html",
@@ -237,7 +251,7 @@ def practice_page():
     headers = {"Authorization": f"Bearer {token}"}
     try:
         # Fetch all questions (with limit for now)
-        r = requests.get(f"{API_BASE_URL}/questions?limit=100", headers=headers, timeout=API_TIMEOUT)
+        r = api_get("/questions?limit=100", headers=headers)
         questions = r.json() if r.status_code == 200 else []
     except Exception:
         questions = []
@@ -251,14 +265,14 @@ def practice_question_detail(question_id):
     headers = {"Authorization": f"Bearer {token}"}
     try:
         # Get Question Details
-        q_req = requests.get(f"{API_BASE_URL}/questions/{question_id}", headers=headers, timeout=API_TIMEOUT)
+        q_req = api_get(f"/questions/{question_id}", headers=headers)
         if q_req.status_code != 200:
             flash("Question not found", "danger")
             return redirect(url_for("practice_page"))
         question = q_req.json()
         
         # Get User Progress
-        p_req = requests.get(f"{API_BASE_URL}/questions/{question_id}/progress", headers=headers, timeout=API_TIMEOUT)
+        p_req = api_get(f"/questions/{question_id}/progress", headers=headers)
         progress = p_req.json() if p_req.status_code == 200 else {}
         
     except Exception:
@@ -286,7 +300,7 @@ def update_progress_proxy():
     }
     
     try:
-        r = requests.post(f"{API_BASE_URL}/questions/{question_id}/progress", json=payload, headers=headers, timeout=API_TIMEOUT)
+        r = api_post(f"/questions/{question_id}/progress", json=payload, headers=headers)
         if r.status_code == 200:
             return {"status": "success"}
         else:
@@ -301,12 +315,10 @@ def forum_page():
     token = session.get("student_token")
     headers = {"Authorization": f"Bearer {token}"}
     tag = request.args.get("tag")
-    url = f"{API_BASE_URL}/discussion/"
-    if tag:
-        url += f"?tag={tag}"
+    params = {"tag": tag} if tag else None
         
     try:
-        r = requests.get(url, headers=headers, timeout=API_TIMEOUT)
+        r = api_get("/discussion/", params=params, headers=headers)
         threads = r.json() if r.status_code == 200 else []
     except Exception:
         threads = []
@@ -324,7 +336,7 @@ def forum_create():
         "tags": request.form.get("tags")
     }
     try:
-        r = requests.post(f"{API_BASE_URL}/discussion/", json=payload, headers=headers, timeout=API_TIMEOUT)
+        r = api_post("/discussion/", json=payload, headers=headers)
         if r.status_code == 200:
             flash("Discussion started!", "success")
         else:
@@ -339,7 +351,7 @@ def forum_thread_detail(thread_id):
     token = session.get("student_token")
     headers = {"Authorization": f"Bearer {token}"}
     try:
-        r = requests.get(f"{API_BASE_URL}/discussion/{thread_id}", headers=headers, timeout=API_TIMEOUT)
+        r = api_get(f"/discussion/{thread_id}", headers=headers)
         if r.status_code != 200:
             flash("Thread not found", "danger")
             return redirect(url_for("forum_page"))
@@ -356,7 +368,7 @@ def forum_reply(thread_id):
     headers = {"Authorization": f"Bearer {token}"}
     payload = {"content": request.form.get("content")}
     try:
-        r = requests.post(f"{API_BASE_URL}/discussion/{thread_id}/reply", json=payload, headers=headers, timeout=API_TIMEOUT)
+        r = api_post(f"/discussion/{thread_id}/reply", json=payload, headers=headers)
         if r.status_code == 200:
             flash("Reply posted", "success")
         else:
@@ -375,15 +387,32 @@ def study_planner_page():
     subscription = None
     plans = []
     all_plans = []
+    pending_job = None
     
     try:
+        # Report on an AI generation started from this session
+        job_id = session.get("plan_job_id")
+        if job_id:
+            job_req = api_get(f"/planner/jobs/{job_id}", headers=headers)
+            job = job_req.json() if job_req.status_code == 200 else None
+            if not job:
+                session.pop("plan_job_id", None)
+            elif job["status"] == "succeeded":
+                session.pop("plan_job_id", None)
+                flash("Plan generated successfully! You can now subscribe to it.", "success")
+            elif job["status"] == "failed":
+                session.pop("plan_job_id", None)
+                flash("AI Generation failed: " + (job.get("error") or "unknown error"), "danger")
+            else:
+                pending_job = job
+        
         # Fetch all student's plans (active and inactive)
-        all_plans_req = requests.get(f"{API_BASE_URL}/planner/my-plans", headers=headers, timeout=API_TIMEOUT)
+        all_plans_req = api_get("/planner/my-plans", headers=headers)
         if all_plans_req.status_code == 200:
             all_plans = all_plans_req.json()
         
         # Check for active subscription
-        sub_req = requests.get(f"{API_BASE_URL}/planner/my-subscription", headers=headers, timeout=API_TIMEOUT)
+        sub_req = api_get("/planner/my-subscription", headers=headers)
         
         if sub_req.status_code == 200:
             subscription = sub_req.json()
@@ -392,13 +421,13 @@ def study_planner_page():
         
         # If no subscription, fetch available plans
         if not subscription:
-            plans_req = requests.get(f"{API_BASE_URL}/planner/plans", headers=headers, timeout=API_TIMEOUT)
+            plans_req = api_get("/planner/plans", headers=headers)
             plans = plans_req.json() if plans_req.status_code == 200 else []
             
     except Exception:
         flash("Error loading planner data", "warning")
         
-    return render_template("study_planner.html", subscription=subscription, plans=plans, all_plans=all_plans)
+    return render_template("study_planner.html", subscription=subscription, plans=plans, all_plans=all_plans, pending_job=pending_job)
 
 @app.route("/study-planner/subscribe/<int:plan_id>", methods=["POST"])
 @student_required
@@ -406,7 +435,7 @@ def planner_subscribe(plan_id):
     token = session.get("student_token")
     headers = {"Authorization": f"Bearer {token}"}
     try:
-        r = requests.post(f"{API_BASE_URL}/planner/plans/{plan_id}/subscribe", headers=headers, timeout=API_TIMEOUT)
+        r = api_post(f"/planner/plans/{plan_id}/subscribe", headers=headers)
         if r.status_code == 200:
             flash("Successfully subscribed to plan!", "success")
         else:
@@ -422,7 +451,7 @@ def planner_plan_delete(plan_id):
     token = session.get("student_token")
     headers = {"Authorization": f"Bearer {token}"}
     try:
-        r = requests.delete(f"{API_BASE_URL}/planner/plans/{plan_id}", headers=headers, timeout=API_TIMEOUT)
+        r = api_delete(f"/planner/plans/{plan_id}", headers=headers)
         if r.status_code == 200:
             flash("Plan removed successfully!", "success")
         else:
@@ -437,7 +466,7 @@ def seed_plan():
     token = session.get("admin_token") or session.get("student_token")
     headers = {"Authorization": f"Bearer {token}"}
     try:
-        r = requests.post(f"{API_BASE_URL}/planner/seed", headers=headers, timeout=API_TIMEOUT)
+        r = api_post("/planner/seed", headers=headers)
         if r.status_code == 200:
             flash("Demo plan seeded successfully!", "success")
         elif r.status_code == 403 or r.status_code == 401:
@@ -459,8 +488,12 @@ def planner_generate():
         "difficulty": request.form.get("difficulty")
     }
     try:
-        r = requests.post(f"{API_BASE_URL}/planner/generate", json=payload, headers=headers, timeout=60) # Increased timeout for AI
-        if r.status_code == 200:
+        # The API queues the generation and answers 202 right away
+        r = api_post("/planner/generate", json=payload, headers=headers)
+        if r.status_code == 202:
+            session["plan_job_id"] = r.json()["id"]
+            flash("Generating your roadmap in the background. It will appear here shortly.", "info")
+        elif r.status_code == 200:
             flash("Plan generated successfully! You can now subscribe to it.", "success")
         else:
             flash("AI Generation failed: " + r.text, "danger")
@@ -468,13 +501,36 @@ def planner_generate():
         flash(f"Network error: {str(e)}", "danger")
     return redirect(url_for("study_planner_page"))
 
+@app.route("/study-planner/generate/stream", methods=["POST"])
+@student_required
+def planner_generate_stream():
+    """Relay the API's Server-Sent Events so the page can show tasks while they are generated."""
+    token = session.get("student_token")
+    headers = {"Authorization": f"Bearer {token}"}
+    payload = {
+        "topic": request.form.get("topic"),
+        "duration": int(request.form.get("duration")),
+        "difficulty": request.form.get("difficulty")
+    }
+    try:
+        r = api_post("/planner/generate/stream", json=payload, headers=headers, stream=True, timeout=(API_TIMEOUT, 60))
+    except Exception as e:
+        return {"status": "error", "message": str(e)}, 502
+    if r.status_code != 200:
+        return {"status": "error", "message": r.text}, r.status_code
+    return Response(
+        stream_with_context(r.iter_content(chunk_size=None)),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.route("/study-planner/task/<int:task_id>/complete", methods=["POST"])
 @student_required
 def planner_complete_task(task_id):
     token = session.get("student_token")
     headers = {"Authorization": f"Bearer {token}"}
     try:
-        r = requests.post(f"{API_BASE_URL}/planner/tasks/{task_id}/complete", headers=headers, timeout=API_TIMEOUT)
+        r = api_post(f"/planner/tasks/{task_id}/complete", headers=headers)
         if r.status_code == 200:
             return {"status": "success"}
         else:
@@ -488,7 +544,7 @@ def planner_activate(subscription_id):
     token = session.get("student_token")
     headers = {"Authorization": f"Bearer {token}"}
     try:
-        r = requests.post(f"{API_BASE_URL}/planner/subscriptions/{subscription_id}/activate", headers=headers, timeout=API_TIMEOUT)
+        r = api_post(f"/planner/subscriptions/{subscription_id}/activate", headers=headers)
         if r.status_code == 200:
             flash("Plan activated successfully!", "success")
         else:
@@ -503,7 +559,7 @@ def planner_delete(subscription_id):
     token = session.get("student_token")
     headers = {"Authorization": f"Bearer {token}"}
     try:
-        r = requests.delete(f"{API_BASE_URL}/planner/subscriptions/{subscription_id}", headers=headers, timeout=API_TIMEOUT)
+        r = api_delete(f"/planner/subscriptions/{subscription_id}", headers=headers)
         if r.status_code == 200:
             flash("Plan deleted successfully!", "success")
         else:
@@ -519,13 +575,18 @@ def planner_delete(subscription_id):
 def bookmarks():
     token = session.get("student_token")
     headers = {"Authorization": f"Bearer {token}"}
+    params = {"expand": "entity", "limit": 50}
+    if request.args.get("cursor"):
+        params["cursor"] = request.args.get("cursor")
+    next_cursor = None
     try:
-        r = requests.get(f"{API_BASE_URL}/bookmarks", headers=headers, timeout=API_TIMEOUT)
+        r = api_get("/bookmarks", params=params, headers=headers)
         bookmarks = r.json() if r.status_code == 200 else []
+        next_cursor = r.headers.get("X-Next-Cursor")
     except Exception:
         bookmarks = []
         flash("Could not load bookmarks", "warning")
-    return render_template("bookmarks.html", bookmarks=bookmarks)
+    return render_template("bookmarks.html", bookmarks=bookmarks, next_cursor=next_cursor)
 
 @app.route("/bookmarks/add", methods=["POST"])
 @student_required
@@ -546,7 +607,7 @@ def add_bookmark():
     }
     
     try:
-        r = requests.post(f"{API_BASE_URL}/bookmarks", json=payload, headers=headers, timeout=API_TIMEOUT)
+        r = api_post("/bookmarks", json=payload, headers=headers)
         if request.is_json:
             if r.status_code == 200:
                 return {"status": "success", "message": "Bookmark added"}
@@ -570,7 +631,7 @@ def delete_bookmark(bookmark_id):
     token = session.get("student_token")
     headers = {"Authorization": f"Bearer {token}"}
     try:
-        r = requests.delete(f"{API_BASE_URL}/bookmarks/{bookmark_id}", headers=headers, timeout=API_TIMEOUT)
+        r = api_delete(f"/bookmarks/{bookmark_id}", headers=headers)
         if r.status_code == 200:
             flash("Bookmark removed", "success")
         else:
@@ -590,16 +651,35 @@ def check_bookmark_status():
     entity_id = int(request.args.get("id"))
     
     try:
-        r = requests.get(f"{API_BASE_URL}/bookmarks", headers=headers, timeout=API_TIMEOUT)
+        payload = {"entities": [{"entity_type": entity_type, "entity_id": entity_id}]}
+        r = api_post("/bookmarks/status", json=payload, headers=headers)
         if r.status_code == 200:
-            bookmarks = r.json()
-            for b in bookmarks:
-                if b["entity_type"] == entity_type and b["entity_id"] == entity_id:
-                    return {"is_bookmarked": True, "bookmark_id": b["id"]}
+            state = r.json()[0]
+            if state["bookmarked"]:
+                return {"is_bookmarked": True, "bookmark_id": state["bookmark_id"]}
         return {"is_bookmarked": False}
     except Exception:
         return {"is_bookmarked": False}
 
+@app.route("/bookmarks/api/status", methods=["POST"])
+@student_required
+def bulk_bookmark_status():
+    """Bookmark state for a list of {type, id} entities, e.g. every card on a page."""
+    token = session.get("student_token")
+    headers = {"Authorization": f"Bearer {token}"}
+    items = (request.json or {}).get("items", [])
+    payload = {"entities": [{"entity_type": i.get("type"), "entity_id": int(i.get("id"))} for i in items]}
+    try:
+        r = api_post("/bookmarks/status", json=payload, headers=headers)
+        if r.status_code != 200:
+            return {"status": "error", "message": r.text}, r.status_code
+        return {"items": [
+            {"type": s["entity_type"], "id": s["entity_id"], "is_bookmarked": s["bookmarked"], "bookmark_id": s["bookmark_id"]}
+            for s in r.json()
+        ]}
+    except Exception as e:
+        return {"status": "error", "message": str(e)}, 500
+
 @app.route("/bookmarks/api/toggle", methods=["POST"])
 @student_required
 def toggle_bookmark_status():
@@ -608,28 +688,19 @@ def toggle_bookmark_status():
     data = request.json
     entity_type = data.get("type")
     entity_id = int(data.get("id"))
+    payload = {
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "note": "Saved from " + entity_type,
+        "bookmarked": data.get("bookmarked"),  # the state the user asked for, if the page sent it
+    }
     
-    # First check if exists
+    # One atomic call; PUT is never retried by the API client
     try:
-        r = requests.get(f"{API_BASE_URL}/bookmarks", headers=headers, timeout=API_TIMEOUT)
-        bookmark_id = None
-        if r.status_code == 200:
-            bookmarks = r.json()
-            for b in bookmarks:
-                if b["entity_type"] == entity_type and b["entity_id"] == entity_id:
-                    bookmark_id = b["id"]
-                    break
-        
-        if bookmark_id:
-            # Delete
-            requests.delete(f"{API_BASE_URL}/bookmarks/{bookmark_id}", headers=headers, timeout=API_TIMEOUT)
-            return {"status": "removed"}
-        else:
-            # Create
-            payload = {"entity_type": entity_type, "entity_id": entity_id, "note": "Saved from " + entity_type}
-            requests.post(f"{API_BASE_URL}/bookmarks", json=payload, headers=headers, timeout=API_TIMEOUT)
-            return {"status": "added"}
-            
+        r = api_put("/bookmarks/toggle", json=payload, headers=headers)
+        if r.status_code != 200:
+            return {"status": "error", "message": r.text}, 500
+        return {"status": "added" if r.json()["bookmarked"] else "removed"}
     except Exception as e:
         return {"status": "error", "message": str(e)}, 500
 
@@ -686,10 +757,9 @@ def admin_login():
     username = request.form.get("username")
     password = request.form.get("password")
     try:
-        r = requests.post(
-            "http://localhost:8000/auth/login",
-            json={"username": username, "password": password},
-            timeout=API_TIMEOUT,
+        r = api_post(
+            "/auth/login",
+            json={"username": username, "password": password}
         )
         if r.status_code == 200:
             token = r.json().get("access_token")
@@ -710,10 +780,9 @@ def student_login():
         email = request.form.get("email")
         password = request.form.get("password")
         try:
-            r = requests.post(
-                "http://localhost:8000/students/login",
-                json={"email": email, "password": password},
-                timeout=API_TIMEOUT,
+            r = api_post(
+                "/students/login",
+                json={"email": email, "password": password}
             )
             if r.status_code == 200:
                 token = r.json().get("access_token")
@@ -737,7 +806,7 @@ def student_register():
             "password": request.form.get("password"),
         }
         try:
-            r = requests.post("http://localhost:8000/students/register", json=payload, timeout=API_TIMEOUT)
+            r = api_post("/students/register", json=payload)
             if r.status_code == 200:
                 flash("Registration successful. Please login.", "success")
                 return redirect(url_for("student_login"))
@@ -761,10 +830,9 @@ def admin_register():
         username = request.form.get("username")
         password = request.form.get("password")
         try:
-            r = requests.post(
-                "http://localhost:8000/auth/create-admin",
-                json={"username": username, "password": password},
-                timeout=API_TIMEOUT,
+            r = api_post(
+                "/auth/create-admin",
+                json={"username": username, "password": password}
             )
             if r.status_code == 200:
                 flash("Admin created successfully. Please login.", "success")
@@ -782,46 +850,38 @@ def admin_logout():
     flash("Admin session closed.", "info")
     return redirect(url_for("home"))
 
+def _admin_dashboard_fan_out(token):
+    # Use public endpoints for resources, resumes, and announcements
+    return fan_out({
+        "pending": (lambda: get_pending_experiences(token), []),
+        "companies": (get_companies, []),
+        "resources": (get_resources, []),
+        "resumes": (get_resumes, []),
+        "announcements": (get_announcements, []),
+        # New Analytics Data
+        "analytics": (lambda: get_admin_analytics(token), {}),
+    })
+
+
 @app.route("/admin")
 @admin_required
 def admin_dashboard():
     token = session.get("admin_token")
-    headers = {"Authorization": f"Bearer {token}"}
     try:
-        r = requests.get("http://localhost:8000/admin/pending-experiences", headers=headers, timeout=API_TIMEOUT)
-        if r.status_code == 200:
-            pending = r.json()
-        else:
-            pending = []
-            flash("Failed to fetch pending experiences", "danger")
-    except Exception:
-        pending = []
-        flash("Admin API not reachable", "danger")
-    try:
-        companies = get_companies()
+        data, failed = get_admin_dashboard(token), set()
     except Exception:
-        companies = []
+        data, failed = _admin_dashboard_fan_out(token)
+    if "pending" in failed:
+        flash("Failed to fetch pending experiences", "danger")
+    if "companies" in failed:
         flash("Failed to load companies list", "warning")
-    # Use public endpoints for resources, resumes, and announcements
-    try:
-        resources = get_resources()  # Public endpoint, no token needed
-    except Exception:
-        resources = []
-    try:
-        resumes = get_resumes()  # Public endpoint, no token needed
-    except Exception:
-        resumes = []
-    try:
-        announcements = get_announcements()  # Public endpoint, no token needed
-    except Exception:
-        announcements = []
-    
-    # New Analytics Data
-    try:
-        analytics = get_admin_analytics(token)
-    except Exception:
-        analytics = {}
-        
+    pending = data["pending"]
+    companies = data["companies"]
+    resources = data["resources"]
+    resumes = data["resumes"]
+    announcements = data["announcements"]
+    analytics = data["analytics"]
+
     return render_template(
         "admin_dashboard.html",
         pending=pending,
@@ -832,6 +892,12 @@ def admin_dashboard():
         analytics=analytics
     )
 
+@app.route("/admin/api-metrics")
+@admin_required
+def admin_api_metrics():
+    """Latency histogram of this worker's backend calls, per call site, and response cache counters."""
+    return {"calls": get_client_metrics(), "cache": get_cache_stats()}
+
 @app.route("/admin/questions/add", methods=["GET"])
 @admin_required
 def admin_add_question_page():
@@ -865,7 +931,7 @@ def admin_add_question_submit():
         payload["correct_option"] = request.form.get("correct_option")
         
     try:
-        r = requests.post(f"{API_BASE_URL}/questions/", json=payload, headers=headers, timeout=API_TIMEOUT)
+        r = api_post("/questions/", json=payload, headers=headers)
         if r.status_code == 200:
             flash("Question added successfully", "success")
         else:
@@ -881,7 +947,7 @@ def admin_resources_page():
     token = session.get("admin_token")
     headers = {"Authorization": f"Bearer {token}"}
     try:
-        r = requests.get(f"{API_BASE_URL}/content/resources", timeout=API_TIMEOUT)
+        r = api_get("/content/resources")
         resources = r.json() if r.status_code == 200 else []
     except Exception:
         resources = []
@@ -918,8 +984,8 @@ def admin_add_resource():
         files = {'_dummy': (None, '')}
 
     try:
-        r = requests.post(
-            f"{API_BASE_URL}/content/resources", 
+        r = api_post(
+            "/content/resources", 
             data=data, 
             files=files, 
             headers=headers, 
@@ -943,10 +1009,9 @@ def admin_delete_resource(resource_id):
     
     try:
         # Call backend DELETE endpoint
-        r = requests.delete(
-            f"{API_BASE_URL}/content/resources/{resource_id}",
-            headers=headers,
-            timeout=API_TIMEOUT
+        r = api_delete(
+            f"/content/resources/{resource_id}",
+            headers=headers
         )
         if r.status_code == 200:
             flash("Resource deleted successfully", "success")
@@ -977,8 +1042,8 @@ def admin_update_resource(resource_id):
             files = {'file': (f.filename, f.stream, f.content_type)}
     
     try:
-        r = requests.put(
-            f"{API_BASE_URL}/content/resources/{resource_id}",
+        r = api_put(
+            f"/content/resources/{resource_id}",
             data=data,
             files=files if files else None,
             headers=headers,
@@ -996,8 +1061,8 @@ def admin_update_resource(resource_id):
 def admin_approve(exp_id):
     token = session.get("admin_token")
     headers = {"Authorization": f"Bearer {token}"}
-    r = requests.put(
-        f"http://localhost:8000/admin/approve-experience/{exp_id}", headers=headers, timeout=API_TIMEOUT
+    r = api_put(
+        f"/admin/approve-experience/{exp_id}", headers=headers
     )
     if r.status_code == 200:
         flash("Approved", "success")
@@ -1010,8 +1075,8 @@ def admin_approve(exp_id):
 def admin_reject(exp_id):
     token = session.get("admin_token")
     headers = {"Authorization": f"Bearer {token}"}
-    r = requests.put(
-        f"http://localhost:8000/admin/reject-experience/{exp_id}", headers=headers, timeout=API_TIMEOUT
+    r = api_put(
+        f"/admin/reject-experience/{exp_id}", headers=headers
     )
     if r.status_code == 200:
         flash("Rejected", "success")
@@ -1031,8 +1096,8 @@ def admin_company_create():
         "website": request.form.get("website"),
         "sector": request.form.get("sector"),
     }
-    r = requests.post(
-        "http://localhost:8000/admin/companies", json=payload, headers=headers, timeout=API_TIMEOUT
+    r = api_post(
+        "/admin/companies", json=payload, headers=headers
     )
     flash("Company created" if r.status_code == 200 else f"Failed: {r.text}", "success" if r.status_code == 200 else "danger")
     return redirect(url_for("admin_dashboard"))
@@ -1048,8 +1113,8 @@ def admin_company_update(company_id: int):
         "website": request.form.get("website"),
         "sector": request.form.get("sector"),
     }
-    r = requests.put(
-        f"http://localhost:8000/admin/companies/{company_id}", json=payload, headers=headers, timeout=API_TIMEOUT
+    r = api_put(
+        f"/admin/companies/{company_id}", json=payload, headers=headers
     )
     flash("Company updated" if r.status_code == 200 else f"Failed: {r.text}", "success" if r.status_code == 200 else "danger")
     return redirect(url_for("admin_dashboard"))
@@ -1059,8 +1124,8 @@ def admin_company_update(company_id: int):
 def admin_company_delete(company_id: int):
     token = session.get("admin_token")
     headers = {"Authorization": f"Bearer {token}"}
-    r = requests.delete(
-        f"http://localhost:8000/admin/companies/{company_id}", headers=headers, timeout=API_TIMEOUT
+    r = api_delete(
+        f"/admin/companies/{company_id}", headers=headers
     )
     flash("Company removed" if r.status_code == 200 else f"Failed: {r.text}", "success" if r.status_code == 200 else "danger")
     return redirect(url_for("admin_dashboard"))
@@ -1071,8 +1136,8 @@ def admin_resource_create():
     token = session.get("admin_token")
     headers = {"Authorization": f"Bearer {token}"}
     payload = {"title": request.form.get("title"), "url": request.form.get("url"), "description": request.form.get("description")}
-    r = requests.post(
-        "http://localhost:8000/admin/resources", json=payload, headers=headers, timeout=API_TIMEOUT
+    r = api_post(
+        "/admin/resources", json=payload, headers=headers
     )
     flash("Resource added" if r.status_code == 200 else f"Failed: {r.text}", "success" if r.status_code == 200 else "danger")
     return redirect(url_for("admin_dashboard"))
@@ -1083,8 +1148,8 @@ def admin_resource_update(rid: int):
     token = session.get("admin_token")
     headers = {"Authorization": f"Bearer {token}"}
     payload = {"title": request.form.get("title"), "url": request.form.get("url"), "description": request.form.get("description")}
-    r = requests.put(
-        f"http://localhost:8000/admin/resources/{rid}", json=payload, headers=headers, timeout=API_TIMEOUT
+    r = api_put(
+        f"/admin/resources/{rid}", json=payload, headers=headers
     )
     flash("Resource updated" if r.status_code == 200 else f"Failed: {r.text}", "success" if r.status_code == 200 else "danger")
     return redirect(url_for("admin_dashboard"))
@@ -1094,8 +1159,8 @@ def admin_resource_update(rid: int):
 def admin_resource_delete(rid: int):
     token = session.get("admin_token")
     headers = {"Authorization": f"Bearer {token}"}
-    r = requests.delete(
-        f"http://localhost:8000/admin/resources/{rid}", headers=headers, timeout=API_TIMEOUT
+    r = api_delete(
+        f"/admin/resources/{rid}", headers=headers
     )
     flash("Resource removed" if r.status_code == 200 else f"Failed: {r.text}", "success" if r.status_code == 200 else "danger")
     return redirect(url_for("admin_dashboard"))
@@ -1106,8 +1171,8 @@ def admin_resume_create():
     token = session.get("admin_token")
     headers = {"Authorization": f"Bearer {token}"}
     payload = {"title": request.form.get("title"), "url": request.form.get("url")}
-    r = requests.post(
-        "http://localhost:8000/admin/resumes", json=payload, headers=headers, timeout=API_TIMEOUT
+    r = api_post(
+        "/admin/resumes", json=payload, headers=headers
     )
     flash("Resume sample added" if r.status_code == 200 else f"Failed: {r.text}", "success" if r.status_code == 200 else "danger")
     return redirect(url_for("admin_dashboard"))
@@ -1118,8 +1183,8 @@ def admin_resume_update(rid: int):
     token = session.get("admin_token")
     headers = {"Authorization": f"Bearer {token}"}
     payload = {"title": request.form.get("title"), "url": request.form.get("url")}
-    r = requests.put(
-        f"http://localhost:8000/admin/resumes/{rid}", json=payload, headers=headers, timeout=API_TIMEOUT
+    r = api_put(
+        f"/admin/resumes/{rid}", json=payload, headers=headers
     )
     flash("Resume template updated" if r.status_code == 200 else f"Failed: {r.text}", "success" if r.status_code == 200 else "danger")
     return redirect(url_for("admin_dashboard"))
@@ -1129,8 +1194,8 @@ def admin_resume_update(rid: int):
 def admin_resume_delete(rid: int):
     token = session.get("admin_token")
     headers = {"Authorization": f"Bearer {token}"}
-    r = requests.delete(
-        f"http://localhost:8000/admin/resumes/{rid}", headers=headers, timeout=API_TIMEOUT
+    r = api_delete(
+        f"/admin/resumes/{rid}", headers=headers
     )
     flash("Resume template removed" if r.status_code == 200 else f"Failed: {r.text}", "success" if r.status_code == 200 else "danger")
     return redirect(url_for("admin_dashboard"))
@@ -1141,8 +1206,8 @@ def admin_announcement_create():
     token = session.get("admin_token")
     headers = {"Authorization": f"Bearer {token}"}
     payload = {"title": request.form.get("title"), "content": request.form.get("content")}
-    r = requests.post(
-        "http://localhost:8000/admin/announcements", json=payload, headers=headers, timeout=API_TIMEOUT
+    r = api_post(
+        "/admin/announcements", json=payload, headers=headers
     )
     flash("Announcement sent" if r.status_code == 200 else f"Failed: {r.text}", "success" if r.status_code == 200 else "danger")
     return redirect(url_for("admin_dashboard"))
@@ -1153,8 +1218,8 @@ def admin_announcement_update(aid: int):
     token = session.get("admin_token")
     headers = {"Authorization": f"Bearer {token}"}
     payload = {"title": request.form.get("title"), "content": request.form.get("content")}
-    r = requests.put(
-        f"http://localhost:8000/admin/announcements/{aid}", json=payload, headers=headers, timeout=API_TIMEOUT
+    r = api_put(
+        f"/admin/announcements/{aid}", json=payload, headers=headers
     )
     flash("Announcement updated" if r.status_code == 200 else f"Failed: {r.text}", "success" if r.status_code == 200 else "danger")
     return redirect(url_for("admin_dashboard"))
@@ -1164,8 +1229,8 @@ def admin_announcement_update(aid: int):
 def admin_announcement_delete(aid: int):
     token = session.get("admin_token")
     headers = {"Authorization": f"Bearer {token}"}
-    r = requests.delete(
-        f"http://localhost:8000/admin/announcements/{aid}", headers=headers, timeout=API_TIMEOUT
+    r = api_delete(
+        f"/admin/announcements/{aid}", headers=headers
     )
     flash("Announcement removed" if r.status_code == 200 else f"Failed: {r.text}", "success" if r.status_code == 200 else "danger")
     return redirect(url_for("admin_dashboard"))
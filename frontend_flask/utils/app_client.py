@@ -1,25 +1,257 @@
 import requests
-from urllib.parse import urljoin
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.util.retry import Retry
+import atexit
+import io
 import os
+import re
+import threading
+import time
 from dotenv import load_dotenv
+try:
+    from .response_cache import response_cache, cache_key
+except ImportError:
+    from frontend_flask.utils.response_cache import response_cache, cache_key
 
 load_dotenv()
 
 API_BASE = os.getenv("API_BASE", "http://localhost:8000/")
 API_TIMEOUT = float(os.getenv("API_TIMEOUT", 6))
+API_POOL_SIZE = int(os.getenv("API_POOL_SIZE", 20))  # keep-alive connections kept per process
+API_RETRIES = int(os.getenv("API_RETRIES", 2))  # GET/HEAD/OPTIONS only, writes are never retried
+API_RETRY_BACKOFF = float(os.getenv("API_RETRY_BACKOFF", 0.2))
+# "http" talks to the API over the network; "inprocess" runs backend_fastapi in this
+# process and dispatches calls to it without a socket (single-box deployments)
+API_TRANSPORT = os.getenv("API_TRANSPORT", "http").lower()
+
+# ---------- Shared HTTP session ----------
+
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+
+
+class InProcessAdapter(BaseAdapter):
+    """Hand requests straight to the FastAPI app loaded in this process.
+
+    The app runs behind starlette's TestClient, entered once so its startup
+    and shutdown handlers run as they would under uvicorn. Responses are
+    buffered whole (a streamed endpoint arrives in one piece) and timeouts
+    do not apply; the browser still needs API_BASE for file downloads.
+    """
+
+    def __init__(self):
+        super().__init__()
+        from fastapi.testclient import TestClient
+        from backend_fastapi.main import app
+        self._client = TestClient(app, raise_server_exceptions=False)
+        self._client.__enter__()
+        # Close before concurrent.futures stops accepting work at exit, so the
+        # app's shutdown handlers can still use to_thread/run_in_executor
+        getattr(threading, "_register_atexit", atexit.register)(self.close)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        body = request.body.encode("utf-8") if isinstance(request.body, str) else request.body
+        r = self._client.request(
+            request.method, request.url, content=body, headers=dict(request.headers), follow_redirects=False
+        )
+        response = requests.Response()
+        response.status_code = r.status_code
+        response.reason = r.reason_phrase
+        response.headers = CaseInsensitiveDict(r.headers.items())
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.raw = io.BytesIO(r.content)
+        response._content = r.content
+        response._content_consumed = True
+        return response
+
+    def close(self):
+        client, self._client = self._client, None
+        if client is not None:
+            client.__exit__(None, None, None)
+
+
+def _build_session(transport: str = API_TRANSPORT) -> requests.Session:
+    if transport == "inprocess":
+        adapter = InProcessAdapter()
+    elif transport == "http":
+        retry = Retry(
+            total=API_RETRIES,
+            backoff_factor=API_RETRY_BACKOFF,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["GET", "HEAD", "OPTIONS"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=API_POOL_SIZE, max_retries=retry)
+    else:
+        raise ValueError(f"Unknown API_TRANSPORT {transport!r} (expected 'http' or 'inprocess')")
+    s = requests.Session()
+    s.mount("http://", adapter)
+    s.mount("https://", adapter)
+    return s
+
+
+def get_session() -> requests.Session:
+    """The process-wide session (rebuilt after a fork so workers never share sockets or app state)."""
+    global _session, _session_pid
+    pid = os.getpid()
+    if _session is None or _session_pid != pid:
+        with _session_lock:
+            if _session is None or _session_pid != pid:
+                _session = _build_session()
+                _session_pid = pid
+    return _session
+
+
+# ---------- Latency histogram per call site ----------
+
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+_metrics = {}
+_metrics_lock = threading.Lock()
+
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def _call_site(method: str, path: str) -> str:
+    path = "/" + path.split("?", 1)[0].lstrip("/")
+    return f"{method} {_ID_SEGMENT.sub('/{id}', path)}"
+
+
+def _record(site: str, elapsed_ms: float, failed: bool):
+    with _metrics_lock:
+        m = _metrics.get(site)
+        if m is None:
+            m = _metrics[site] = {"count": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0,
+                                  "buckets": [0] * (len(LATENCY_BUCKETS_MS) + 1)}
+        m["count"] += 1
+        m["errors"] += failed
+        m["total_ms"] += elapsed_ms
+        m["max_ms"] = max(m["max_ms"], elapsed_ms)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                break
+        else:
+            i = len(LATENCY_BUCKETS_MS)
+        m["buckets"][i] += 1
+
+
+def get_client_metrics() -> dict:
+    """Per call site ("GET /planner/plans/{id}"): count, errors, mean/max latency and bucket counts."""
+    labels = [f"le_{b}ms" for b in LATENCY_BUCKETS_MS] + ["inf"]
+    with _metrics_lock:
+        return {
+            site: {
+                "count": m["count"],
+                "errors": m["errors"],
+                "mean_ms": round(m["total_ms"] / m["count"], 2),
+                "max_ms": round(m["max_ms"], 2),
+                "buckets": dict(zip(labels, m["buckets"])),
+            }
+            for site, m in sorted(_metrics.items())
+        }
+
+
+def reset_client_metrics():
+    with _metrics_lock:
+        _metrics.clear()
+
+
+# ---------- Request helpers ----------
+
+def api_request(method: str, path: str, **kwargs) -> requests.Response:
+    """Send ``method`` to ``path`` (relative to API_BASE) over the shared session.
+
+    Accepts the usual ``requests`` keyword arguments; ``timeout`` defaults to
+    API_TIMEOUT. Connection errors propagate to the caller as before.
+    """
+    method = method.upper()
+    kwargs.setdefault("timeout", API_TIMEOUT)
+    url = API_BASE.rstrip("/") + "/" + path.lstrip("/")
+    site = _call_site(method, path)
+    start = time.perf_counter()
+    try:
+        r = get_session().request(method, url, **kwargs)
+    except Exception:
+        _record(site, (time.perf_counter() - start) * 1000, True)
+        raise
+    _record(site, (time.perf_counter() - start) * 1000, r.status_code >= 500)
+    if "X-Cache-Invalidate" in r.headers:
+        invalidate_cached(*r.headers["X-Cache-Invalidate"].split(","))
+    return r
+
+
+def api_get(path: str, **kwargs) -> requests.Response:
+    return api_request("GET", path, **kwargs)
+
+
+def api_post(path: str, **kwargs) -> requests.Response:
+    return api_request("POST", path, **kwargs)
+
+
+def api_put(path: str, **kwargs) -> requests.Response:
+    return api_request("PUT", path, **kwargs)
+
+
+def api_delete(path: str, **kwargs) -> requests.Response:
+    return api_request("DELETE", path, **kwargs)
+
+
+# ---------- Cached reads ----------
+
+# Section names the API sends in X-Cache-Invalidate after admin changes
+CACHED_SECTIONS = {"companies", "resources", "resumes", "announcements", "drives"}
+
+
+def cached_get_json(path: str, params: dict = None, section: str = ""):
+    """GET ``path`` through the response cache; errors raise and are never cached.
+
+    Returns a fresh copy on every call, so callers may modify it.
+    """
+    def load():
+        r = api_get(path, params=params)
+        r.raise_for_status()
+        return r.json()
+    return response_cache.get_or_load(cache_key(path, params), load, section)
+
+
+def get_cache_stats() -> dict:
+    return response_cache.stats()
+
+
+def invalidate_cached(*sections: str):
+    """Drop cached reads for the named sections (everything when none is given)."""
+    if not sections:
+        response_cache.invalidate()
+    for section in sections:
+        section = section.strip()
+        if section in CACHED_SECTIONS:
+            response_cache.invalidate(section)
+
+
 
 def get_companies():
-    r = requests.get(urljoin(API_BASE, "companies/"), timeout=API_TIMEOUT)
-    r.raise_for_status()
-    return r.json()
+    return cached_get_json("companies/", section="companies")
 
 def get_company(company_id):
-    r = requests.get(urljoin(API_BASE, f"companies/{company_id}"), timeout=API_TIMEOUT)
+    r = api_get(f"companies/{company_id}")
     r.raise_for_status()
     return r.json()
 
 def get_company_experiences(company_id):
-    r = requests.get(urljoin(API_BASE, f"experiences/company/{company_id}"), timeout=API_TIMEOUT)
+    r = api_get(f"experiences/company/{company_id}")
+    r.raise_for_status()
+    return r.json()
+
+def get_experiences():
+    """Approved interview experiences across all companies."""
+    r = api_get("experiences")
     r.raise_for_status()
     return r.json()
 
@@ -27,38 +259,46 @@ def submit_experience(payload, token: str | None = None):
     headers = {}
     if token:
         headers["Authorization"] = f"Bearer {token}"
-    r = requests.post(urljoin(API_BASE, "experiences/submit"), json=payload, headers=headers, timeout=API_TIMEOUT)
+    r = api_post("experiences/submit", json=payload, headers=headers)
     return r
 
 
 def get_resources(token: str | None = None, category: str | None = None):
     """Get public resources (no auth required)."""
-    url = urljoin(API_BASE, "content/resources")
     params = {}
     if category:
         params["category"] = category
-    r = requests.get(url, params=params, timeout=API_TIMEOUT)
-    r.raise_for_status()
-    return r.json()
+    return cached_get_json("content/resources", params, section="resources")
 
 
 def get_resumes(token: str | None = None):
     """Get public resume samples (no auth required)."""
-    r = requests.get(urljoin(API_BASE, "content/resumes"), timeout=API_TIMEOUT)
-    r.raise_for_status()
-    return r.json()
+    return cached_get_json("content/resumes", section="resumes")
 
 
 def get_announcements(token: str | None = None):
     """Get public announcements (no auth required)."""
-    r = requests.get(urljoin(API_BASE, "content/announcements"), timeout=API_TIMEOUT)
+    return cached_get_json("content/announcements", section="announcements")
+
+
+def get_student_profile(token: str):
+    headers = {"Authorization": f"Bearer {token}"}
+    r = api_get("students/me", headers=headers)
     r.raise_for_status()
     return r.json()
 
+# --- Dashboards ---
 
-def get_student_profile(token: str):
+def get_student_dashboard(token):
+    """Whole student dashboard view model in one call (profile, content, drives, analytics...)."""
     headers = {"Authorization": f"Bearer {token}"}
-    r = requests.get(urljoin(API_BASE, "students/me"), headers=headers, timeout=API_TIMEOUT)
+    r = api_get("dashboard/student", headers=headers)
+    r.raise_for_status()
+    return r.json()
+
+def get_admin_dashboard(token):
+    headers = {"Authorization": f"Bearer {token}"}
+    r = api_get("dashboard/admin", headers=headers)
     r.raise_for_status()
     return r.json()
 
@@ -67,7 +307,7 @@ def get_student_profile(token: str):
 def get_admin_analytics(token):
     headers = {"Authorization": f"Bearer {token}"}
     try:
-        r = requests.get(urljoin(API_BASE, "analytics/admin/stats"), headers=headers, timeout=API_TIMEOUT)
+        r = api_get("analytics/admin/stats", headers=headers)
         return r.json() if r.status_code == 200 else {}
     except Exception:
         return {}
@@ -75,7 +315,7 @@ def get_admin_analytics(token):
 def get_student_analytics(token):
     headers = {"Authorization": f"Bearer {token}"}
     try:
-        r = requests.get(urljoin(API_BASE, "analytics/student/stats"), headers=headers, timeout=API_TIMEOUT)
+        r = api_get("analytics/student/stats", headers=headers)
         return r.json() if r.status_code == 200 else {}
     except Exception:
         return {}
@@ -84,27 +324,34 @@ def get_student_analytics(token):
 
 def get_drives():
     try:
-        r = requests.get(urljoin(API_BASE, "drives/"), timeout=API_TIMEOUT)
-        return r.json() if r.status_code == 200 else []
+        return cached_get_json("drives/", section="drives")
     except Exception:
         return []
 
 def create_drive(token, payload):
     headers = {"Authorization": f"Bearer {token}"}
-    return requests.post(urljoin(API_BASE, "drives/"), json=payload, headers=headers, timeout=API_TIMEOUT)
+    return api_post("drives/", json=payload, headers=headers)
 
 def delete_drive(token, drive_id):
     headers = {"Authorization": f"Bearer {token}"}
-    return requests.delete(urljoin(API_BASE, f"drives/{drive_id}"), headers=headers, timeout=API_TIMEOUT)
+    return api_delete(f"drives/{drive_id}", headers=headers)
 
 def apply_for_drive(token, drive_id):
     headers = {"Authorization": f"Bearer {token}"}
-    return requests.post(urljoin(API_BASE, f"drives/{drive_id}/apply"), headers=headers, timeout=API_TIMEOUT)
+    return api_post(f"drives/{drive_id}/apply", headers=headers)
 
 def get_my_applications(token):
     headers = {"Authorization": f"Bearer {token}"}
     try:
-        r = requests.get(urljoin(API_BASE, "drives/my-applications"), headers=headers, timeout=API_TIMEOUT)
+        r = api_get("drives/my-applications", headers=headers)
         return r.json() if r.status_code == 200 else []
     except Exception:
         return []
+
+# --- Admin ---
+
+def get_pending_experiences(token):
+    headers = {"Authorization": f"Bearer {token}"}
+    r = api_get("admin/pending-experiences", headers=headers)
+    r.raise_for_status()
+    return r.json()
@@ -0,0 +1,41 @@
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, wait
+from dotenv import load_dotenv
+
+load_dotenv()
+
+FANOUT_WORKERS = int(os.getenv("FANOUT_WORKERS", 16))
+FANOUT_DEADLINE = float(os.getenv("FANOUT_DEADLINE", os.getenv("API_TIMEOUT", 6)))  # seconds for the whole batch
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(max_workers=FANOUT_WORKERS, thread_name_prefix="api-fanout")
+
+
+def fan_out(calls: dict, deadline: float = FANOUT_DEADLINE):
+    """Run backend calls concurrently and wait at most ``deadline`` seconds in total.
+
+    ``calls`` maps a name to ``(fn, fallback)``; ``fn`` takes no arguments
+    (use a lambda or functools.partial). Returns ``(results, failed)``:
+    ``results[name]`` is the call's return value, or its fallback when it
+    raised or missed the deadline, and ``failed`` is the set of such names.
+    The calls run outside the request context, so read ``session`` before.
+    """
+    futures = {name: _executor.submit(fn) for name, (fn, _) in calls.items()}
+    wait(futures.values(), timeout=deadline)
+    results, failed = {}, set()
+    for name, future in futures.items():
+        fallback = calls[name][1]
+        if not future.done():
+            future.cancel()  # a call already running finishes on its own timeout
+            logger.warning("Backend call %s missed the %.1fs deadline", name, deadline)
+            results[name] = fallback
+            failed.add(name)
+        elif future.exception() is not None:
+            logger.warning("Backend call %s failed: %s", name, future.exception())
+            results[name] = fallback
+            failed.add(name)
+        else:
+            results[name] = future.result()
+    return results, failed
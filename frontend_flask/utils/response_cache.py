@@ -0,0 +1,214 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# With several Flask workers use "redis": invalidation after an admin change then
+# reaches every worker at once. With "local" only the worker that made the change
+# drops its copy, and the others serve the old one for up to TTL + STALE_TTL seconds.
+API_CACHE_BACKEND = os.getenv("API_CACHE_BACKEND", "local").lower()  # "local", "redis" or "off"
+API_CACHE_REDIS_URL = os.getenv("API_CACHE_REDIS_URL", "redis://localhost:6379/0")
+API_CACHE_TTL = float(os.getenv("API_CACHE_TTL", 30))  # seconds a cached response is fresh
+API_CACHE_STALE_TTL = float(os.getenv("API_CACHE_STALE_TTL", 30))  # further seconds it is served while refreshing
+API_CACHE_SIZE = int(os.getenv("API_CACHE_SIZE", 256))  # entries per process (local backend)
+
+logger = logging.getLogger(__name__)
+
+ALL_SECTIONS = "*"  # generation bumped by invalidate() without a section
+
+
+def cache_key(path: str, params: dict = None) -> str:
+    """Key for a GET of ``path``; params are sorted so their order does not matter."""
+    key = "GET " + path.lstrip("/")
+    params = {k: v for k, v in (params or {}).items() if v is not None}
+    if params:
+        key += "?" + urlencode(sorted(params.items()))
+    return key
+
+
+class LocalBackend:
+    """Per-process LRU dict; every worker keeps its own copy (and its own generations).
+
+    Values are kept as JSON like in Redis, so every caller gets its own copy.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            self._data.move_to_end(key)
+        raw, stored_at = entry
+        return json.loads(raw), stored_at
+
+    def set(self, key, value, stored_at: float, ttl: float):
+        raw = json.dumps(value)
+        with self._lock:
+            self._data[key] = (raw, stored_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def generations(self, names):
+        with self._lock:
+            return [self._generations.get(name, 0) for name in names]
+
+    def bump(self, name: str):
+        with self._lock:
+            self._generations[name] = self._generations.get(name, 0) + 1
+
+
+class RedisBackend:
+    """Shared by every worker and host pointing at the same Redis; values are JSON.
+
+    Needs the optional ``redis`` package. A Redis outage is logged and
+    treated as a cache miss, so pages keep working against the API.
+    """
+
+    NAMESPACE = "campus-connect:api-cache:"
+
+    def __init__(self, url: str):
+        import redis
+        self._redis = redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+
+    def get(self, key):
+        try:
+            raw = self._redis.get(self.NAMESPACE + key)
+        except Exception as e:
+            logger.warning("Response cache read failed: %s", e)
+            return None
+        if raw is None:
+            return None
+        entry = json.loads(raw)
+        return entry["v"], entry["t"]
+
+    def set(self, key, value, stored_at: float, ttl: float):
+        try:
+            self._redis.setex(self.NAMESPACE + key, int(ttl) + 1, json.dumps({"v": value, "t": stored_at}))
+        except Exception as e:
+            logger.warning("Response cache write failed: %s", e)
+
+    def generations(self, names):
+        """Current generations, or None when Redis is unreachable (the caller skips the cache)."""
+        try:
+            raw = self._redis.mget([self.NAMESPACE + "gen:" + name for name in names])
+        except Exception as e:
+            logger.warning("Response cache read failed: %s", e)
+            return None
+        return [int(value or 0) for value in raw]
+
+    def bump(self, name: str):
+        try:
+            self._redis.incr(self.NAMESPACE + "gen:" + name)
+        except Exception as e:
+            logger.warning("Response cache invalidation failed: %s", e)
+
+
+class ResponseCache:
+    """TTL cache with stale-while-revalidate for backend GETs.
+
+    Within ``ttl`` seconds an entry is served as is. For ``stale_ttl`` more
+    seconds it is still served, while one background refresh per key fetches
+    a new copy, so a page never waits on an expired entry it already has.
+    Only when an entry is missing or older than both is the loader called
+    inline.
+
+    Entries belong to a section, and the section's generation (plus a global
+    one) is part of their key: invalidating bumps the generation, so every
+    worker sharing the backend moves to new keys and old entries age out.
+    Returned values are copies; changing them does not change the cache.
+    """
+
+    def __init__(self, backend, ttl: float, stale_ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="api-cache-refresh")
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "refresh_errors": 0}
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+    def get_or_load(self, key: str, loader, section: str = ""):
+        """Cached value for ``key`` in ``section``; ``loader()`` fetches it (and may raise, which is not cached)."""
+        if self.backend is None:
+            return loader()
+        generations = self.backend.generations([ALL_SECTIONS, section])
+        if generations is None:
+            return loader()
+        key = "{}.{}:{}:{}".format(*generations, section, key)
+        entry = self.backend.get(key)
+        if entry is not None:
+            value, stored_at = entry
+            age = time.time() - stored_at
+            if age < self.ttl:
+                self._count("hits")
+                return value
+            if age < self.ttl + self.stale_ttl:
+                self._count("stale_hits")
+                self._refresh_in_background(key, loader)
+                return value
+        self._count("misses")
+        return self._load(key, loader)
+
+    def _load(self, key: str, loader):
+        # A load that overlaps an invalidation stores under the old generation, where nobody reads it
+        value = loader()
+        self.backend.set(key, value, time.time(), self.ttl + self.stale_ttl)
+        return value
+
+    def _refresh_in_background(self, key: str, loader):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        self._executor.submit(self._refresh, key, loader)
+
+    def _refresh(self, key: str, loader):
+        try:
+            self._load(key, loader)
+        except Exception as e:
+            self._count("refresh_errors")
+            logger.warning("Background refresh of %s failed: %s", key, e)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def invalidate(self, section: str = None):
+        """Make one section's entries stale (every section's by default)."""
+        if self.backend is None:
+            return
+        self.backend.bump(ALL_SECTIONS if section is None else section)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"backend": API_CACHE_BACKEND, **self._stats}
+
+
+def _make_backend():
+    if API_CACHE_BACKEND == "off":
+        return None
+    if API_CACHE_BACKEND == "redis":
+        return RedisBackend(API_CACHE_REDIS_URL)
+    if API_CACHE_BACKEND == "local":
+        return LocalBackend(API_CACHE_SIZE)
+    raise ValueError(f"Unknown API_CACHE_BACKEND {API_CACHE_BACKEND!r} (expected 'local', 'redis' or 'off')")
+
+
+response_cache = ResponseCache(_make_backend(), API_CACHE_TTL, API_CACHE_STALE_TTL)
@@ -11,8 +11,17 @@ CREATE TABLE file_storage (
   mime_type VARCHAR(100) NOT NULL,
   entity_type VARCHAR(50) NOT NULL,
   entity_id INT,
+  content_hash CHAR(64), -- sha256 of the shared blob in storage_blobs
   created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-  updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+  updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  KEY ix_file_storage_content_hash (content_hash)
+);
+
+CREATE TABLE storage_blobs (
+  content_hash CHAR(64) PRIMARY KEY,
+  size INT NOT NULL,
+  ref_count INT NOT NULL DEFAULT 0, -- file_storage rows using the blob
+  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
 CREATE TABLE companies (
@@ -69,9 +78,35 @@ CREATE TABLE interview_experiences (
   questions_faced VARCHAR(2000),
   tips VARCHAR(1000),
   status VARCHAR(50) DEFAULT 'pending',
+  KEY ix_interview_experiences_status_company (status, company_id),
   FOREIGN KEY (company_id) REFERENCES companies(id) ON DELETE CASCADE
 );
 
+CREATE TABLE placement_drives (
+  id INT AUTO_INCREMENT PRIMARY KEY,
+  company_id INT NOT NULL,
+  batch INT NOT NULL,
+  role VARCHAR(255) NOT NULL,
+  description TEXT,
+  date DATETIME NOT NULL,
+  deadline DATETIME NOT NULL,
+  eligibility_criteria TEXT,
+  status VARCHAR(50) DEFAULT 'open',
+  created_at DATETIME,
+  KEY ix_placement_drives_status_deadline (status, deadline),
+  FOREIGN KEY (company_id) REFERENCES companies(id) ON DELETE CASCADE
+);
+
+CREATE TABLE student_applications (
+  id INT AUTO_INCREMENT PRIMARY KEY,
+  student_id INT NOT NULL,
+  drive_id INT NOT NULL,
+  applied_at DATETIME,
+  status VARCHAR(50) DEFAULT 'applied',
+  UNIQUE KEY uq_student_applications_student_drive (student_id, drive_id),
+  FOREIGN KEY (drive_id) REFERENCES placement_drives(id) ON DELETE CASCADE
+);
+
 CREATE TABLE admins (
   id INT AUTO_INCREMENT PRIMARY KEY,
   username VARCHAR(255) NOT NULL UNIQUE,
@@ -112,6 +147,7 @@ CREATE TABLE study_plans (
   title VARCHAR(200) NOT NULL,
   description TEXT,
   duration_days INT NOT NULL,
+  status VARCHAR(20) NOT NULL DEFAULT 'ready', -- 'generating' while a stream is still writing its tasks
   created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
@@ -132,10 +168,52 @@ CREATE TABLE student_subscriptions (
   start_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
   is_active BOOLEAN DEFAULT TRUE,
   current_day INT DEFAULT 1,
-  completed_tasks TEXT, -- JSON array of task IDs
+  completed_tasks TEXT, -- legacy JSON array of task IDs, see subscription_task_completion
+  KEY ix_student_subscriptions_student_active (student_id, is_active),
+  FOREIGN KEY (plan_id) REFERENCES study_plans(id) ON DELETE CASCADE
+);
+
+CREATE TABLE subscription_task_completion (
+  id INT AUTO_INCREMENT PRIMARY KEY,
+  subscription_id INT NOT NULL,
+  task_id INT NOT NULL,
+  completed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  UNIQUE KEY uq_subscription_task_completion_subscription_task (subscription_id, task_id),
+  FOREIGN KEY (subscription_id) REFERENCES student_subscriptions(id) ON DELETE CASCADE,
+  FOREIGN KEY (task_id) REFERENCES daily_tasks(id) ON DELETE CASCADE
+);
+
+CREATE TABLE plan_generation_jobs (
+  id INT AUTO_INCREMENT PRIMARY KEY,
+  student_id INT NOT NULL,
+  topic VARCHAR(200) NOT NULL,
+  duration INT NOT NULL,
+  difficulty VARCHAR(50) NOT NULL,
+  cache_key CHAR(64),
+  status VARCHAR(20) NOT NULL DEFAULT 'queued', -- queued, running, succeeded, failed
+  plan_id INT,
+  error TEXT,
+  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  started_at DATETIME,
+  finished_at DATETIME,
+  KEY ix_plan_generation_jobs_status_created (status, created_at),
+  KEY ix_plan_generation_jobs_cache_key_status (cache_key, status),
+  FOREIGN KEY (plan_id) REFERENCES study_plans(id) ON DELETE SET NULL
+);
+
+CREATE TABLE plan_cache (
+  id INT AUTO_INCREMENT PRIMARY KEY,
+  cache_key CHAR(64) NOT NULL UNIQUE,
+  plan_id INT NOT NULL,
+  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
   FOREIGN KEY (plan_id) REFERENCES study_plans(id) ON DELETE CASCADE
 );
 
+CREATE TABLE cache_generations (
+  name VARCHAR(50) PRIMARY KEY, -- /dashboard section
+  generation INT NOT NULL DEFAULT 0 -- bumped by admin changes; part of the section's cache key
+);
+
 CREATE TABLE questions (
   id INT AUTO_INCREMENT PRIMARY KEY,
   title VARCHAR(200) NOT NULL,
@@ -160,6 +238,7 @@ CREATE TABLE user_progress (
   user_notes TEXT,
   is_bookmarked BOOLEAN DEFAULT FALSE,
   updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  UNIQUE KEY uq_user_progress_student_question (student_id, question_id),
   FOREIGN KEY (question_id) REFERENCES questions(id) ON DELETE CASCADE
 );
 
@@ -170,7 +249,8 @@ CREATE TABLE forum_threads (
   content TEXT NOT NULL,
   tags VARCHAR(200),
   views INT DEFAULT 0,
-  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  KEY ix_forum_threads_created_at (created_at)
 );
 
 CREATE TABLE forum_replies (
@@ -180,6 +260,7 @@ CREATE TABLE forum_replies (
   admin_id INT, -- Null if student
   content TEXT NOT NULL,
   created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  KEY ix_forum_replies_thread_id (thread_id),
   FOREIGN KEY (thread_id) REFERENCES forum_threads(id) ON DELETE CASCADE
 );
 
@@ -189,7 +270,8 @@ CREATE TABLE bookmarks (
   entity_type VARCHAR(50) NOT NULL, -- 'interview_experience', 'question', 'resource'
   entity_id INT NOT NULL,
   note TEXT,
-  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  UNIQUE KEY uq_bookmarks_user_entity (user_id, entity_type, entity_id)
 );
 
 -- Note: 'students' table is referenced but not explicitly created in the initial dump.